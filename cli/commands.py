@@ -10,6 +10,7 @@ Usage:
     python -m cli.commands scrape --league PGA --type tournaments --year 2025
     python -m cli.commands enrich-bios --limit 100
     python -m cli.commands init-db
+    python -m cli.commands migrate
 
 For Junior Developers:
 ---------------------
@@ -192,6 +193,11 @@ def init_db():
         db.create_all_tables()
         click.echo("  Tables created!")
 
+        # create_all() only creates missing tables - columns added to
+        # existing ones since come from the migrations
+        from run_migration import run_migration
+        run_migration()
+
         click.echo("  Seeding leagues...")
         db.seed_leagues()
         click.echo("  Leagues seeded!")
@@ -203,6 +209,23 @@ def init_db():
         raise click.ClickException(str(e))
 
 
+@cli.command('migrate')
+def migrate():
+    """
+    Apply pending database migrations (see run_migration.py).
+
+    Run this before scraping an existing database: new model columns
+    (like players.name_key) aren't added by init-db's create_all().
+    """
+    try:
+        from run_migration import run_migration
+        run_migration()
+
+    except Exception as e:
+        logger.error(f"Migration failed: {str(e)}")
+        raise click.ClickException(str(e))
+
+
 @cli.command('test-db')
 def test_db():
     """
@@ -255,7 +278,8 @@ def run_web(host: str, port: int, debug: bool):
 @click.option('--year', default=None, type=int, help='Year for tournament data')
 @click.option('--include-college', is_flag=True, help='Include NCAA college golf')
 @click.option('--include-amateur', is_flag=True, help='Include amateur golf (AJGA)')
-def scrape_all(year: int, include_college: bool, include_amateur: bool):
+@click.option('--no-bio-cache', is_flag=True, help='Ask every bio source again instead of reusing earlier answers')
+def scrape_all(year: int, include_college: bool, include_amateur: bool, no_bio_cache: bool):
     """
     Scrape all configured leagues (PGA, Korn Ferry, Champions, LPGA).
 
@@ -449,7 +473,7 @@ def scrape_all(year: int, include_college: bool, include_amateur: bool):
     try:
         from scrapers.bio.multi_source_enricher import MultiSourceBioEnricher
         enricher = MultiSourceBioEnricher()
-        bio_result = enricher.run(limit=500, force=False)  # Increased from 100 to cover more players
+        bio_result = enricher.run(limit=500, force=False, use_cache=not no_bio_cache)  # Increased from 100 to cover more players
         click.echo(f"  Enriched: {bio_result.get('enriched', 0)} players")
         click.echo(f"  Sources: DuckDuckGo={bio_result.get('sources_used', {}).get('duckduckgo', 0)}, "
                    f"Wikipedia={bio_result.get('sources_used', {}).get('wikipedia', 0)}, "
@@ -138,6 +138,53 @@ class Config:
     # Maximum retries for failed requests
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
 
+    # How many error messages a scraper keeps per run (oldest are dropped)
+    MAX_ERROR_BUFFER = int(os.getenv('MAX_ERROR_BUFFER', '256'))
+
+    # Maximum concurrent requests when a scraper fetches a batch of pages
+    # Requests to the same host are still spaced out by SCRAPE_DELAY_SECONDS
+    SCRAPE_MAX_WORKERS = int(os.getenv('SCRAPE_MAX_WORKERS', '8'))
+
+    # HTTP client library: 'requests' (default) or 'httpx' for HTTP/2
+    # httpx is optional - install with: pip install 'httpx[http2]'
+    HTTP_BACKEND = os.getenv('HTTP_BACKEND', 'requests').lower()
+
+    # HTTP connection pooling
+    # HTTP_POOL_CONNECTIONS is how many hosts keep a pool of open connections;
+    # HTTP_POOL_SIZE is how many connections are kept open per host.
+    # Enrichers rotate between many hosts (Wikipedia, ESPN, DuckDuckGo, college
+    # sites), so these are sized well above the urllib3 defaults of 10.
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '32'))
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '64'))
+
+    # Conditional-GET cache (ETag / Last-Modified)
+    # Bodies are stored on disk so unchanged pages come back as a cheap
+    # 304 Not Modified on the next run instead of a full download.
+    HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+    HTTP_CACHE_PATH = os.getenv(
+        'HTTP_CACHE_PATH',
+        str(PROJECT_ROOT / '.cache' / 'http_cache.sqlite')
+    )
+
+    # Bio enrichers reuse cached pages younger than this without any request.
+    # Rosters and search results barely change week to week; set to 0 to
+    # always revalidate.
+    BIO_CACHE_MAX_AGE_DAYS = int(os.getenv('BIO_CACHE_MAX_AGE_DAYS', '7'))
+
+    # A bio source that had nothing for a player is asked again after this
+    # many hours (found bios are kept for BIO_CACHE_MAX_AGE_DAYS)
+    BIO_NEGATIVE_CACHE_HOURS = int(os.getenv('BIO_NEGATIVE_CACHE_HOURS', '24'))
+
+    # Cache entries older than this are deleted when the cache is opened.
+    # Keep it at least as long as the longest max age in use (Champions
+    # leaderboards are reused for 30 days); set to 0 to never prune.
+    HTTP_CACHE_PRUNE_DAYS = int(os.getenv('HTTP_CACHE_PRUNE_DAYS', '30'))
+
+    # Players the bio search enrichers look up at once. Each source
+    # host still gets its own request spacing, so extra workers mostly
+    # overlap waits on different sites rather than hitting one site harder.
+    BIO_SEARCH_WORKERS = int(os.getenv('BIO_SEARCH_WORKERS', '4'))
+
     # ==========================================================================
     # Notification Configuration
     # ==========================================================================
@@ -0,0 +1,24 @@
+-- ==============================================================================
+-- Golf Tracker Database - Add Player Name Key
+-- ==============================================================================
+-- This migration adds players.name_key, the lowercased "first|last" name
+-- used for exact, indexed name matching (see Player.make_name_key).
+--
+-- PostgreSQL syntax for Render deployment.
+--
+-- To run this migration:
+--   psql $DATABASE_URL -f 003_add_player_name_key.sql
+-- ==============================================================================
+
+-- Add the lookup column
+ALTER TABLE players
+ADD COLUMN IF NOT EXISTS name_key VARCHAR(201);
+
+-- Fill it in for existing players (new and renamed players are kept up to
+-- date by the Player model)
+UPDATE players
+SET name_key = LOWER(first_name) || '|' || LOWER(last_name)
+WHERE name_key IS NULL;
+
+-- Create index for efficient lookups
+CREATE INDEX IF NOT EXISTS ix_players_name_key ON players(name_key);
@@ -40,7 +40,7 @@ from sqlalchemy import (
     Column, Integer, String, Text, Boolean, Date, DateTime,
     Numeric, Enum, ForeignKey, Index, JSON, UniqueConstraint
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, relationship, validates
 from sqlalchemy.ext.hybrid import hybrid_property
 
 # ==============================================================================
@@ -142,6 +142,10 @@ class Player(Base):
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False, index=True)
 
+    # Lowercased "first|last" for exact name matching, kept up to date by
+    # _sync_name_key() below (see make_name_key)
+    name_key = Column(String(201), index=True)
+
     # Birth information
     birth_date = Column(Date)
     age = Column(Integer)
@@ -212,6 +216,29 @@ class Player(Base):
         Index('idx_college', 'college_name'),
     )
 
+    @staticmethod
+    def make_name_key(first_name: Optional[str], last_name: Optional[str]) -> str:
+        """
+        Build the name_key value for a first and last name.
+
+        For Junior Developers:
+        ---------------------
+        Matching "Scottie Scheffler" against "scottie scheffler" normally
+        means calling lower() on both sides for every comparison. Storing
+        the lowercased name once, in an indexed column, turns that into a
+        plain equality lookup.
+        """
+        return f"{(first_name or '').lower()}|{(last_name or '').lower()}"
+
+    @validates('first_name', 'last_name')
+    def _sync_name_key(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Recompute name_key whenever first_name or last_name is assigned."""
+        if key == 'first_name':
+            self.name_key = self.make_name_key(value, self.last_name)
+        else:
+            self.name_key = self.make_name_key(self.first_name, value)
+        return value
+
     @hybrid_property
     def full_name(self) -> str:
         """
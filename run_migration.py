@@ -20,7 +20,7 @@ from database.connection import DatabaseManager
 
 
 def run_migration():
-    """Add missing tour-specific ID columns to players and tournaments tables."""
+    """Add missing columns (tour-specific IDs, name_key) to players and tournaments tables."""
 
     db = DatabaseManager()
 
@@ -46,6 +46,11 @@ def run_migration():
         "CREATE INDEX IF NOT EXISTS idx_champions_tournament_id ON tournaments(champions_tournament_id)",
         "CREATE INDEX IF NOT EXISTS idx_lpga_tournament_id ON tournaments(lpga_tournament_id)",
         "CREATE INDEX IF NOT EXISTS idx_dpworld_tournament_id ON tournaments(dpworld_tournament_id)",
+
+        # Lowercased name lookup key (kept up to date by the Player model)
+        "ALTER TABLE players ADD COLUMN IF NOT EXISTS name_key VARCHAR(201)",
+        "UPDATE players SET name_key = LOWER(first_name) || '|' || LOWER(last_name) WHERE name_key IS NULL",
+        "CREATE INDEX IF NOT EXISTS ix_players_name_key ON players(name_key)",
     ]
 
     print("Running database migrations...")
@@ -71,6 +71,11 @@ def run_migrations():
         # Bio source tracking columns
         "ALTER TABLE players ADD COLUMN IF NOT EXISTS bio_source_url VARCHAR(500)",
         "ALTER TABLE players ADD COLUMN IF NOT EXISTS bio_source_name VARCHAR(50)",
+
+        # Lowercased name lookup key (kept up to date by the Player model)
+        "ALTER TABLE players ADD COLUMN IF NOT EXISTS name_key VARCHAR(201)",
+        "UPDATE players SET name_key = LOWER(first_name) || '|' || LOWER(last_name) WHERE name_key IS NULL",
+        "CREATE INDEX IF NOT EXISTS ix_players_name_key ON players(name_key)",
     ]
 
     print("Checking database schema...")
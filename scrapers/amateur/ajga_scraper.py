@@ -24,15 +24,25 @@ to professional tours, but with additional fields like:
 - Age category
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime, date
+from itertools import chain
 import re
 from loguru import logger
 from bs4 import BeautifulSoup
+from sqlalchemy import insert
 
 from scrapers.base_scraper import BaseScraper
 from database.models import Player, Tournament, TournamentResult, League
 
+# Class / href patterns for the schedule and results markup
+EVENT_CLASS_RE = re.compile(r'event|tournament|schedule', re.IGNORECASE)
+TOURNAMENT_LINK_HREF_RE = re.compile(r'/tournaments?/|leaderboard|results')
+NAME_CLASS_RE = re.compile(r'title|name', re.IGNORECASE)
+DATE_CLASS_RE = re.compile(r'date', re.IGNORECASE)
+LOCATION_CLASS_RE = re.compile(r'location|venue|course', re.IGNORECASE)
+RESULTS_TABLE_CLASS_RE = re.compile(r'leaderboard|results|scores', re.IGNORECASE)
+
 
 class AJGATournamentScraper(BaseScraper):
     """
@@ -74,21 +84,10 @@ class AJGATournamentScraper(BaseScraper):
         year = year or datetime.now().year
         self.logger.info(f'Starting AJGA tournament scrape for {year}')
 
-        # Fetch tournaments from schedule page
-        tournaments = self._fetch_schedule(year)
-
-        if not tournaments:
-            self.logger.warning('No AJGA tournaments found')
-            return {
-                'status': 'partial',
-                'message': 'Could not fetch AJGA tournaments',
-                'records_processed': 0,
-                'records_created': 0,
-                'records_updated': 0,
-                'errors': self._stats['errors']
-            }
-
-        for t in tournaments:
+        # Stream tournaments from the schedule pages as they are parsed
+        found = 0
+        for t in self._fetch_schedule(year):
+            found += 1
             try:
                 tournament_id = self._process_tournament(t, year)
                 self._stats['records_processed'] += 1
@@ -101,67 +100,75 @@ class AJGATournamentScraper(BaseScraper):
                 self.logger.error(f"Error processing tournament {t.get('name', 'unknown')}: {e}")
                 self._stats['errors'].append(str(e))
 
+        if not found:
+            self.logger.warning('No AJGA tournaments found')
+            return {
+                'status': 'partial',
+                'message': 'Could not fetch AJGA tournaments',
+                'records_processed': 0,
+                'records_created': 0,
+                'records_updated': 0,
+                'errors': list(self._stats['errors'])
+            }
+
         return {
             'status': 'success' if not self._stats['errors'] else 'partial',
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
-    def _fetch_schedule(self, year: int) -> List[Dict]:
+    def _fetch_schedule(self, year: int) -> Iterator[Dict]:
         """
         Fetch AJGA tournament schedule.
 
-        Returns:
-            List of tournament dictionaries
+        Tournaments from the AJGA schedule and BlueGolf are streamed in a
+        single pass and deduplicated by name as they are produced.
+
+        Yields:
+            Tournament dictionaries
         """
         self.logger.info(f'Fetching AJGA schedule for {year}')
-        tournaments = []
+        seen = set()
 
-        # Try the main schedule page
+        for t in chain(self._iter_schedule_page(year), self._iter_bluegolf_schedule(year)):
+            name = t.get('name', '')
+            if name and name not in seen:
+                seen.add(name)
+                yield t
+
+        self.logger.info(f'Found {len(seen)} AJGA tournaments')
+
+    def _iter_schedule_page(self, year: int) -> Iterator[Dict]:
+        """Fetch and parse the main AJGA schedule page."""
         schedule_url = f'{self.schedule_url}/{year}' if year != datetime.now().year else self.schedule_url
         soup = self.get_page(schedule_url)
-
         if soup:
-            tournaments.extend(self._parse_schedule_page(soup, year))
+            yield from self._parse_schedule_page(soup, year)
 
-        # Also try BlueGolf for additional events
+    def _iter_bluegolf_schedule(self, year: int) -> Iterator[Dict]:
+        """Fetch and parse BlueGolf for additional events."""
         bluegolf_soup = self.get_page(f'{self.bluegolf_url}/index.htm')
         if bluegolf_soup:
-            tournaments.extend(self._parse_bluegolf_schedule(bluegolf_soup, year))
-
-        # Deduplicate by name
-        seen = set()
-        unique_tournaments = []
-        for t in tournaments:
-            name = t.get('name', '')
-            if name and name not in seen:
-                seen.add(name)
-                unique_tournaments.append(t)
+            yield from self._parse_bluegolf_schedule(bluegolf_soup, year)
 
-        self.logger.info(f'Found {len(unique_tournaments)} AJGA tournaments')
-        return unique_tournaments
-
-    def _parse_schedule_page(self, soup: BeautifulSoup, year: int) -> List[Dict]:
+    def _parse_schedule_page(self, soup: BeautifulSoup, year: int) -> Iterator[Dict]:
         """Parse the AJGA schedule page."""
-        tournaments = []
-
         # Look for tournament entries
         # AJGA typically lists tournaments in cards or list items
-        event_elements = soup.find_all(['div', 'article', 'li'],
-            class_=re.compile(r'event|tournament|schedule', re.I))
+        event_elements = soup.find_all(['div', 'article', 'li'], class_=EVENT_CLASS_RE)
 
         for elem in event_elements:
             try:
                 tournament = self._parse_tournament_element(elem)
                 if tournament:
-                    tournaments.append(tournament)
+                    yield tournament
             except Exception as e:
                 self.logger.debug(f"Error parsing tournament element: {e}")
 
         # Also look for links to tournament pages
-        links = soup.find_all('a', href=re.compile(r'/tournaments?/|leaderboard|results'))
+        links = soup.find_all('a', href=TOURNAMENT_LINK_HREF_RE)
         for link in links:
             href = link.get('href', '')
             name = link.get_text(strip=True)
@@ -173,14 +180,10 @@ class AJGATournamentScraper(BaseScraper):
                     'results_url': self._normalize_url(href),
                     'status': 'scheduled',
                 }
-                tournaments.append(tournament)
-
-        return tournaments
+                yield tournament
 
-    def _parse_bluegolf_schedule(self, soup: BeautifulSoup, year: int) -> List[Dict]:
+    def _parse_bluegolf_schedule(self, soup: BeautifulSoup, year: int) -> Iterator[Dict]:
         """Parse BlueGolf schedule page for AJGA events."""
-        tournaments = []
-
         # BlueGolf uses tables for tournament listings
         tables = soup.find_all('table')
         for table in tables:
@@ -203,20 +206,17 @@ class AJGATournamentScraper(BaseScraper):
                                 if start_date:
                                     break
 
-                            tournaments.append({
+                            yield {
                                 'name': name,
                                 'results_url': self._normalize_url(href),
                                 'start_date': start_date,
                                 'status': 'scheduled',
-                            })
-
-        return tournaments
+                            }
 
     def _parse_tournament_element(self, elem) -> Optional[Dict]:
         """Parse a single tournament element from HTML."""
         # Try to find name
-        name_elem = elem.find(['h3', 'h4', 'h5', 'a', 'span'],
-            class_=re.compile(r'title|name', re.I))
+        name_elem = elem.find(['h3', 'h4', 'h5', 'a', 'span'], class_=NAME_CLASS_RE)
         if not name_elem:
             name_elem = elem.find('a')
 
@@ -228,15 +228,13 @@ class AJGATournamentScraper(BaseScraper):
             return None
 
         # Try to find date
-        date_elem = elem.find(['span', 'div', 'time'],
-            class_=re.compile(r'date', re.I))
+        date_elem = elem.find(['span', 'div', 'time'], class_=DATE_CLASS_RE)
         start_date = None
         if date_elem:
             start_date = self._parse_date_text(date_elem.get_text(strip=True))
 
         # Try to find location
-        location_elem = elem.find(['span', 'div'],
-            class_=re.compile(r'location|venue|course', re.I))
+        location_elem = elem.find(['span', 'div'], class_=LOCATION_CLASS_RE)
         location = location_elem.get_text(strip=True) if location_elem else None
 
         # Try to find results URL
@@ -363,6 +361,13 @@ class AJGATournamentScraper(BaseScraper):
             return
 
         tournament_name = data.get('name', 'Unknown')
+
+        # Events that haven't started can't have results - skip the fetch
+        start_date = data.get('start_date')
+        if start_date and start_date > date.today():
+            self.logger.debug(f'Skipping results for {tournament_name}: starts {start_date}')
+            return
+
         self.logger.info(f'Fetching results for {tournament_name}')
 
         soup = self.get_page(results_url)
@@ -384,12 +389,79 @@ class AJGATournamentScraper(BaseScraper):
             if not tournament:
                 return
 
-            for result in results:
+            # Split every name once, then resolve all players in bulk
+            names = [self._split_name(r.get('player_name', '')) for r in results]
+            players_by_name = self._get_or_create_players(session, names)
+
+            for result, name in zip(results, names):
                 try:
-                    self._save_player_result(session, tournament, result)
+                    player = players_by_name.get(name)
+                    if player:
+                        self._save_player_result(session, tournament, player, result)
                 except Exception as e:
                     self.logger.error(f"Error saving result: {e}")
 
+    def _split_name(self, player_name: str) -> Tuple[str, str]:
+        """Split a display name into (first_name, last_name)."""
+        name_parts = player_name.strip().split(' ', 1)
+        first_name = name_parts[0] if name_parts else ''
+        last_name = name_parts[1] if len(name_parts) > 1 else ''
+        return first_name, last_name
+
+    def _get_or_create_players(
+        self,
+        session,
+        names: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Player]:
+        """
+        Resolve (first_name, last_name) pairs to Player rows in bulk.
+
+        Existing players are loaded with a single IN query, and all missing
+        players are created with a single multi-row INSERT instead of one
+        INSERT + flush per new player.
+
+        Returns:
+            Dictionary mapping (first_name, last_name) to Player
+        """
+        wanted = {name for name in names if name[0] and name[1]}
+        if not wanted:
+            return {}
+
+        by_name: Dict[Tuple[str, str], Player] = {}
+        last_names = {last for _, last in wanted}
+        for player in session.query(Player).filter(Player.last_name.in_(last_names)):
+            key = (player.first_name, player.last_name)
+            if key in wanted and key not in by_name:
+                by_name[key] = player
+
+        new_rows = [
+            # Bulk inserts skip the ORM validators, so set name_key here
+            {'first_name': first, 'last_name': last, 'name_key': Player.make_name_key(first, last)}
+            for first, last in sorted(wanted - by_name.keys())
+        ]
+        if not new_rows:
+            return by_name
+
+        if session.get_bind().dialect.insert_executemany_returning:
+            # One round-trip: INSERT ... VALUES (...), (...) RETURNING ...
+            created = session.scalars(insert(Player).returning(Player), new_rows).all()
+        else:
+            # MySQL has no RETURNING - executemany, then read the new rows back
+            session.execute(insert(Player), new_rows)
+            new_last_names = {row['last_name'] for row in new_rows}
+            created = [
+                player for player in session.query(Player).filter(
+                    Player.last_name.in_(new_last_names)
+                )
+                if (player.first_name, player.last_name) not in by_name
+            ]
+
+        for player in created:
+            by_name.setdefault((player.first_name, player.last_name), player)
+
+        self.logger.debug(f'Created {len(new_rows)} new players')
+        return by_name
+
     def _parse_results_page(self, soup: BeautifulSoup) -> List[Dict]:
         """
         Parse player results from an AJGA results page.
@@ -400,7 +472,7 @@ class AJGATournamentScraper(BaseScraper):
         results = []
 
         # Look for leaderboard tables
-        tables = soup.find_all('table', class_=re.compile(r'leaderboard|results|scores', re.I))
+        tables = soup.find_all('table', class_=RESULTS_TABLE_CLASS_RE)
         if not tables:
             tables = soup.find_all('table')
 
@@ -508,7 +580,7 @@ class AJGATournamentScraper(BaseScraper):
         except ValueError:
             return None
 
-    def _save_player_result(self, session, tournament: Tournament, result: Dict):
+    def _save_player_result(self, session, tournament: Tournament, player: Player, result: Dict):
         """
         Save a single player's result.
 
@@ -517,31 +589,6 @@ class AJGATournamentScraper(BaseScraper):
         - Hometown (city, state)
         - Class year / graduation year
         """
-        player_name = result.get('player_name', '').strip()
-        if not player_name:
-            return
-
-        # Parse name
-        name_parts = player_name.split(' ', 1)
-        first_name = name_parts[0] if name_parts else ''
-        last_name = name_parts[1] if len(name_parts) > 1 else ''
-
-        # Find or create player
-        player = session.query(Player).filter_by(
-            first_name=first_name,
-            last_name=last_name
-        ).first()
-
-        if not player:
-            if not first_name or not last_name:
-                return
-            player = Player(
-                first_name=first_name,
-                last_name=last_name,
-            )
-            session.add(player)
-            session.flush()
-
         # Update player with hometown/high school info if we found it
         if result.get('hometown_city') and not player.hometown_city:
             player.hometown_city = result['hometown_city']
@@ -27,20 +27,99 @@ Design Pattern Used: Template Method Pattern
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict, deque
+from functools import cached_property
+from itertools import islice
+from typing import (
+    Optional, Dict, Any, Iterable, Iterator, List, Union, ClassVar, TYPE_CHECKING
+)
+import atexit
+import hashlib
+import re
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
+import urllib3
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+from lxml import etree
 from loguru import logger
+import orjson
+
+from sqlalchemy import update
 
 from config.settings import Config
 from database.connection import DatabaseManager
-from database.models import ScrapeLog, League
+from scrapers.http_cache import ConditionalCache, CachedPage
+
+# Heavier imports are deferred to the methods that need them, so importing
+# this module (e.g. to list scrapers) stays cheap:
+# - bs4 / lxml.html: only when a page is parsed (_parse_html)
+# - database.models: only when a scrape log is written
+# - httpx: only when HTTP_BACKEND=httpx
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    import lxml.html
+
+# Optional HTTP/2 backend (HTTP_BACKEND=httpx)
+httpx = None
+if Config.HTTP_BACKEND == 'httpx':
+    try:
+        import httpx
+    except ImportError:
+        pass
+HTTPX_AVAILABLE = httpx is not None
+
+# The session type and the exceptions it can raise, for either backend
+if HTTPX_AVAILABLE:
+    HTTPSession = Union[requests.Session, 'httpx.Client']
+    TIMEOUT_ERRORS = (requests.Timeout, httpx.TimeoutException)
+    HTTP_STATUS_ERRORS = (requests.HTTPError, httpx.HTTPStatusError)
+    REQUEST_ERRORS = (requests.RequestException, httpx.HTTPError)
+else:
+    HTTPSession = requests.Session
+    TIMEOUT_ERRORS = (requests.Timeout,)
+    HTTP_STATUS_ERRORS = (requests.HTTPError,)
+    REQUEST_ERRORS = (requests.RequestException,)
+
+# Longest Retry-After (seconds) we'll honor before giving a host another try
+MAX_RETRY_AFTER_SECONDS = 600
+
+# When a server reports less than this share of its rate limit left
+# (X-RateLimit-Remaining / X-RateLimit-Limit), double our delay for it
+RATE_LIMIT_LOW_WATER = 0.2
+
+# A parsed page: BeautifulSoup by default, lxml.html in 'lxml' parse mode
+PageTree = Union['BeautifulSoup', 'lxml.html.HtmlElement']
+
+# Compression schemes to advertise, best first - but only the ones urllib3
+# can actually decode (br needs brotli, zstd needs a zstd module installed)
+_DECODABLE_ENCODINGS = set(URLLIB3_ACCEPT_ENCODING.split(','))
+ACCEPT_ENCODING_HEADER = ', '.join(
+    encoding for encoding in ('zstd', 'br', 'gzip', 'deflate')
+    if encoding in _DECODABLE_ENCODINGS
+)
+
+
+def utc_now() -> datetime:
+    """
+    Get the current UTC time as a naive datetime.
+
+    Replaces the deprecated datetime.utcnow(). Our DateTime columns store
+    naive UTC values, so the tzinfo is dropped after converting.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Per-request header overrides for JSON endpoints (merged with session headers)
+JSON_HEADERS = {'Accept': 'application/json'}
 
 
 class BaseScraper(ABC):
@@ -56,7 +135,8 @@ class BaseScraper(ABC):
     Attributes:
         league_code (str): The code for the league being scraped (e.g., 'PGA')
         base_url (str): The base URL for the league's website
-        session (requests.Session): Reusable HTTP session with retry logic
+        session (requests.Session): HTTP session with retry logic, shared by
+            all scrapers (an httpx.Client when HTTP_BACKEND=httpx)
         db (DatabaseManager): Database connection manager
 
     For Junior Developers:
@@ -69,10 +149,33 @@ class BaseScraper(ABC):
     - scrape(): The main scraping logic
 
     Methods you CAN override if needed:
-    - get_headers(): Custom HTTP headers
+    - headers: Custom HTTP headers (a cached property)
     - parse_page(): Custom page parsing logic
     """
 
+    # HTTP sessions and JSON pools shared across scraper instances
+    # (see _get_session and _get_json_pool)
+    _shared_sessions: ClassVar[Dict[tuple, Any]] = {}
+    _shared_sessions_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # How many parsed pages to keep in memory for reuse within a run
+    SOUP_CACHE_SIZE = 32
+
+    # How get_page() parses HTML:
+    # - 'bs4': BeautifulSoup over lxml (default, friendliest API)
+    # - 'lxml': a raw lxml.html tree (use .xpath()) - several times faster,
+    #   worth it for scrapers that parse many large pages
+    parse_mode: str = 'bs4'
+
+    # Seconds a cached GET response may be reused without contacting the
+    # server at all. None (the default) always revalidates with the server.
+    # Set this for sources that change very slowly, like bio pages.
+    cache_max_age: Optional[float] = None
+
+    # Seconds between requests for specific hosts, e.g.
+    # {'en.wikipedia.org': 0.2}. Hosts not listed use delay_seconds.
+    host_delays: Dict[str, float] = {}
+
     def __init__(self, league_code: str, base_url: str):
         """
         Initialize the scraper with league information.
@@ -91,25 +194,39 @@ class BaseScraper(ABC):
         # Create a database connection manager
         self.db = DatabaseManager()
 
-        # Create an HTTP session with retry logic
-        # This means if a request fails, it will automatically retry
-        self.session = self._create_session()
-
         # Get configuration values
         self.delay_seconds = Config.SCRAPE_DELAY_SECONDS
         self.user_agent = Config.USER_AGENT
         self.timeout = Config.REQUEST_TIMEOUT
 
+        # Get the shared HTTP session (with retry logic)
+        # This means if a request fails, it will automatically retry
+        self.session = self._get_session()
+
+        # Conditional-GET cache so unchanged pages come back as 304s
+        # (old entries are pruned, but never ones a max age could still use)
+        prune_after = None
+        if Config.HTTP_CACHE_PRUNE_DAYS:
+            prune_after = max(Config.HTTP_CACHE_PRUNE_DAYS, Config.BIO_CACHE_MAX_AGE_DAYS) * 86400
+        self.http_cache = ConditionalCache(Config.HTTP_CACHE_PATH, prune_after) if Config.HTTP_CACHE_ENABLED else None
+
+        # Recently parsed pages, keyed by (url, body hash)
+        self._soup_cache: 'OrderedDict[tuple, PageTree]' = OrderedDict()
+        self._soup_lock = threading.Lock()
+
+        # Per-host time (time.monotonic()) when the next request is allowed
+        self._host_next: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+
+        # Cached league_id (see get_league_id)
+        self._league_id: Optional[int] = None
+
         # Track the current scrape operation for logging
         self._current_scrape_log_id: Optional[int] = None
+        self._current_scrape_started_ns: Optional[int] = None
 
         # Statistics for the current scrape
-        self._stats = {
-            'records_processed': 0,
-            'records_created': 0,
-            'records_updated': 0,
-            'errors': []
-        }
+        self._stats = self._new_stats()
 
         # Logger for this specific scraper
         self.logger = logger.bind(
@@ -117,7 +234,30 @@ class BaseScraper(ABC):
             league=self.league_code
         )
 
-    def _create_session(self) -> requests.Session:
+    def _get_session(self) -> HTTPSession:
+        """
+        Get the HTTP session shared by all scrapers in this process.
+
+        Sharing one session (and so one connection pool) means a scraper
+        created after another one reuses the connections it already opened
+        to the same hosts, instead of paying for new TCP+TLS handshakes.
+        Scrapers with different default headers get separate sessions.
+
+        Returns:
+            The shared session, created on first use
+        """
+        key = (Config.HTTP_BACKEND, tuple(sorted(self.headers.items())))
+
+        with BaseScraper._shared_sessions_lock:
+            session = BaseScraper._shared_sessions.get(key)
+            if session is None:
+                session = self._create_session()
+                BaseScraper._shared_sessions[key] = session
+                atexit.register(session.close)
+
+        return session
+
+    def _create_session(self) -> HTTPSession:
         """
         Create an HTTP session with automatic retry logic.
 
@@ -135,31 +275,130 @@ class BaseScraper(ABC):
 
         The retry strategy here means:
         - total=3: Try up to 3 times total
-        - backoff_factor=1: Wait 1s, 2s, 4s between retries (exponential)
+        - backoff_factor=1: Wait 1s, 2s, 4s between retries (exponential),
+          plus a random jitter of up to 1s
         - status_forcelist: Retry on these HTTP error codes
+        - A 429/503 with a Retry-After header waits that long instead
+
+        The connection pool keeps connections open to many hosts at once
+        (see Config.HTTP_POOL_CONNECTIONS / HTTP_POOL_SIZE), so repeat
+        requests to a host reuse the TCP+TLS connection as long as the
+        session itself is reused across the scrape.
+
+        Set HTTP_BACKEND=httpx to use an HTTP/2 httpx.Client instead
+        (see _create_httpx_client).
         """
+        if Config.HTTP_BACKEND == 'httpx':
+            if HTTPX_AVAILABLE:
+                return self._create_httpx_client()
+            logger.warning("HTTP_BACKEND=httpx but httpx is not installed, using requests")
+
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
+        # Apply the retry strategy to the session
+        adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Config.HTTP_POOL_SIZE,
+            max_retries=self._retry_strategy(),
+            pool_block=False,  # Open an extra connection rather than wait
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # Install default headers once so each request doesn't rebuild them
+        self._install_headers(session)
+
+        return session
+
+    @staticmethod
+    def _retry_strategy() -> Retry:
+        """Build the urllib3 retry policy shared by our HTTP clients."""
+        return Retry(
             total=Config.MAX_RETRIES,
             backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
+            backoff_jitter=1,  # ...plus up to 1s, so workers don't retry in lockstep
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            # A 429/503 Retry-After header replaces the backoff wait
+            respect_retry_after_header=True,
+            # Hand back the last 429/5xx response instead of a RetryError,
+            # so _mark_request() can read its rate-limit headers
+            raise_on_status=False,
         )
 
-        # Apply the retry strategy to the session
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    def _get_json_pool(self) -> urllib3.PoolManager:
+        """
+        Get the urllib3 connection pool used by get_json_fast().
 
-        return session
+        Like the HTTP session, one pool is shared by all scrapers with the
+        same default headers.
+        """
+        headers = {**self.headers, **JSON_HEADERS}
+        key = ('urllib3', tuple(sorted(headers.items())))
+
+        with BaseScraper._shared_sessions_lock:
+            pool = BaseScraper._shared_sessions.get(key)
+            if pool is None:
+                pool = urllib3.PoolManager(
+                    num_pools=Config.HTTP_POOL_CONNECTIONS,
+                    maxsize=Config.HTTP_POOL_SIZE,
+                    headers=headers,
+                    retries=self._retry_strategy(),
+                )
+                BaseScraper._shared_sessions[key] = pool
+                atexit.register(pool.clear)
+
+        return pool
+
+    def _create_httpx_client(self) -> 'httpx.Client':
+        """
+        Create an HTTP/2-capable httpx client.
+
+        With HTTP/2 many requests to the same host share one connection,
+        which helps scrapers that hit a few hosts many times (Wikipedia,
+        ESPN). The client API matches requests closely enough that
+        session.get()/post() calls work unchanged.
 
-    def get_headers(self) -> Dict[str, str]:
+        Note that httpx only retries failed connections; unlike the
+        requests backend it doesn't retry 429/5xx responses.
+
+        Returns:
+            A configured httpx.Client
+        """
+        client = httpx.Client(
+            http2=True,
+            follow_redirects=True,  # requests follows redirects by default
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_POOL_SIZE,
+                max_keepalive_connections=Config.HTTP_POOL_CONNECTIONS,
+            ),
+            transport=httpx.HTTPTransport(http2=True, retries=Config.MAX_RETRIES),
+        )
+        self._install_headers(client)
+        return client
+
+    def _install_headers(self, session: HTTPSession):
+        """
+        Set the default headers on the session.
+
+        requests merges session headers into every request, so per-call
+        headers only need to contain what differs (e.g. Accept for JSON).
+        Override this (or the headers property) to customize headers.
+
+        Args:
+            session: The session to configure
         """
-        Get HTTP headers for requests.
+        session.headers.update(self.headers)
 
-        Override this in subclasses if you need custom headers.
+    @cached_property
+    def headers(self) -> Dict[str, str]:
+        """
+        HTTP headers for requests.
+
+        Override this property in subclasses if you need custom headers.
+        The dict is built once per scraper (on first access) and installed
+        on the session when the session is created.
 
         Returns:
             Dictionary of HTTP headers
@@ -174,21 +413,54 @@ class BaseScraper(ABC):
             'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING_HEADER,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
 
+    @staticmethod
+    def find_by_class(
+        tree: 'lxml.html.HtmlElement',
+        tags: Union[str, Iterable[str]],
+        pattern: re.Pattern
+    ) -> Iterator['lxml.html.HtmlElement']:
+        """
+        Yield elements below an lxml tree whose class matches a regex.
+
+        The lxml-mode counterpart of BeautifulSoup's
+        `find_all(tags, class_=re.compile(...))`: the pattern is tested
+        against each individual class name, in document order.
+
+        Example:
+            for row in self.find_by_class(tree, 'tr', ROSTER_ROW_RE):
+                ...
+        """
+        if isinstance(tags, str):
+            tags = (tags,)
+
+        for element in tree.iterdescendants(*tags):
+            if BaseScraper.class_matches(element, pattern):
+                yield element
+
+    @staticmethod
+    def class_matches(element: 'lxml.html.HtmlElement', pattern: re.Pattern) -> bool:
+        """Check whether any of an lxml element's class names matches a regex."""
+        classes = element.get('class')
+        return bool(classes) and any(pattern.search(name) for name in classes.split())
+
     def get_page(
         self,
         url: str,
         params: Optional[Dict] = None,
         method: str = 'GET',
         data: Optional[Dict] = None
-    ) -> Optional[BeautifulSoup]:
+    ) -> Optional[PageTree]:
         """
         Fetch a web page and return it as a BeautifulSoup object.
 
+        Scrapers that set `parse_mode = 'lxml'` get an lxml.html element
+        instead (see parse_mode above).
+
         This method handles:
         - Making the HTTP request
         - Checking for errors
@@ -214,54 +486,328 @@ class BaseScraper(ABC):
             # Log what we're doing
             self.logger.info(f"Fetching: {url}")
 
-            # Make the HTTP request
-            if method.upper() == 'POST':
-                response = self.session.post(
-                    url,
-                    params=params,
-                    data=data,
-                    headers=self.get_headers(),
-                    timeout=self.timeout
-                )
-            else:
-                response = self.session.get(
-                    url,
-                    params=params,
-                    headers=self.get_headers(),
-                    timeout=self.timeout
-                )
-
-            # Raise an exception if the request failed (4xx or 5xx status)
-            response.raise_for_status()
+            # A recent enough cached copy needs no request (see cache_max_age)
+            response = None if method.upper() == 'POST' else self._fresh_cached(url, params)
+
+            if response is None:
+                # Be polite: wait until this host is due for another request
+                self._rate_limit(url)
+
+                # Make the HTTP request
+                if method.upper() == 'POST':
+                    response = self.session.post(
+                        url,
+                        params=params,
+                        data=data,
+                        timeout=self.timeout
+                    )
+                    # Raise an exception if the request failed (4xx or 5xx status)
+                    response.raise_for_status()
+                else:
+                    # GETs go through the conditional cache (may be a 304 reuse)
+                    response = self._conditional_get(url, params)
+
+                # Start this host's delay window from when the response arrived
+                # This prevents us from overwhelming the website
+                self._mark_request(url, response)
 
             # Log the response size
             self.logger.debug(f"Received {len(response.content)} bytes")
 
             # Parse the HTML into a BeautifulSoup object
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # Be polite: wait before making another request
-            # This prevents us from overwhelming the website
-            self._rate_limit()
+            # (identical bodies fetched earlier in this run reuse their tree)
+            soup = self._parse_html(self._cache_key(url, params), response)
 
             return soup
 
-        except requests.Timeout:
+        except TIMEOUT_ERRORS:
             self.logger.error(f"Timeout fetching {url}")
             self._stats['errors'].append(f"Timeout: {url}")
             return None
 
-        except requests.HTTPError as e:
+        except HTTP_STATUS_ERRORS as e:
             self.logger.error(f"HTTP error fetching {url}: {e}")
             self._stats['errors'].append(f"HTTP {e.response.status_code}: {url}")
+            # Retries are used up - a 429's Retry-After still holds this host back
+            self._mark_request(url, e.response)
             return None
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             # Log the error but don't crash
             self.logger.error(f"Failed to fetch {url}: {str(e)}")
             self._stats['errors'].append(f"Request failed: {url} - {str(e)}")
             return None
 
+        except etree.LxmlError as e:
+            # Raw lxml parsing rejects empty/garbage documents
+            self.logger.error(f"Failed to parse {url}: {str(e)}")
+            self._stats['errors'].append(f"Parse failed: {url}")
+            return None
+
+    def get_pages(
+        self,
+        urls: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[Optional[PageTree]]:
+        """
+        Fetch several web pages concurrently.
+
+        Requests run on a small thread pool sharing this scraper's session,
+        so they reuse pooled connections, the conditional cache, and the
+        per-host rate limits - requests to the same host are still spaced
+        out, while different hosts are fetched in parallel.
+
+        Args:
+            urls: The URLs to fetch
+            max_workers: Thread count (defaults to Config.SCRAPE_MAX_WORKERS)
+
+        Returns:
+            One BeautifulSoup object (or None if that fetch failed) per URL,
+            in the same order as `urls`
+
+        Example:
+            soups = self.get_pages([roster_url_1, roster_url_2])
+            for url, soup in zip(urls, soups):
+                if soup:
+                    ...
+        """
+        if not urls:
+            return []
+
+        workers = min(max_workers or Config.SCRAPE_MAX_WORKERS, len(urls))
+        if workers <= 1:
+            return [self.get_page(url) for url in urls]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_page, urls))
+
+    def iter_page(
+        self,
+        url: str,
+        tags: Union[str, Iterable[str]],
+        params: Optional[Dict] = None,
+        chunk_size: int = 65536,
+        raise_errors: bool = False,
+        body: Optional[List[bytes]] = None
+    ) -> Iterator[etree._Element]:
+        """
+        Stream a page and yield matching elements as soon as they are parsed.
+
+        The body is downloaded in chunks and fed to an incremental lxml
+        parser, so memory stays proportional to one chunk (plus the element
+        being yielded) rather than the whole page, and parsing overlaps
+        with the download. Use this for very large pages where you only
+        need certain tags, e.g. the rows of a giant results table.
+
+        Each element is cleared once you move on to the next one, so read
+        everything you need from it inside the loop - and don't ask for
+        nested tags (e.g. 'table' and 'tr') in the same call.
+
+        Streamed pages bypass the conditional cache and the parsed-page
+        cache - except for scrapers with cache_max_age set, where a fresh
+        cached copy is parsed instead of making a request, and a fully read
+        200 page is stored for next time.
+
+        Args:
+            url: The URL to fetch
+            tags: Tag name(s) to yield, e.g. 'tr' or ['tr', 'h2']
+            params: Optional query parameters
+            chunk_size: Bytes to read per chunk
+            raise_errors: Re-raise a failed request or parse (after logging
+                it) instead of just stopping - for callers that must not
+                use a partially streamed page
+            body: If given, the raw body is appended to this list as it
+                streams (for a second look at the page without fetching it
+                again)
+
+        Yields:
+            lxml elements for each matching tag, in document order
+
+        Example:
+            for row in self.iter_page(results_url, 'tr'):
+                cells = [td.text_content().strip() for td in row.iter('td')]
+        """
+        if isinstance(tags, str):
+            tags = [tags]
+
+        self.logger.info(f"Streaming: {url}")
+
+        cached = self._fresh_cached(url, params)
+        if cached is not None:
+            if body is not None:
+                body.append(cached.content)
+            chunks = (
+                cached.content[i:i + chunk_size]
+                for i in range(0, len(cached.content), chunk_size)
+            )
+            yield from self._pull_parse(chunks, tags, cached.encoding)
+            return
+
+        self._rate_limit(url)
+
+        try:
+            with self._stream_get(url, params) as response:
+                response.raise_for_status()
+                chunks = self._iter_chunks(response, chunk_size)
+
+                # Only keep the body in memory if we're going to cache it
+                # (or the caller asked for it)
+                keep_body = self.http_cache is not None and self.cache_max_age is not None
+                if body is None and keep_body:
+                    body = []
+                if body is not None:
+                    chunks = self._record_chunks(chunks, body)
+
+                yield from self._pull_parse(chunks, tags, self._declared_encoding(response))
+
+                # Other 2xx answers (e.g. a 202 "try again later") aren't
+                # the real page, so they must not be reused
+                if keep_body and response.status_code == 200:
+                    self.http_cache.store(
+                        self._cache_key(url, params),
+                        response,
+                        require_validators=False,
+                        content=b''.join(body)
+                    )
+
+        except REQUEST_ERRORS as e:
+            self.logger.error(f"Failed to stream {url}: {str(e)}")
+            self._stats['errors'].append(f"Request failed: {url} - {str(e)}")
+            if raise_errors:
+                raise
+
+        except etree.LxmlError as e:
+            self.logger.error(f"Failed to parse {url}: {str(e)}")
+            self._stats['errors'].append(f"Parse failed: {url}")
+            if raise_errors:
+                raise
+
+        finally:
+            self._mark_request(url)
+
+    def _stream_get(self, url: str, params: Optional[Dict] = None):
+        """Open a streaming GET response (a context manager) for either backend."""
+        if isinstance(self.session, requests.Session):
+            return self.session.get(url, params=params, stream=True, timeout=self.timeout)
+        return self.session.stream('GET', url, params=params, timeout=self.timeout)
+
+    @staticmethod
+    def _iter_chunks(response, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the decompressed body of a streaming response."""
+        if isinstance(response, requests.Response):
+            return response.iter_content(chunk_size=chunk_size)
+        return response.iter_bytes(chunk_size=chunk_size)
+
+    @staticmethod
+    def _record_chunks(chunks: Iterable[bytes], body: List[bytes]) -> Iterator[bytes]:
+        """Pass chunks through, appending each one to `body` as well."""
+        for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+
+    def _pull_parse(
+        self,
+        chunks: Iterable[bytes],
+        tags: Iterable[str],
+        encoding: Optional[str]
+    ) -> Iterator[etree._Element]:
+        """Feed chunks to an incremental parser, yielding finished tags."""
+        parser = etree.HTMLPullParser(events=('end',), tag=list(tags), encoding=encoding)
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from self._drain_pull_parser(parser)
+
+        parser.close()
+        yield from self._drain_pull_parser(parser)
+
+    @staticmethod
+    def _drain_pull_parser(parser: etree.HTMLPullParser) -> Iterator[etree._Element]:
+        """Yield finished elements from a pull parser, freeing each afterwards."""
+        for _, element in parser.read_events():
+            yield element
+            # Free the element's children and any already-seen siblings
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def get_page_head(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        max_bytes: int = 65536
+    ) -> Optional[PageTree]:
+        """
+        Fetch only the start of a web page and parse it.
+
+        The body is streamed and the download stops after `max_bytes`
+        (decompressed), so for pages where everything we need is near the
+        top - search results, for example - we don't transfer or parse the
+        tracking scripts and footers below it. The parser closes any tags
+        left open at the cut.
+
+        Stopping early means the connection can't go back to the pool, so
+        this only pays off for large pages. The truncated body is never
+        stored in the conditional cache, but a fresh cached copy (see
+        cache_max_age) is still used instead of making a request.
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            max_bytes: How much of the body to read
+
+        Returns:
+            BeautifulSoup object (or lxml.html element in 'lxml' mode),
+            or None if the request failed
+        """
+        self.logger.info(f"Fetching (first {max_bytes // 1024} KB): {url}")
+
+        key = self._cache_key(url, params)
+        cached = self._fresh_cached(url, params)
+        if cached is not None:
+            return self._parse_html(key, cached)
+
+        self._rate_limit(url)
+
+        response = None
+        try:
+            with self._stream_get(url, params) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in self._iter_chunks(response, min(max_bytes, 16384)):
+                    body += chunk
+                    if len(body) >= max_bytes:
+                        break
+
+            self.logger.debug(f"Received {len(body)} bytes")
+
+            # Wrap the partial body so _parse_html treats it like a cached page
+            head = CachedPage(key, bytes(body[:max_bytes]), self._declared_encoding(response), None, None)
+            return self._parse_html(key, head)
+
+        except TIMEOUT_ERRORS:
+            self.logger.error(f"Timeout fetching {url}")
+            self._stats['errors'].append(f"Timeout: {url}")
+            return None
+
+        except HTTP_STATUS_ERRORS as e:
+            self.logger.error(f"HTTP error fetching {url}: {e}")
+            self._stats['errors'].append(f"HTTP {e.response.status_code}: {url}")
+            return None
+
+        except REQUEST_ERRORS as e:
+            self.logger.error(f"Failed to fetch {url}: {str(e)}")
+            self._stats['errors'].append(f"Request failed: {url} - {str(e)}")
+            return None
+
+        except etree.LxmlError as e:
+            self.logger.error(f"Failed to parse {url}: {str(e)}")
+            self._stats['errors'].append(f"Parse failed: {url}")
+            return None
+
+        finally:
+            self._mark_request(url, response)
+
     def get_json(
         self,
         url: str,
@@ -286,22 +832,67 @@ class BaseScraper(ABC):
         try:
             self.logger.info(f"Fetching JSON: {url}")
 
-            response = self.session.get(
-                url,
-                params=params,
-                headers={
-                    **self.get_headers(),
-                    'Accept': 'application/json',
-                },
-                timeout=self.timeout
+            response = self._fresh_cached(url, params)
+            if response is None:
+                self._rate_limit(url)
+                response = self._conditional_get(url, params, JSON_HEADERS)
+                self._mark_request(url, response)
+
+            # orjson parses the bytes directly (no str decode, much faster)
+            return orjson.loads(response.content)
+
+        except REQUEST_ERRORS as e:
+            self.logger.error(f"Failed to fetch JSON {url}: {str(e)}")
+            self._stats['errors'].append(f"JSON request failed: {url}")
+            if isinstance(e, HTTP_STATUS_ERRORS):
+                self._mark_request(url, e.response)
+            return None
+
+        except ValueError as e:
+            # orjson.JSONDecodeError is a ValueError subclass
+            self.logger.error(f"Invalid JSON from {url}: {str(e)}")
+            self._stats['errors'].append(f"Invalid JSON: {url}")
+            return None
+
+    def get_json_fast(
+        self,
+        url: str,
+        params: Optional[Dict] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch JSON with urllib3 directly, skipping the requests machinery.
+
+        For many small JSON responses (e.g. one ESPN athlete record per
+        request) the per-call overhead of requests - hooks, cookie jar,
+        prepared requests - is a noticeable share of the time. This goes
+        straight to a pooled urllib3 connection instead. It doesn't use the
+        conditional-GET cache; use get_json() for large or cacheable
+        documents.
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+
+        Returns:
+            Parsed JSON as a dictionary, or None if failed
+        """
+        try:
+            self.logger.debug(f"Fetching JSON: {url}")
+            self._rate_limit(url)
+
+            response = self._get_json_pool().request(
+                'GET', url, fields=params, timeout=self.timeout
             )
-            response.raise_for_status()
+            self._mark_request(url, response)
 
-            self._rate_limit()
+            if response.status >= 400:
+                self.logger.error(f"HTTP {response.status} fetching JSON {url}")
+                self._stats['errors'].append(f"HTTP {response.status}: {url}")
+                return None
 
-            return response.json()
+            return orjson.loads(response.data)
 
-        except requests.RequestException as e:
+        except urllib3.exceptions.HTTPError as e:
             self.logger.error(f"Failed to fetch JSON {url}: {str(e)}")
             self._stats['errors'].append(f"JSON request failed: {url}")
             return None
@@ -311,9 +902,155 @@ class BaseScraper(ABC):
             self._stats['errors'].append(f"Invalid JSON: {url}")
             return None
 
-    def _rate_limit(self):
+    def _conditional_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Union[requests.Response, CachedPage]:
+        """
+        Make a GET request, revalidating against the conditional cache.
+
+        If we have a stored copy of the URL, its ETag / Last-Modified are
+        sent along and a 304 Not Modified reply reuses the stored body.
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            headers: Optional per-request headers
+
+        Returns:
+            The response, or the cached page on 304 (both have .content/.text)
+
+        Raises:
+            requests.RequestException (or httpx.HTTPError): If the request fails
+        """
+        if not self.http_cache:
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            return response
+
+        cache_key = self._cache_key(url, params)
+        cached = self.http_cache.get(cache_key)
+        if cached:
+            headers = {**(headers or {}), **cached.validators()}
+
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached:
+            self.logger.debug(f"Not modified, reusing cached body: {url}")
+            return cached
+
+        response.raise_for_status()
+        self.http_cache.store(
+            cache_key,
+            response,
+            require_validators=self.cache_max_age is None
+        )
+        return response
+
+    def _fresh_cached(self, url: str, params: Optional[Dict] = None) -> Optional[CachedPage]:
         """
-        Wait between requests to be respectful to websites.
+        Get the cached copy of a URL if it is younger than cache_max_age.
+
+        Returns:
+            The cached page, or None if caching is off or the copy is too old
+        """
+        if not self.http_cache or self.cache_max_age is None:
+            return None
+
+        cached = self.http_cache.get(self._cache_key(url, params))
+        if cached and cached.is_fresh(self.cache_max_age):
+            self.logger.debug(f"Using cached copy (no request): {url}")
+            return cached
+
+        return None
+
+    def _parse_html(
+        self,
+        url: str,
+        response: Union[requests.Response, CachedPage]
+    ) -> PageTree:
+        """
+        Parse an HTML body, reusing the tree if this exact body was seen before.
+
+        Parses with BeautifulSoup or lxml.html depending on parse_mode.
+
+        Trees are kept in a small LRU keyed by URL plus a hash of the body, so
+        a changed page is always re-parsed. The cached tree is shared, so
+        callers must treat returned soups as read-only.
+
+        Args:
+            url: The full request URL
+            response: The response (or cached page) to parse
+
+        Returns:
+            BeautifulSoup object (or lxml.html element in 'lxml' mode)
+        """
+        key = (url, hashlib.blake2b(response.content, digest_size=8).digest())
+
+        with self._soup_lock:
+            soup = self._soup_cache.get(key)
+            if soup is not None:
+                self._soup_cache.move_to_end(key)
+        if soup is not None:
+            self.logger.debug(f"Reusing parsed page: {url}")
+            return soup
+
+        if self.parse_mode == 'lxml':
+            import lxml.html
+
+            # lxml reads the raw bytes and handles the charset itself
+            soup = lxml.html.fromstring(response.content)
+        else:
+            from bs4 import BeautifulSoup
+
+            # Hand bs4 the raw bytes - decoding to str first would only be
+            # undone again by lxml. Only force a charset the server declared.
+            soup = BeautifulSoup(
+                response.content,
+                'lxml',
+                from_encoding=self._declared_encoding(response)
+            )
+        with self._soup_lock:
+            self._soup_cache[key] = soup
+            if len(self._soup_cache) > self.SOUP_CACHE_SIZE:
+                self._soup_cache.popitem(last=False)
+        return soup
+
+    @staticmethod
+    def _declared_encoding(response: Union[requests.Response, CachedPage]) -> Optional[str]:
+        """
+        Get the charset from the Content-Type header, if the server sent one.
+
+        requests falls back to ISO-8859-1 for any text/* response without a
+        charset; in that case we return None and let the parser detect the
+        encoding from the document itself (e.g. <meta charset>).
+        """
+        if isinstance(response, CachedPage):
+            return response.encoding
+        content_type = response.headers.get('Content-Type', '').lower()
+        return response.encoding if 'charset=' in content_type else None
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict] = None) -> str:
+        """Build the full request URL (with query string) used as a cache key."""
+        if not params:
+            return url
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, params)
+        return prepared.url
+
+    def _rate_limit(self, url: Optional[str] = None):
+        """
+        Wait until the target host is due for another request.
+
+        Each host gets its own delay window, so a request to Wikipedia
+        doesn't have to wait out the delay from a request to ESPN. The
+        window is delay_seconds unless host_delays sets one for the host.
+
+        Args:
+            url: The URL about to be requested (None means "any host")
 
         For Junior Developers:
         ---------------------
@@ -324,7 +1061,112 @@ class BaseScraper(ABC):
 
         Always be a good internet citizen!
         """
-        time.sleep(self.delay_seconds)
+        host = self._host(url)
+        delay = self.host_delays.get(host, self.delay_seconds)
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next.get(host, 0.0))
+            # Reserve this slot so concurrent workers queue up behind us
+            self._host_next[host] = start + delay
+
+        if start > now:
+            time.sleep(start - now)
+
+    def _mark_request(self, url: Optional[str] = None, response: Any = None):
+        """
+        Record that a request to this URL's host just finished.
+
+        The next request to the same host will wait delay_seconds (or its
+        host_delays entry) from now - or longer, if the response says the
+        server wants us to slow down (see _server_delay).
+
+        Args:
+            url: The URL that was requested
+            response: The response it got, if any (requests, httpx or
+                urllib3 response; cached pages are ignored)
+        """
+        host = self._host(url)
+        delay = self._server_delay(response, self.host_delays.get(host, self.delay_seconds))
+        with self._host_lock:
+            self._host_next[host] = max(
+                self._host_next.get(host, 0.0),
+                time.monotonic() + delay
+            )
+
+    @classmethod
+    def _server_delay(cls, response: Any, delay: float) -> float:
+        """
+        Stretch a host's delay when its response asks us to back off.
+
+        - 429 / 503: wait the Retry-After time (capped at
+          MAX_RETRY_AFTER_SECONDS), or the longest retry backoff if the
+          server didn't say
+        - X-RateLimit-Remaining below RATE_LIMIT_LOW_WATER of
+          X-RateLimit-Limit: double the delay before we run out
+
+        For Junior Developers:
+        ---------------------
+        A 429 "Too Many Requests" isn't really an error - it's the server
+        telling us its limit. Waiting as long as it asks gets more pages
+        scraped overall than retrying straight away and getting blocked.
+
+        Args:
+            response: The response (anything without headers is ignored)
+            delay: The host's normal delay in seconds
+
+        Returns:
+            Seconds until the next request to this host
+        """
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return delay
+
+        status = getattr(response, 'status_code', None) or getattr(response, 'status', None)
+        if status in (429, 503):
+            retry_after = cls._retry_after_seconds(headers.get('Retry-After'))
+            if retry_after is None:
+                retry_after = 2 ** Config.MAX_RETRIES
+            return max(delay, min(retry_after, MAX_RETRY_AFTER_SECONDS))
+
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            limit = int(headers['X-RateLimit-Limit'])
+        except (KeyError, TypeError, ValueError):
+            return delay
+
+        if limit > 0 and remaining < limit * RATE_LIMIT_LOW_WATER:
+            return delay * 2
+        return delay
+
+    @staticmethod
+    def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header (seconds, or an HTTP date).
+
+        Returns:
+            Seconds to wait, or None if the header is missing or invalid
+        """
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _host(url: Optional[str]) -> str:
+        """Get the host (netloc) used as the rate-limit key for a URL."""
+        return urlparse(url).netloc if url else ''
 
     def start_scrape_log(
         self,
@@ -346,36 +1188,49 @@ class BaseScraper(ABC):
         Returns:
             The log ID for this scrape operation
         """
+        from database.models import ScrapeLog
+
         with self.db.get_session() as session:
-            # Look up the league ID
-            league = session.query(League).filter_by(
-                league_code=self.league_code
-            ).first()
+            # Look up the league ID (cached after the first lookup)
+            league_id = self._lookup_league_id(session)
 
             # Create the log entry
             log = ScrapeLog(
                 scrape_type=scrape_type,
-                league_id=league.league_id if league else None,
+                league_id=league_id,
                 status='started',
                 source_url=source_url,
-                started_at=datetime.utcnow()
+                started_at=utc_now()
             )
             session.add(log)
             session.flush()  # Get the ID without committing
 
             self._current_scrape_log_id = log.log_id
+            self._current_scrape_started_ns = time.monotonic_ns()
             self.logger.info(f"Started {scrape_type} scrape (log_id={log.log_id})")
 
             # Reset stats for this scrape
-            self._stats = {
-                'records_processed': 0,
-                'records_created': 0,
-                'records_updated': 0,
-                'errors': []
-            }
+            self._stats = self._new_stats()
 
             return log.log_id
 
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        """
+        Create an empty statistics dict for a scrape.
+
+        Errors go into a ring buffer that keeps only the most recent
+        Config.MAX_ERROR_BUFFER messages, so a broken source can't grow
+        memory without bound during a long run. Use list(...) when
+        returning them in a result dict.
+        """
+        return {
+            'records_processed': 0,
+            'records_created': 0,
+            'records_updated': 0,
+            'errors': deque(maxlen=Config.MAX_ERROR_BUFFER)
+        }
+
     def complete_scrape_log(
         self,
         status: str,
@@ -391,25 +1246,36 @@ class BaseScraper(ABC):
         if not self._current_scrape_log_id:
             return
 
+        from database.models import ScrapeLog
+
+        completed_at = utc_now()
+        values = {
+            'status': status,
+            'records_processed': self._stats['records_processed'],
+            'records_created': self._stats['records_created'],
+            'records_updated': self._stats['records_updated'],
+            'completed_at': completed_at,
+        }
+
+        # Calculate duration from the monotonic clock (immune to wall-clock
+        # changes, and the log row doesn't need to be loaded back)
+        if self._current_scrape_started_ns is not None:
+            elapsed_ns = time.monotonic_ns() - self._current_scrape_started_ns
+            values['duration_seconds'] = elapsed_ns // 1_000_000_000
+
+        # Store error information
+        if error_message:
+            values['error_message'] = error_message
+        elif self._stats['errors']:
+            values['error_message'] = '\n'.join(islice(self._stats['errors'], 10))  # First 10 errors
+
         with self.db.get_session() as session:
-            log = session.query(ScrapeLog).get(self._current_scrape_log_id)
-            if log:
-                log.status = status
-                log.records_processed = self._stats['records_processed']
-                log.records_created = self._stats['records_created']
-                log.records_updated = self._stats['records_updated']
-                log.completed_at = datetime.utcnow()
-
-                # Calculate duration
-                if log.started_at:
-                    duration = (log.completed_at - log.started_at).total_seconds()
-                    log.duration_seconds = int(duration)
-
-                # Store error information
-                if error_message:
-                    log.error_message = error_message
-                elif self._stats['errors']:
-                    log.error_message = '\n'.join(self._stats['errors'][:10])  # First 10 errors
+            # A single UPDATE ... WHERE log_id = ? instead of SELECT + UPDATE
+            session.execute(
+                update(ScrapeLog)
+                .where(ScrapeLog.log_id == self._current_scrape_log_id)
+                .values(**values)
+            )
 
         self.logger.info(
             f"Completed scrape: {status}, "
@@ -419,6 +1285,7 @@ class BaseScraper(ABC):
         )
 
         self._current_scrape_log_id = None
+        self._current_scrape_started_ns = None
 
     def get_league_id(self) -> Optional[int]:
         """
@@ -427,11 +1294,28 @@ class BaseScraper(ABC):
         Returns:
             The league_id from the database, or None if not found
         """
+        if self._league_id is not None:
+            return self._league_id
+
         with self.db.get_session() as session:
+            return self._lookup_league_id(session)
+
+    def _lookup_league_id(self, session) -> Optional[int]:
+        """
+        Get this scraper's league_id using an existing session.
+
+        The ID is remembered once found, so repeated scrapes don't query
+        the leagues table again. A missing league isn't remembered, since
+        some scrapers create their league on the first run.
+        """
+        if self._league_id is None:
+            from database.models import League
+
             league = session.query(League).filter_by(
                 league_code=self.league_code
             ).first()
-            return league.league_id if league else None
+            self._league_id = league.league_id if league else None
+        return self._league_id
 
     @abstractmethod
     def scrape(self, **kwargs) -> Dict[str, Any]:
@@ -516,5 +1400,5 @@ class BaseScraper(ABC):
                 'records_processed': self._stats['records_processed'],
                 'records_created': self._stats['records_created'],
                 'records_updated': self._stats['records_updated'],
-                'errors': self._stats['errors'] + [error_msg]
+                'errors': list(self._stats['errors']) + [error_msg]
             }
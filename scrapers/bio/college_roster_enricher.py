@@ -15,17 +15,49 @@ Data Sources:
 - Uses standardized athletic site formats (SideArm, StatBroadcast, etc.)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
+from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 import re
-import time
 
 from loguru import logger
+import orjson
+from sqlalchemy import func, update
 
-from scrapers.base_scraper import BaseScraper
+from config.settings import Config
+from scrapers.base_scraper import BaseScraper, utc_now
 from database.models import Player
 
 
+# Roster markup patterns, compiled once and reused for every roster page.
+# SideArm and similar athletic site platforms use class names like
+# "sidearm-roster-player" or "roster-card-item".
+ROSTER_CLASS_RE = re.compile(r'roster', re.IGNORECASE)
+ROSTER_PLAYER_CLASS_RE = re.compile(r'roster.*player|player.*item', re.IGNORECASE)
+ROSTER_ANY_CLASS_RE = re.compile(r'roster|player', re.IGNORECASE)
+NAME_CLASS_RE = re.compile(r'name|player', re.IGNORECASE)
+HOMETOWN_CLASS_RE = re.compile(r'hometown|hs|high.?school|location', re.IGNORECASE)
+
+# "Dallas, Texas / Highland Park" inside a roster item's text
+ITEM_HOMETOWN_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+)\s*/\s*([A-Za-z\s\'-]+)')
+
+# Whole-page fallback: "Name ... City, State / High School"
+PAGE_ROSTER_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+)\s+([A-Z][a-z]+).*?([A-Z][a-z]+,\s*[A-Z][a-z]+)\s*/\s*([A-Z][A-Za-z\s]+)'),
+)
+FALLBACK_TEXT_LIMIT = 200_000  # characters of page text to scan
+FALLBACK_MAX_MATCHES = 20
+
+# Version of the parsed-roster format stored in the extraction cache.
+# Bump this whenever _parse_roster() output changes, so old entries are
+# ignored instead of read back.
+ROSTER_CACHE_VERSION = 1
+
+# Player columns filled in from a roster row (only when empty)
+BIO_FIELDS = ('high_school_name', 'hometown_city', 'hometown_state', 'college_name')
+
+
 class CollegeRosterBioEnricher(BaseScraper):
     """
     Enriches player bio data from college golf team rosters.
@@ -36,6 +68,12 @@ class CollegeRosterBioEnricher(BaseScraper):
 
     scrape_type = 'player_bio'
 
+    # Roster pages are large - parse them with lxml directly (see BaseScraper)
+    parse_mode = 'lxml'
+
+    # Reuse pages fetched in the last few days without re-requesting them
+    cache_max_age = Config.BIO_CACHE_MAX_AGE_DAYS * 86400 or None
+
     def __init__(self):
         super().__init__('BIO', 'https://www.ncaa.com')
         self.logger = logger.bind(scraper='CollegeRosterBioEnricher')
@@ -65,7 +103,10 @@ class CollegeRosterBioEnricher(BaseScraper):
             ('UCLA', 'https://uclabruins.com/sports/mens-golf/roster', 'UCLA'),
         ]
 
-        self.request_delay = 2  # seconds between requests
+        # name_key values of players whose bio fields are all
+        # filled in already - nothing a roster could add (see
+        # _load_complete_names)
+        self._complete_names: Set[str] = set()
 
     def scrape(self, **kwargs) -> Dict[str, Any]:
         """Scrape college rosters and match to existing players."""
@@ -90,18 +131,39 @@ class CollegeRosterBioEnricher(BaseScraper):
 
         all_roster_data = []
 
-        # Scrape each college roster
+        # Players we can't add anything to are skipped while parsing
+        self._complete_names = self._load_complete_names()
+
+        # Rosters parsed on a recent run are reused as-is (no fetch, no parse)
+        to_fetch = []
         for college_name, roster_url, school_name in self.college_rosters:
+            roster_data = self._cached_roster(roster_url, school_name)
+            if roster_data is None:
+                to_fetch.append((college_name, roster_url, school_name))
+            elif roster_data:
+                all_roster_data.extend(roster_data)
+                results['colleges_scraped'] += 1
+                self.logger.info(f"  {college_name}: found {len(roster_data)} players (cached)")
+
+        # Fetch the rest concurrently. Every college is on its own host,
+        # and get_pages() still rate-limits per host, so each site sees the
+        # same polite single request - we just don't wait for one college
+        # before asking the next.
+        self.logger.info(f"Fetching {len(to_fetch)} college rosters...")
+        trees = self.get_pages([roster_url for _, roster_url, _ in to_fetch])
+
+        for (college_name, roster_url, school_name), tree in zip(to_fetch, trees):
             try:
-                self.logger.info(f"Scraping {college_name} roster...")
-                roster_data = self._scrape_roster(roster_url, school_name)
+                if tree is None:
+                    continue
+
+                roster_data = self._parse_roster(tree, school_name)
+                self._store_roster(roster_url, school_name, roster_data)
 
                 if roster_data:
                     all_roster_data.extend(roster_data)
                     results['colleges_scraped'] += 1
-                    self.logger.info(f"  Found {len(roster_data)} players")
-
-                time.sleep(self.request_delay)
+                    self.logger.info(f"  {college_name}: found {len(roster_data)} players")
 
             except Exception as e:
                 self.logger.error(f"Error scraping {college_name}: {e}")
@@ -111,9 +173,17 @@ class CollegeRosterBioEnricher(BaseScraper):
 
         # Match roster players to our database
         with self.db.get_session() as session:
+            index, by_first_name = self._build_player_index(session, all_roster_data)
+
+            # Column changes per player_id, written in one UPDATE at the end
+            updates: Dict[int, Dict[str, Any]] = {}
+
+            # Every row updated in this run gets the same timestamp
+            run_ts = utc_now()
+
             for player_data in all_roster_data:
                 try:
-                    success = self._match_and_update_player(session, player_data)
+                    success = self._match_and_update_player(index, by_first_name, player_data, updates, run_ts)
                     results['processed'] += 1
 
                     if success:
@@ -125,6 +195,10 @@ class CollegeRosterBioEnricher(BaseScraper):
                     self.logger.error(f"Error matching player: {e}")
                     results['errors'].append(str(e))
 
+            if updates:
+                # ORM bulk UPDATE by primary key: one executemany statement
+                session.execute(update(Player), list(updates.values()))
+
         self.logger.info(f"Enrichment complete: {results['enriched']}/{results['processed']} players updated")
         return results
 
@@ -138,40 +212,82 @@ class CollegeRosterBioEnricher(BaseScraper):
         - high_school_name
         - college_name
         """
-        players = []
-
-        soup = self.get_page(url)
-        if not soup:
+        players = self._cached_roster(url, school_name)
+        if players is not None:
             return players
 
+        tree = self.get_page(url)
+        if tree is None:
+            return []
+
+        players = self._parse_roster(tree, school_name)
+        self._store_roster(url, school_name, players)
+        return players
+
+    def _roster_cache_key(self, url: str, school_name: str) -> str:
+        """Key for a parsed roster in the extraction cache."""
+        return f"roster|v{ROSTER_CACHE_VERSION}|{school_name}|{url}"
+
+    def _cached_roster(self, url: str, school_name: str) -> Optional[List[Dict]]:
+        """
+        Get a roster parsed within cache_max_age, if we have one.
+
+        Returns:
+            The stored player dictionaries, or None on a cache miss
+        """
+        if not self.http_cache or self.cache_max_age is None:
+            return None
+
+        value = self.http_cache.get_value(self._roster_cache_key(url, school_name), self.cache_max_age)
+        return orjson.loads(value) if value is not None else None
+
+    def _store_roster(self, url: str, school_name: str, players: List[Dict]):
+        """Save a parsed roster so re-runs can skip fetching and parsing it."""
+        if not self.http_cache or self.cache_max_age is None:
+            return
+
+        self.http_cache.set_value(self._roster_cache_key(url, school_name), orjson.dumps(players))
+
+    def _parse_roster(self, tree, school_name: str) -> List[Dict]:
+        """
+        Extract roster players from an already-fetched roster page.
+
+        Returns the same player dictionaries as _scrape_roster().
+        """
+        players = []
+
         # Common roster table/list formats
         # SideArm sports format (most common)
-        roster_items = soup.find_all('li', class_=re.compile(r'roster', re.I))
+        roster_items = list(self.find_by_class(tree, 'li', ROSTER_CLASS_RE))
         if not roster_items:
-            roster_items = soup.find_all('div', class_=re.compile(r'roster.*player|player.*item', re.I))
+            roster_items = list(self.find_by_class(tree, 'div', ROSTER_PLAYER_CLASS_RE))
         if not roster_items:
             # Try table format
-            roster_items = soup.find_all('tr', class_=re.compile(r'roster', re.I))
+            roster_items = list(self.find_by_class(tree, 'tr', ROSTER_CLASS_RE))
         if not roster_items:
             # Just find all roster-related sections
-            roster_items = soup.find_all(['li', 'div', 'tr'],
-                attrs={'class': re.compile(r'roster|player', re.I)})
+            roster_items = list(self.find_by_class(tree, ('li', 'div', 'tr'), ROSTER_ANY_CLASS_RE))
 
+        # An empty dict means "known, already complete player" - the page did
+        # parse, so it shouldn't trigger the whole-page fallback below
+        recognized = False
         for item in roster_items:
             player_data = self._parse_roster_item(item, school_name)
+            if player_data is not None:
+                recognized = True
             if player_data:
                 players.append(player_data)
 
         # Fallback: look for hometown patterns anywhere on page
-        if not players:
-            text = soup.get_text()
+        if not players and not recognized:
+            # Only scan the start of the page - rosters come before the
+            # footer/sponsor text, and this bounds the regex work on huge pages
+            text = tree.text_content()[:FALLBACK_TEXT_LIMIT]
             # Pattern: "Name ... Hometown/HS" or similar
-            patterns = [
-                r'([A-Z][a-z]+)\s+([A-Z][a-z]+).*?([A-Z][a-z]+,\s*[A-Z][a-z]+)\s*/\s*([A-Z][A-Za-z\s]+)',
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                for match in matches[:20]:  # Limit matches
+            for pattern in PAGE_ROSTER_PATTERNS:
+                # finditer + islice stops scanning after 20 hits (Limit matches)
+                for found in islice(pattern.finditer(text), FALLBACK_MAX_MATCHES):
+                    match = found.groups()
                     if len(match) >= 4:
                         hometown_parts = match[2].split(',')
                         players.append({
@@ -186,17 +302,26 @@ class CollegeRosterBioEnricher(BaseScraper):
         return players
 
     def _parse_roster_item(self, item, school_name: str) -> Optional[Dict]:
-        """Parse a single roster item (player row/card)."""
+        """
+        Parse a single roster item (player row/card).
+
+        Returns the player dictionary, an empty dict for a player whose bio
+        is already complete, or None if the item couldn't be parsed.
+        """
         try:
-            # Extract name
-            name_elem = item.find(['a', 'span', 'div'], class_=re.compile(r'name|player', re.I))
-            if not name_elem:
-                name_elem = item.find('a')
+            # Both formats below need "City, State / School" - an item
+            # without a slash can't give us anything, so don't search it
+            item_text = item.text_content()
+            if '/' not in item_text:
+                return None
 
-            if not name_elem:
+            # Extract name (and find the hometown element in the same pass)
+            name_elem, hometown_elem = self._find_roster_elements(item)
+
+            if name_elem is None:
                 return None
 
-            full_name = name_elem.get_text(strip=True)
+            full_name = name_elem.text_content().strip()
             name_parts = full_name.split()
             if len(name_parts) < 2:
                 return None
@@ -204,15 +329,15 @@ class CollegeRosterBioEnricher(BaseScraper):
             first_name = name_parts[0]
             last_name = ' '.join(name_parts[1:])
 
+            # Already fully enriched - skip the hometown parsing and matching
+            if Player.make_name_key(first_name, last_name) in self._complete_names:
+                return {}
+
             # Extract hometown/high school
             # Common format: "Dallas, Texas / Highland Park"
-            hometown_elem = item.find(['span', 'div', 'td'],
-                class_=re.compile(r'hometown|hs|high.?school|location', re.I))
-
-            if not hometown_elem:
+            if hometown_elem is None:
                 # Look in text
-                item_text = item.get_text()
-                hometown_match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+)\s*/\s*([A-Za-z\s\'-]+)', item_text)
+                hometown_match = ITEM_HOMETOWN_RE.search(item_text)
                 if hometown_match:
                     return {
                         'first_name': first_name,
@@ -224,7 +349,7 @@ class CollegeRosterBioEnricher(BaseScraper):
                     }
                 return None
 
-            hometown_text = hometown_elem.get_text(strip=True)
+            hometown_text = hometown_elem.text_content().strip()
 
             # Parse "City, State / High School" format
             if '/' in hometown_text:
@@ -251,6 +376,36 @@ class CollegeRosterBioEnricher(BaseScraper):
             self.logger.debug(f"Error parsing roster item: {e}")
             return None
 
+    def _find_roster_elements(self, item) -> Tuple[Optional[Any], Optional[Any]]:
+        """
+        Find a roster item's name and hometown elements in one walk.
+
+        - name: the first a/span/div with a name-like class, otherwise the
+          first link
+        - hometown: the first span/div/td with a hometown-like class
+
+        Returns:
+            Tuple of (name element, hometown element); either may be None
+        """
+        name_elem = None
+        first_link = None
+        hometown_elem = None
+
+        for element in item.iterdescendants('a', 'span', 'div', 'td'):
+            tag = element.tag
+
+            if name_elem is None and tag != 'td' and self.class_matches(element, NAME_CLASS_RE):
+                name_elem = element
+            if first_link is None and tag == 'a':
+                first_link = element
+            if hometown_elem is None and tag != 'a' and self.class_matches(element, HOMETOWN_CLASS_RE):
+                hometown_elem = element
+
+            if name_elem is not None and hometown_elem is not None:
+                break
+
+        return (name_elem if name_elem is not None else first_link), hometown_elem
+
     def _format_high_school(self, name: str) -> str:
         """Ensure high school name ends with 'High School'."""
         if not name:
@@ -260,59 +415,156 @@ class CollegeRosterBioEnricher(BaseScraper):
             return f"{name} High School"
         return name
 
-    def _match_and_update_player(self, session, roster_data: Dict) -> bool:
+    def _load_complete_names(self) -> Set[str]:
         """
-        Try to find a player in our database and update their bio.
+        Get the names of players that already have every bio field set.
 
-        Returns True if player was found and updated.
+        A name only counts if every player with that name is complete,
+        since matching could pick any of them.
+
+        Returns:
+            Set of name_key values (see Player.make_name_key)
         """
-        first_name = roster_data.get('first_name', '')
-        last_name = roster_data.get('last_name', '')
+        complete = set()
+        incomplete = set()
 
-        if not first_name or not last_name:
+        with self.db.get_session() as session:
+            rows = session.query(
+                Player.name_key,
+                *(getattr(Player, field) for field in BIO_FIELDS)
+            ).all()
+
+        for key, *fields in rows:
+            (complete if all(fields) else incomplete).add(key)
+
+        return complete - incomplete
+
+    def _build_player_index(
+        self,
+        session,
+        roster_data: List[Dict]
+    ) -> Tuple[Dict[str, Player], Dict[str, List[Tuple[str, Player]]]]:
+        """
+        Load every player who could match a roster row.
+
+        Exact matches come from one IN query on the indexed name_key
+        column. Roster rows left over still need the partial match (same
+        first name, longer last name), so their first names are looked up
+        in a second query - skipped when everything matched exactly.
+
+        Each roster row gets its name_key stored under 'name_key', so
+        _match_and_update_player() doesn't rebuild it.
+
+        Returns:
+            Tuple of:
+            - index: {name_key: Player}
+            - by_first_name: {first: [(last, Player), ...]} for partial
+              matches, with names lowercased
+
+        For Junior Developers:
+        ---------------------
+        Looking up each roster player separately would mean hundreds of
+        tiny queries. Loading the candidates up front and matching them in
+        Python dictionaries keeps it to at most two round trips.
+        """
+        for d in roster_data:
+            if d.get('first_name') and d.get('last_name'):
+                d['name_key'] = Player.make_name_key(d['first_name'], d['last_name'])
+
+        keys = {d['name_key'] for d in roster_data if 'name_key' in d}
+
+        index = {}
+        by_first_name = defaultdict(list)
+        if not keys:
+            return index, by_first_name
+
+        for player in session.query(Player).filter(
+            Player.name_key.in_(keys)
+        ).order_by(Player.player_id):
+            index.setdefault(player.name_key, player)
+
+        first_names = {key.partition('|')[0] for key in keys - index.keys()}
+        if not first_names:
+            return index, by_first_name
+
+        candidates = session.query(Player).filter(
+            func.lower(Player.first_name).in_(first_names)
+        ).order_by(Player.player_id)
+
+        for player in candidates:
+            first, _, last = player.name_key.partition('|')
+            by_first_name[first].append((last, player))
+
+        return index, by_first_name
+
+    def _match_and_update_player(
+        self,
+        index: Dict[str, Player],
+        by_first_name: Dict[str, List[Tuple[str, Player]]],
+        roster_data: Dict,
+        updates: Dict[int, Dict[str, Any]],
+        run_ts: datetime
+    ) -> bool:
+        """
+        Try to find a player in our database and queue a bio update.
+
+        Only empty fields are filled in. Changes are added to `updates`
+        (keyed by player_id) instead of being set on the Player, so the
+        caller can write all of them with a single UPDATE.
+
+        Args:
+            index: Exact-name lookup from _build_player_index()
+            by_first_name: First-name lookup from _build_player_index()
+            roster_data: One player dictionary from a roster page
+            updates: Pending changes, updated in place
+            run_ts: bio_last_updated value for this run
+
+        Returns True if player was found and updated.
+        """
+        name_key = roster_data.get('name_key')
+        if not name_key:
             return False
 
         # Find player by name
-        player = session.query(Player).filter_by(
-            first_name=first_name,
-            last_name=last_name
-        ).first()
+        player = index.get(name_key)
 
         if not player:
             # Try partial match (some names might have middle names)
-            player = session.query(Player).filter(
-                Player.first_name == first_name,
-                Player.last_name.ilike(f"%{last_name}%")
-            ).first()
+            first_key, _, last_key = name_key.partition('|')
+            player = next(
+                (p for last, p in by_first_name.get(first_key, ())
+                 if last_key in last),
+                None
+            )
 
         if not player:
             return False
 
-        # Update bio data
-        updated = False
-
-        if roster_data.get('high_school_name') and not player.high_school_name:
-            player.high_school_name = roster_data['high_school_name']
-            updated = True
-            self.logger.info(f"Updated {first_name} {last_name} high school: {roster_data['high_school_name']}")
-
-        if roster_data.get('hometown_city') and not player.hometown_city:
-            player.hometown_city = roster_data['hometown_city']
-            updated = True
+        # Update bio data (fields another roster row already filled count as set)
+        pending = updates.get(player.player_id, {})
+        changes = {
+            field: roster_data[field]
+            for field in BIO_FIELDS
+            if roster_data.get(field)
+            and not getattr(player, field)
+            and field not in pending
+        }
 
-        if roster_data.get('hometown_state') and not player.hometown_state:
-            player.hometown_state = roster_data['hometown_state']
-            updated = True
+        if not changes:
+            return False
 
-        if roster_data.get('college_name') and not player.college_name:
-            player.college_name = roster_data['college_name']
-            updated = True
+        if 'high_school_name' in changes:
+            self.logger.info(f"Updated {roster_data['first_name']} {roster_data['last_name']} high school: {changes['high_school_name']}")
 
-        if updated:
-            player.bio_source_name = 'college_roster'
-            player.bio_last_updated = datetime.utcnow()
+        updates[player.player_id] = {
+            'player_id': player.player_id,
+            **pending,
+            **changes,
+            'bio_source_name': 'college_roster',
+            'bio_last_updated': run_ts,
+        }
 
-        return updated
+        return True
 
 
 def enrich_from_college_rosters() -> Dict[str, Any]:
@@ -11,19 +11,137 @@ This is effective because:
 3. Can search specifically for "high school" or "hometown"
 """
 
-from typing import Dict, Any, Optional, List
+from typing import AbstractSet, Dict, Any, Optional, Iterator, Sequence, Tuple
 from datetime import datetime
 import re
-import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from loguru import logger
-from bs4 import BeautifulSoup
 
-from scrapers.base_scraper import BaseScraper
+from config.settings import Config
+from scrapers.base_scraper import BaseScraper, utc_now
+from scrapers.http_cache import CachedPage
 from database.models import Player
 
 
+# Building blocks for the snippet patterns: a name of one to four words of
+# at most 25 letters. The old open-ended [A-Za-z\s]+ runs could be retried
+# from every position of a long snippet (quadratic backtracking); bounded
+# runs keep each search linear. Where a comma must follow, the run is
+# wrapped in an atomic group (?>...) so the engine never backtracks into
+# it - a name can't contain a comma, so giving back words could never help.
+_PLACE = r"[A-Z][A-Za-z]{0,24}(?:\s+[A-Za-z]{1,25}){0,3}"
+_PLACE_BEFORE_COMMA = r"(?>" + _PLACE + r")"
+_SCHOOL = r"[A-Z][A-Za-z']{0,24}(?:\s+[A-Za-z']{1,25}){0,3}"
+
+# Patterns for extracting information from search snippets.
+# Compiled once here instead of on every re.search() call, since they are
+# run against every snippet of every search.
+HIGH_SCHOOL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    # "attended Highland Park High School"
+    r'attended\s+(' + _SCHOOL + r')\s+High\s+School',
+    # "graduated from Highland Park High School"
+    r'graduated\s+(?:from\s+)?(' + _SCHOOL + r')\s+High\s+School',
+    # "Highland Park High School in Dallas"
+    r'(' + _SCHOOL + r')\s+High\s+School\s+in\s+(' + _PLACE + r')',
+    # Just "Highland Park High School"
+    r'(' + _SCHOOL + r')\s+High\s+School',
+    # "went to Highland Park HS"
+    r'(?:went to|attended)\s+(' + _SCHOOL + r')\s+(?:HS|H\.S\.)',
+])
+
+HOMETOWN_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    # "from Dallas, Texas"
+    r'(?:from|hails from|native of)\s+(' + _PLACE_BEFORE_COMMA + r'),\s+(' + _PLACE + r')',
+    # "born in Dallas, Texas"
+    r'born\s+(?:and raised\s+)?in\s+(' + _PLACE_BEFORE_COMMA + r'),\s+(' + _PLACE + r')',
+    # "raised in Dallas, Texas"
+    r'raised\s+in\s+(' + _PLACE_BEFORE_COMMA + r'),\s+(' + _PLACE + r')',
+    # "grew up in Dallas, Texas"
+    r'grew\s+up\s+in\s+(' + _PLACE_BEFORE_COMMA + r'),\s+(' + _PLACE + r')',
+    # "hometown of Dallas, Texas" or "hometown: Dallas, Texas"
+    r'hometown\s*(?:of|:)\s*(' + _PLACE_BEFORE_COMMA + r'),\s+(' + _PLACE + r')',
+    # "Dallas, Texas native"
+    r'(' + _PLACE_BEFORE_COMMA + r'),\s+(' + _PLACE + r')\s+native',
+])
+
+COLLEGE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    # "played golf at Texas"
+    r'played\s+(?:golf\s+)?(?:at|for)\s+(' + _PLACE + r'\s*(?:University|College|State))',
+    # "attended University of Texas"
+    r'attended\s+(University\s+of\s+' + _PLACE + r'|' + _PLACE + r'\s+University)',
+    # "Texas Longhorns golf"
+    r'(' + _PLACE + r')\s+(?:Longhorns|Bulldogs|Tigers|Gators|Wildcats)\s+golf',
+    # Just "University of Texas" or "Texas A&M"
+    r'(University\s+of\s+' + _PLACE + r')',
+    r'(' + _PLACE + r'\s*(?:University|College|State))',
+])
+
+# "<school name> ... in Dallas, Texas" - matched from the end of the school
+# name (see _extract_location_near_school), with the gap after it bounded
+# so a miss can't scan the rest of the snippet from every occurrence
+_LOCATION_AFTER_SCHOOL_RE = re.compile(
+    r'.{0,80}?(?:High School\s+)?in\s+(' + _PLACE_BEFORE_COMMA + r'),\s*([A-Z][A-Za-z]{0,24})',
+    re.IGNORECASE
+)
+
+# DuckDuckGo HTML result markup
+RESULT_TITLE_CLASS = 'result__a'
+RESULT_SNIPPET_CLASS = 'result__snippet'
+
+# Result snippet containers (fallback when the standard classes change)
+SNIPPET_CLASS_RE = re.compile(r'snippet|abstract|desc', re.IGNORECASE)
+
+# Player columns this enricher can fill in
+PLAYER_BIO_FIELDS = (
+    'high_school_name', 'high_school_city', 'high_school_state',
+    'hometown_city', 'hometown_state', 'college_name',
+)
+
+# Words a hometown regex sometimes captures instead of a city
+INVALID_CITY_WORDS = frozenset({
+    'the', 'and', 'high', 'school', 'golf', 'tour', 'pga',
+    'lpga', 'college', 'university', 'played', 'born', 'raised'
+})
+
+# Helpers for cleaning extracted names
+_WS_RE = re.compile(r'\s+')
+_PAREN_RE = re.compile(r'\s*\([^)]+\)')
+# School name cleanup in a single pass: drop a leading "the"/"a", cut
+# everything from "High School"/"HS" on, and collapse whitespace runs
+_SCHOOL_CLEAN_RE = re.compile(
+    r'^(?:the|a)\s+|\s*(?:high school|hs|h\.s\.).*$|(?P<ws>\s+)',
+    re.IGNORECASE
+)
+
+
+def _combine_patterns(patterns) -> re.Pattern:
+    """Join compiled patterns into one regex that matches if any of them would."""
+    return re.compile(
+        '|'.join(f'(?:{p.pattern})' for p in patterns),
+        re.IGNORECASE
+    )
+
+
+def _matching_snippets(snippets: Sequence[str], combined: re.Pattern) -> Iterator[str]:
+    """
+    Yield only the snippets that match a combined pattern.
+
+    The individual patterns are still tried in priority order on the
+    snippets that pass: a single alternation would return whichever
+    pattern matches furthest left, so e.g. the broad "X High School"
+    pattern would beat "attended X High School" and capture "attended".
+    """
+    return (snippet for snippet in snippets if combined.search(snippet))
+
+
+def _school_clean_replacement(match: re.Match) -> str:
+    """Replacement for _SCHOOL_CLEAN_RE: whitespace becomes one space, the rest is dropped."""
+    return ' ' if match.lastgroup == 'ws' else ''
+
+
 class DuckDuckGoEnricher(BaseScraper):
     """
     Enriches player bio data by searching DuckDuckGo.
@@ -38,6 +156,19 @@ class DuckDuckGoEnricher(BaseScraper):
 
     scrape_type = 'player_bio'
 
+    # Parse result pages with lxml directly (see BaseScraper)
+    parse_mode = 'lxml'
+
+    # Players searched in parallel (requests are still spaced out globally)
+    SEARCH_WORKERS = max(1, Config.BIO_SEARCH_WORKERS)
+
+    # DuckDuckGo blocks fast clients - keep its searches well apart
+    # (see BaseScraper._rate_limit)
+    host_delays = {'html.duckduckgo.com': 2.0}
+
+    # Reuse pages fetched in the last few days without re-requesting them
+    cache_max_age = Config.BIO_CACHE_MAX_AGE_DAYS * 86400 or None
+
     def __init__(self):
         super().__init__('DDG', 'https://html.duckduckgo.com')
         self.logger = logger.bind(scraper='DuckDuckGoEnricher')
@@ -45,50 +176,21 @@ class DuckDuckGoEnricher(BaseScraper):
         # DuckDuckGo HTML search endpoint (no API key needed)
         self.search_url = 'https://html.duckduckgo.com/html/'
 
-        # Rate limiting - be respectful
-        self.request_delay = 2  # seconds between requests
-        self.last_request_time = 0
-
         # Patterns for extracting information from search snippets
-        self.high_school_patterns = [
-            # "attended Highland Park High School"
-            r'attended\s+([A-Z][A-Za-z\'\s]+)\s+High\s+School',
-            # "graduated from Highland Park High School"
-            r'graduated\s+(?:from\s+)?([A-Z][A-Za-z\'\s]+)\s+High\s+School',
-            # "Highland Park High School in Dallas"
-            r'([A-Z][A-Za-z\'\s]+)\s+High\s+School\s+in\s+([A-Z][A-Za-z\s]+)',
-            # Just "Highland Park High School"
-            r'([A-Z][A-Za-z\'\s]+)\s+High\s+School',
-            # "went to Highland Park HS"
-            r'(?:went to|attended)\s+([A-Z][A-Za-z\'\s]+)\s+(?:HS|H\.S\.)',
-        ]
-
-        self.hometown_patterns = [
-            # "from Dallas, Texas"
-            r'(?:from|hails from|native of)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            # "born in Dallas, Texas"
-            r'born\s+(?:and raised\s+)?in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            # "raised in Dallas, Texas"
-            r'raised\s+in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            # "grew up in Dallas, Texas"
-            r'grew\s+up\s+in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            # "hometown of Dallas, Texas" or "hometown: Dallas, Texas"
-            r'hometown\s*(?:of|:)\s*([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            # "Dallas, Texas native"
-            r'([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)\s+native',
-        ]
-
-        self.college_patterns = [
-            # "played golf at Texas"
-            r'played\s+(?:golf\s+)?(?:at|for)\s+([A-Z][A-Za-z\s]+(?:University|College|State))',
-            # "attended University of Texas"
-            r'attended\s+(University\s+of\s+[A-Za-z\s]+|[A-Z][A-Za-z\s]+\s+University)',
-            # "Texas Longhorns golf"
-            r'([A-Z][A-Za-z\s]+)\s+(?:Longhorns|Bulldogs|Tigers|Gators|Wildcats)\s+golf',
-            # Just "University of Texas" or "Texas A&M"
-            r'(University\s+of\s+[A-Za-z\s]+)',
-            r'([A-Z][A-Za-z\s]+(?:University|College|State))',
-        ]
+        # (compiled once at module level - see HIGH_SCHOOL_PATTERNS etc.)
+        self.high_school_patterns = HIGH_SCHOOL_PATTERNS
+        self.hometown_patterns = HOMETOWN_PATTERNS
+        self.college_patterns = COLLEGE_PATTERNS
+
+        # One combined regex per field, used to skip snippets that can't
+        # match any of its patterns with a single scan (see _matching_snippets)
+        self._any_high_school = _combine_patterns(self.high_school_patterns)
+        self._any_hometown = _combine_patterns(self.hometown_patterns)
+        self._any_college = _combine_patterns(self.college_patterns)
+
+        # Search results memoized for this run (see _search_ddg). Tuples are
+        # cached rather than lists so a caller can't mutate a cached entry.
+        self._cached_search = lru_cache(maxsize=4096)(self._fetch_snippets)
 
     def scrape(self, **kwargs) -> Dict[str, Any]:
         """Main scrape method."""
@@ -119,59 +221,80 @@ class DuckDuckGoEnricher(BaseScraper):
             players = query.limit(limit).all()
             self.logger.info(f"Found {len(players)} players to enrich")
 
-            for player in players:
-                try:
-                    success = self._enrich_player(session, player)
-                    results['processed'] += 1
-
-                    if success:
-                        results['enriched'] += 1
-                    else:
-                        results['not_found'] += 1
-
-                except Exception as e:
-                    self.logger.error(f"Error enriching {player.first_name} {player.last_name}: {e}")
-                    results['errors'].append(str(e))
+            # Every player updated in this run gets the same timestamp
+            run_ts = utc_now()
+
+            # Search for several players at once. Requests still go out one
+            # at a time (see host_delays), but one player's parsing and
+            # cache hits overlap with another's wait, instead of every
+            # player waiting for the previous one to finish.
+            # Each player only gets the searches for fields they're missing
+            with ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS) as executor:
+                searches = [
+                    executor.submit(
+                        self.search_player,
+                        f"{player.first_name} {player.last_name}",
+                        {field for field in PLAYER_BIO_FIELDS if not getattr(player, field)}
+                    )
+                    for player in players
+                ]
+
+                # Database updates stay on this thread, in player order
+                for player, search in zip(players, searches):
+                    try:
+                        success = self._enrich_player(player, search.result(), run_ts)
+                        results['processed'] += 1
+
+                        if success:
+                            results['enriched'] += 1
+                        else:
+                            results['not_found'] += 1
+
+                    except Exception as e:
+                        self.logger.error(f"Error enriching {player.first_name} {player.last_name}: {e}")
+                        results['errors'].append(str(e))
 
         self.logger.info(f"Enrichment complete: {results['enriched']}/{results['processed']} enriched")
         return results
 
-    def _rate_limit(self):
-        """Ensure we don't hit DuckDuckGo too fast."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
-
-    def search_player(self, player_name: str) -> Dict[str, Any]:
+    def search_player(
+        self,
+        player_name: str,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Any]:
         """
         Search DuckDuckGo for player bio information.
 
         Args:
             player_name: Full name of the player
+            wanted: Player fields that are still empty (see PLAYER_BIO_FIELDS).
+                Searches that can't fill any of them are skipped. None
+                (the default) runs every search.
 
         Returns:
             Dictionary with extracted bio data
         """
         bio_data = {}
 
+        def needs(*fields: str) -> bool:
+            return wanted is None or not wanted.isdisjoint(fields)
+
         # Search for high school info
-        hs_results = self._search_ddg(f"{player_name} high school golf")
-        if hs_results:
-            hs_data = self._extract_high_school(hs_results)
-            bio_data.update(hs_data)
+        if needs('high_school_name', 'high_school_city', 'high_school_state'):
+            hs_results = self._search_ddg(f"{player_name} high school golf")
+            if hs_results:
+                hs_data = self._extract_high_school(hs_results)
+                bio_data.update(hs_data)
 
         # Search for hometown if not found from high school search
-        if 'hometown_city' not in bio_data:
-            self._rate_limit()
+        if 'hometown_city' not in bio_data and needs('hometown_city', 'hometown_state'):
             hometown_results = self._search_ddg(f"{player_name} golfer hometown")
             if hometown_results:
                 hometown_data = self._extract_hometown(hometown_results)
                 bio_data.update(hometown_data)
 
         # Search for college if not found
-        if 'college_name' not in bio_data:
-            self._rate_limit()
+        if 'college_name' not in bio_data and needs('college_name'):
             college_results = self._search_ddg(f"{player_name} college golf")
             if college_results:
                 college_data = self._extract_college(college_results)
@@ -179,73 +302,108 @@ class DuckDuckGoEnricher(BaseScraper):
 
         return bio_data
 
-    def _search_ddg(self, query: str) -> Optional[List[str]]:
+    def _search_ddg(self, query: str) -> Optional[Tuple[str, ...]]:
         """
         Search DuckDuckGo and return result snippets.
 
+        Repeated queries in the same run (compared case- and
+        whitespace-insensitively) are answered from memory.
+
         Args:
             query: Search query
 
         Returns:
-            List of result snippets, or None if failed
+            Tuple of result snippets, or None if failed
         """
-        self._rate_limit()
-
+        # A failed search raises out of the lru_cache, so it isn't
+        # remembered - the next player with the same query tries again
         try:
-            # Use DuckDuckGo HTML search
-            params = {
-                'q': query,
-                'b': '',  # Start from beginning
-                'kl': 'us-en',  # US English
-            }
-
-            # Build URL with params
-            url = f"{self.search_url}?{urllib.parse.urlencode(params)}"
-
-            self.logger.debug(f"Searching DDG: {query}")
-
-            soup = self.get_page(url)
-            if not soup:
-                return None
-
-            # Extract result snippets
-            snippets = []
+            return self._cached_search(' '.join(query.lower().split()))
+        except Exception as e:
+            self.logger.debug(f"DDG search failed for '{query}': {e}")
+            return None
 
-            # DuckDuckGo HTML results are in divs with class "result"
-            results = soup.find_all('div', class_='result')
+    def _fetch_snippets(self, query: str) -> Optional[Tuple[str, ...]]:
+        """
+        Run a DuckDuckGo search (uncached - use _search_ddg()).
 
-            for result in results[:10]:  # Check first 10 results
-                # Get the snippet text
-                snippet_elem = result.find('a', class_='result__snippet')
-                if snippet_elem:
-                    snippets.append(snippet_elem.get_text(strip=True))
+        Rate limiting happens in iter_page() / get_page() (see host_delays),
+        so searches answered from the HTTP cache don't wait.
 
-                # Also check result title
-                title_elem = result.find('a', class_='result__a')
-                if title_elem:
-                    snippets.append(title_elem.get_text(strip=True))
+        Raises:
+            A request or parse error if the search page couldn't be read
+        """
+        # Use DuckDuckGo HTML search
+        params = {
+            'q': query,
+            'b': '',  # Start from beginning
+            'kl': 'us-en',  # US English
+        }
 
-            # Also try alternative selectors
+        # Build URL with params
+        url = f"{self.search_url}?{urllib.parse.urlencode(params)}"
+
+        self.logger.debug(f"Searching DDG: {query}")
+
+        # Stream the page, looking only at links: each DuckDuckGo result
+        # is an <a class="result__a"> title followed by an
+        # <a class="result__snippet">. The raw body is kept for the
+        # fallback below, but the full page tree is only built if needed.
+        snippets = []
+        pending_title = None
+        results_seen = 0
+        body = []
+
+        for link in self.iter_page(url, 'a', raise_errors=True, body=body):
+            classes = (link.get('class') or '').split()
+
+            if RESULT_TITLE_CLASS in classes:
+                # A new result: the previous one had no snippet
+                if pending_title:
+                    snippets.append(pending_title)
+                pending_title = None
+
+                results_seen += 1
+                if results_seen <= 10:  # Check first 10 results
+                    pending_title = ''.join(link.itertext()).strip()
+
+            elif RESULT_SNIPPET_CLASS in classes and results_seen <= 10:
+                # Snippet first, then its title
+                snippets.append(''.join(link.itertext()).strip())
+                if pending_title:
+                    snippets.append(pending_title)
+                pending_title = None
+
+        if pending_title:
+            snippets.append(pending_title)
+
+        # Also try alternative selectors, on the full tree of the body
+        # just streamed (no second request)
+        if not snippets:
+            page = CachedPage(url, b''.join(body), None, None, None)
+            tree = self._parse_html(url, page)
+            for elem in self.find_by_class(tree, ('div', 'span'), SNIPPET_CLASS_RE):
+                text = elem.text_content().strip()
+                if len(text) > 20:
+                    snippets.append(text)
+
+            # A page with no results at all (an anomaly page, or a
+            # search that really found nothing) isn't worth keeping
             if not snippets:
-                for elem in soup.find_all(['div', 'span'], class_=re.compile(r'snippet|abstract|desc', re.I)):
-                    text = elem.get_text(strip=True)
-                    if len(text) > 20:
-                        snippets.append(text)
-
-            return snippets if snippets else None
+                if self.http_cache:
+                    self.http_cache.delete(url)
+                return None
 
-        except Exception as e:
-            self.logger.debug(f"DDG search failed for '{query}': {e}")
-            return None
+        return tuple(snippets)
 
-    def _extract_high_school(self, snippets: List[str]) -> Dict[str, Any]:
+    def _extract_high_school(self, snippets: Sequence[str]) -> Dict[str, Any]:
         """Extract high school info from search snippets."""
         data = {}
 
-        for snippet in snippets:
+        for snippet in _matching_snippets(snippets, self._any_high_school):
             # Try each pattern
             for pattern in self.high_school_patterns:
-                match = re.search(pattern, snippet, re.IGNORECASE)
+                match = pattern.search(snippet)
                 if match:
                     school_name = match.group(1).strip()
 
@@ -270,25 +428,25 @@ class DuckDuckGoEnricher(BaseScraper):
 
         return data
 
-    def _extract_hometown(self, snippets: List[str]) -> Dict[str, Any]:
+    def _extract_hometown(self, snippets: Sequence[str]) -> Dict[str, Any]:
         """Extract hometown info from search snippets."""
         data = {}
 
-        for snippet in snippets:
+        for snippet in _matching_snippets(snippets, self._any_hometown):
             for pattern in self.hometown_patterns:
-                match = re.search(pattern, snippet, re.IGNORECASE)
+                match = pattern.search(snippet)
                 if match:
                     city = match.group(1).strip()
 
                     # Clean up
-                    city = re.sub(r'\s+', ' ', city).strip()
+                    city = _WS_RE.sub(' ', city).strip()
 
                     if city and len(city) > 2 and not self._is_invalid_city(city):
                         data['hometown_city'] = city
 
                         if match.lastindex >= 2:
                             state = match.group(2).strip()
-                            state = re.sub(r'\s+', ' ', state).strip()
+                            state = _WS_RE.sub(' ', state).strip()
                             if state and len(state) >= 2:
                                 data['hometown_state'] = state
 
@@ -296,19 +454,19 @@ class DuckDuckGoEnricher(BaseScraper):
 
         return data
 
-    def _extract_college(self, snippets: List[str]) -> Dict[str, Any]:
+    def _extract_college(self, snippets: Sequence[str]) -> Dict[str, Any]:
         """Extract college info from search snippets."""
         data = {}
 
-        for snippet in snippets:
+        for snippet in _matching_snippets(snippets, self._any_college):
             for pattern in self.college_patterns:
-                match = re.search(pattern, snippet, re.IGNORECASE)
+                match = pattern.search(snippet)
                 if match:
                     college = match.group(1).strip()
 
                     # Clean up
-                    college = re.sub(r'\s+', ' ', college).strip()
-                    college = re.sub(r'\s*\([^)]+\)', '', college)  # Remove parenthetical
+                    college = _WS_RE.sub(' ', college).strip()
+                    college = _PAREN_RE.sub('', college)  # Remove parenthetical
 
                     if college and len(college) > 3:
                         data['college_name'] = college
@@ -320,21 +478,26 @@ class DuckDuckGoEnricher(BaseScraper):
         """Try to extract location mentioned near the school name."""
         data = {}
 
-        # Pattern: "School Name in City, State"
-        pattern = rf'{re.escape(school_name)}.*?(?:High School\s+)?in\s+([A-Z][A-Za-z\s]+),\s*([A-Z][A-Za-z]+)'
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data['high_school_city'] = match.group(1).strip()
-            data['high_school_state'] = match.group(2).strip()
+        # Pattern: "School Name in City, State" - the school name changes
+        # every call, so find it with a plain string search and only run
+        # the precompiled pattern from the end of each occurrence
+        lower_text = text.lower()
+        lower_school = school_name.lower()
+        start = lower_text.find(lower_school) if lower_school else -1
+        while start != -1:
+            match = _LOCATION_AFTER_SCHOOL_RE.match(text, start + len(lower_school))
+            if match:
+                data['high_school_city'] = match.group(1).strip()
+                data['high_school_state'] = match.group(2).strip()
+                break
+            start = lower_text.find(lower_school, start + 1)
 
         return data
 
     def _clean_school_name(self, name: str) -> str:
         """Clean up a school name."""
-        # Remove common prefixes/suffixes
-        name = re.sub(r'^(the|a)\s+', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*(high school|hs|h\.s\.).*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+', ' ', name).strip()
+        # Remove common prefixes/suffixes and normalize spacing
+        name = _SCHOOL_CLEAN_RE.sub(_school_clean_replacement, name).strip()
 
         # Remove trailing punctuation
         name = name.rstrip('.,;:')
@@ -343,20 +506,20 @@ class DuckDuckGoEnricher(BaseScraper):
 
     def _is_invalid_city(self, city: str) -> bool:
         """Check if a string is unlikely to be a valid city name."""
-        invalid_words = [
-            'the', 'and', 'high', 'school', 'golf', 'tour', 'pga',
-            'lpga', 'college', 'university', 'played', 'born', 'raised'
-        ]
-        city_lower = city.lower()
-        return any(word == city_lower for word in invalid_words)
-
-    def _enrich_player(self, session, player: Player) -> bool:
-        """Enrich a single player record."""
+        return city.lower() in INVALID_CITY_WORDS
+
+    def _enrich_player(self, player: Player, bio_data: Dict[str, Any], run_ts: datetime) -> bool:
+        """
+        Enrich a single player record from search_player() results.
+
+        Args:
+            player: The player to update
+            bio_data: What search_player() found for them
+            run_ts: bio_last_updated value for this run
+        """
         full_name = f"{player.first_name} {player.last_name}"
         self.logger.debug(f"Enriching via DDG: {full_name}")
 
-        bio_data = self.search_player(full_name)
-
         if not bio_data:
             return False
 
@@ -385,7 +548,7 @@ class DuckDuckGoEnricher(BaseScraper):
 
         if updated:
             player.bio_source_name = 'duckduckgo'
-            player.bio_last_updated = datetime.utcnow()
+            player.bio_last_updated = run_ts
             self.logger.info(f"Enriched {full_name} via DuckDuckGo search")
 
         return updated
@@ -20,19 +20,146 @@ what a human would do - search for "Scottie Scheffler high school"
 and find the info in search result snippets.
 """
 
-from typing import Dict, Any, Optional
+from typing import AbstractSet, Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import re
-import time
+import unicodedata
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from loguru import logger
 from bs4 import BeautifulSoup
+import orjson
+from sqlalchemy import update
+from sqlalchemy.orm import load_only
 
-from scrapers.base_scraper import BaseScraper
+from config.settings import Config
+from scrapers.base_scraper import BaseScraper, utc_now
 from database.models import Player
 
 
+# Bump when a source's extraction changes, so older cached lookups are ignored
+LOOKUP_CACHE_VERSION = 3
+
+# Player columns a source can fill in (only when empty)
+BIO_FIELDS = (
+    'high_school_name', 'high_school_city', 'high_school_state',
+    'hometown_city', 'hometown_state', 'college_name',
+)
+
+# A source only counts as a hit if it found one of these
+PRIMARY_BIO_FIELDS = frozenset({'high_school_name', 'hometown_city'})
+
+# Fields that are only meaningful together (the city and state of the same
+# hometown), so they are always taken from one source. The first field of
+# each group decides whether a source has it.
+BIO_FIELD_GROUPS = (
+    ('high_school_name', 'high_school_city', 'high_school_state'),
+    ('hometown_city', 'hometown_state'),
+    ('college_name',),
+)
+
+# Patterns for extracting bio details from search snippets and pages.
+# Compiled once here instead of on every re.search() call, since they are
+# run against every snippet (or paragraph) of every lookup.
+SNIPPET_HIGH_SCHOOL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'attended\s+([A-Z][A-Za-z\'\s]+)\s+High\s+School',
+    r'graduated\s+(?:from\s+)?([A-Z][A-Za-z\'\s]+)\s+High\s+School',
+    r'([A-Z][A-Za-z\'\s]+)\s+High\s+School\s+in\s+([A-Z][A-Za-z\s]+)',
+    r'([A-Z][A-Za-z\'\s]+)\s+High\s+School',
+])
+
+SNIPPET_HOMETOWN_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'(?:from|hails from|native of)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+    r'born\s+(?:and raised\s+)?in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+    r'raised\s+in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+    r'hometown[:\s]+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+])
+
+SNIPPET_COLLEGE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'played\s+(?:golf\s+)?(?:at|for)\s+([A-Z][A-Za-z\s]+(?:University|College|State))',
+    r'attended\s+(University\s+of\s+[A-Za-z\s]+|[A-Z][A-Za-z\s]+\s+University)',
+    r'(University\s+of\s+[A-Za-z\s]+)',
+])
+
+# Text every pattern of a snippet field needs somewhere in the snippet.
+# Searching for this fixed text is far cheaper than running the patterns
+# above, whose leading [A-Za-z\s]+ runs get retried from every position -
+# so most snippets (which mention none of it) cost a single fast scan.
+SNIPPET_HIGH_SCHOOL_HINT = re.compile(r'high\s+school', re.IGNORECASE)
+SNIPPET_HOMETOWN_HINT = re.compile(r',')
+SNIPPET_COLLEGE_HINT = re.compile(r'university|college|state', re.IGNORECASE)
+
+WIKI_HIGH_SCHOOL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    # "attended Highland Park High School"
+    r'attended\s+([A-Z][A-Za-z\'\s-]+)\s+High\s+School',
+    # "Highland Park High School in Dallas"
+    r'([A-Z][A-Za-z\'\s-]+)\s+High\s+School\s+in\s+([A-Z][A-Za-z\s]+)',
+    # "at Highland Park High School"
+    r'at\s+([A-Z][A-Za-z\'\s-]+)\s+High\s+School',
+    # "played ... at Highland Park High School" or "Highland Park High School"
+    r'([A-Z][A-Za-z\'\s-]+)\s+High\s+School',
+])
+
+# Case-sensitive on purpose: the capitalized place names anchor the match
+WIKI_HOMETOWN_PATTERNS = tuple(re.compile(p) for p in [
+    r'(?:from|raised in|grew up in|native of|hails from)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+    r'moved\s+to\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+    r'lives?\s+in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
+])
+
+# Words the Wikipedia high school patterns sometimes capture instead of a name
+WIKI_SCHOOL_FALSE_POSITIVES = frozenset({'the', 'a', 'an', 'his', 'her', 'their', 'junior'})
+
+ESPN_BIO_SECTION_CLASS_RE = re.compile(r'PlayerHeader|Bio', re.IGNORECASE)
+ESPN_INFO_TABLE_CLASS_RE = re.compile(r'PlayerBio|info', re.IGNORECASE)
+ESPN_HOMETOWN_RE = re.compile(r'(?:Birthplace|Hometown)[:\s]+([^,]+),\s*(\w+)')
+ESPN_COLLEGE_RE = re.compile(r'College[:\s]+(.+?)(?:\s*\(|$)')
+ESPN_SEARCH_URL = 'https://site.web.api.espn.com/apis/search/v2'
+# The ID in a search hit's player link (.../golf/player/_/id/9478/...) or
+# its uid ("s:1100~a:9478")
+ESPN_PLAYER_ID_RE = re.compile(r'/golf/player/_/id/(\d+)|~a:(\d+)')
+
+GROKEPEDIA_PLAYER_LINK_RE = re.compile(r'/player/|/golfer/', re.IGNORECASE)
+GROKEPEDIA_HIGH_SCHOOL_RE = re.compile(r'([A-Z][A-Za-z\'\s]+)\s+High\s+School')
+GROKEPEDIA_HOMETOWN_RE = re.compile(
+    r'(?:from|hometown|born in)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)', re.IGNORECASE
+)
+GROKEPEDIA_COLLEGE_RE = re.compile(
+    r'(?:attended|played for|college)\s+([A-Z][A-Za-z\s]+(?:University|College))', re.IGNORECASE
+)
+# Where a Grokepedia player page keeps its bio (most specific first), and
+# the elements inside it that hold the text
+GROKEPEDIA_BIO_SELECTORS = ('div.player-bio', 'section#about', 'main article', 'main')
+GROKEPEDIA_TEXT_BLOCKS = 'p, li, td, dd'
+# Shortest text any of the three Grokepedia patterns can match
+# ("from Ab, Cd" for the hometown pattern)
+GROKEPEDIA_MIN_MATCH_LENGTH = 11
+
+# Wikidata properties read when a Wikipedia article's text has no hometown
+# or college
+WIKIDATA_API_URL = 'https://www.wikidata.org/w/api.php'
+WIKIDATA_BIRTHPLACE = 'P19'
+WIKIDATA_EDUCATED_AT = 'P69'
+# "located in the administrative territorial entity" - followed up from the
+# birthplace (city -> county -> state -> country) to find its state
+WIKIDATA_LOCATED_IN = 'P131'
+WIKIDATA_MAX_ADMIN_LEVELS = 5
+WIKIDATA_COLLEGE_RE = re.compile(r'University|College|Institute', re.IGNORECASE)
+
+# DuckDuckGo fallback snippet containers
+DDG_SNIPPET_CLASS_RE = re.compile(r'snippet|abstract', re.IGNORECASE)
+
+# Bio details sit in the start of a snippet; the rest isn't scanned
+SNIPPET_MAX_CHARS = 400
+
+# Helpers for cleaning extracted names
+_WS_RE = re.compile(r'\s+')
+_PAREN_RE = re.compile(r'\s*\([^)]+\)')
+_QUOTE_MAP = str.maketrans({'\u2018': "'", '\u2019': "'"})
+
+
 class MultiSourceBioEnricher(BaseScraper):
     """
     Enriches player bio data from multiple sources.
@@ -46,14 +173,43 @@ class MultiSourceBioEnricher(BaseScraper):
 
     scrape_type = 'player_bio'
 
+    # Players looked up in parallel (each source still rate limits itself)
+    SEARCH_WORKERS = max(1, Config.BIO_SEARCH_WORKERS)
+
+    # Enriched players saved per database transaction
+    WRITE_BATCH_SIZE = 25
+
+    # Search result pages are only read this far (see get_page_head) - the
+    # results come first, the scripts and footer after
+    SEARCH_PAGE_BYTES = 65536
+
+    # Each source gets its own request spacing (see BaseScraper._rate_limit),
+    # so DuckDuckGo's slow pace doesn't hold up Wikipedia or ESPN lookups
+    host_delays = {
+        'html.duckduckgo.com': 2.0,
+        'en.wikipedia.org': 0.2,
+        'www.wikidata.org': 0.2,
+        'www.espn.com': 0.35,
+        'site.web.api.espn.com': 0.35,
+        'www.grokepedia.com': 1.0,
+    }
+
+    # Reuse pages fetched in the last few days without re-requesting them,
+    # and remember each source's answer per player for as long
+    # (see _cached_lookup). A source that found nothing is asked again
+    # sooner, after negative_cache_max_age.
+    cache_max_age = Config.BIO_CACHE_MAX_AGE_DAYS * 86400 or None
+    negative_cache_max_age = Config.BIO_NEGATIVE_CACHE_HOURS * 3600
+
     def __init__(self):
         super().__init__('BIO', 'https://en.wikipedia.org')
         self.logger = logger.bind(scraper='MultiSourceBioEnricher')
 
         # DuckDuckGo search settings
         self.ddg_search_url = 'https://html.duckduckgo.com/html/'
-        self.ddg_request_delay = 2  # seconds between DDG requests
-        self.last_ddg_request = 0
+
+        # Set per run by enrich_missing_bios(use_cache=...)
+        self.use_cache = True
 
         # Source configurations
         self.sources = [
@@ -83,15 +239,28 @@ class MultiSourceBioEnricher(BaseScraper):
         """Main scrape method - enriches players missing bio data."""
         limit = kwargs.get('limit', 50)
         force = kwargs.get('force', False)
-        return self.enrich_missing_bios(limit=limit, force=force)
-
-    def enrich_missing_bios(self, limit: int = 50, force: bool = False) -> Dict[str, Any]:
+        use_cache = kwargs.get('use_cache', True)
+        return self.enrich_missing_bios(limit=limit, force=force, use_cache=use_cache)
+
+    def enrich_missing_bios(
+        self,
+        limit: int = 50,
+        force: bool = False,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
         """
         Enrich players missing hometown or high school info.
 
         Tries multiple sources until we find the data.
+
+        Args:
+            limit: Maximum number of players to look up
+            force: Also look up players that already have bio data
+            use_cache: Reuse each source's remembered answers from earlier
+                runs (see _cached_lookup); False asks every source again
         """
         self.logger.info(f"Starting multi-source bio enrichment (limit={limit})")
+        self.use_cache = use_cache
 
         results = {
             'processed': 0,
@@ -102,8 +271,14 @@ class MultiSourceBioEnricher(BaseScraper):
         }
 
         with self.db.get_session() as session:
-            # Get players missing high school OR hometown info
-            query = session.query(Player)
+            # Get players missing high school OR hometown info. Only the
+            # columns the lookups and _update_player_bio() read are loaded
+            # (the rows are detached below, so these must cover every
+            # attribute used later).
+            query = session.query(Player).options(load_only(
+                Player.player_id, Player.first_name, Player.last_name, Player.espn_id,
+                *(getattr(Player, field) for field in BIO_FIELDS)
+            ))
 
             if not force:
                 query = query.filter(
@@ -112,17 +287,45 @@ class MultiSourceBioEnricher(BaseScraper):
                 )
 
             players = query.limit(limit).all()
-            self.logger.info(f"Found {len(players)} players to enrich")
 
-            for player in players:
+            # Detach the loaded rows so they stay readable after the session
+            # closes - the lookups below take minutes, and the database
+            # transaction shouldn't stay open that long
+            session.expunge_all()
+
+        self.logger.info(f"Found {len(players)} players to enrich")
+
+        # Column changes waiting to be written (see _write_updates)
+        updates: List[Dict[str, Any]] = []
+
+        # Every player enriched in this run gets the same timestamp
+        run_ts = utc_now()
+
+        # Look up several players at once. Almost all of the time per
+        # player is spent waiting on other websites, so while one
+        # player waits on DuckDuckGo another can be fetching Wikipedia.
+        with ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS) as executor:
+            lookups = [
+                executor.submit(
+                    self._find_bio,
+                    f"{player.first_name} {player.last_name}",
+                    player.espn_id,
+                    # Only look for what this player is still missing
+                    frozenset(field for field in BIO_FIELDS if not getattr(player, field))
+                )
+                for player in players
+            ]
+
+            # Results are collected on this thread, in player order
+            for player, lookup in zip(players, lookups):
                 try:
-                    source_name, success = self._enrich_player_multi_source(session, player)
+                    source_name, bio_data = lookup.result()
                     results['processed'] += 1
 
-                    if success:
+                    if source_name:
+                        updates.append(self._update_player_bio(player, bio_data, source_name, run_ts))
                         results['enriched'] += 1
-                        if source_name:
-                            results['sources_used'][source_name] = results['sources_used'].get(source_name, 0) + 1
+                        results['sources_used'][source_name] = results['sources_used'].get(source_name, 0) + 1
                     else:
                         results['not_found'] += 1
 
@@ -130,81 +333,206 @@ class MultiSourceBioEnricher(BaseScraper):
                     self.logger.error(f"Error enriching {player.first_name} {player.last_name}: {e}")
                     results['errors'].append(str(e))
 
+                # Save progress every WRITE_BATCH_SIZE players, so a long
+                # run that fails part way keeps what it already found
+                if len(updates) >= self.WRITE_BATCH_SIZE:
+                    self._write_updates(updates, results)
+                    updates = []
+
+        self._write_updates(updates, results)
+
         self.logger.info(f"Enrichment complete: {results['enriched']}/{results['processed']} enriched")
         return results
 
-    def _enrich_player_multi_source(self, session, player: Player) -> tuple:
+    def _find_bio(
+        self,
+        full_name: str,
+        espn_id: Optional[str] = None,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
         """
-        Try multiple sources to enrich a player.
+        Try each source in turn until the wanted hometown and high school are found.
+
+        A source that fills only part of the record doesn't end the search:
+        its fields are kept and the next source is asked for the rest. Each
+        group of fields (e.g. hometown city + state) comes from one source,
+        the first that has it.
+
+        Only does network lookups - safe to run on a worker thread.
+
+        Args:
+            full_name: The player's name
+            espn_id: The player's ESPN ID, if we have one
+            wanted: Player fields that are still empty (see BIO_FIELDS).
+                A source only counts if it finds a wanted high school or
+                hometown, and DuckDuckGo skips searches that can't fill
+                any of them. None (the default) wants everything.
 
         Returns:
-            Tuple of (source_name, success_bool)
+            Tuple of (source_name, bio_data), or (None, None) if no source
+            had anything. source_name (and bio_data's source_url) is the
+            first source that found a high school or hometown.
         """
-        full_name = f"{player.first_name} {player.last_name}"
         self.logger.debug(f"Enriching: {full_name}")
 
-        # Try DuckDuckGo search first (most effective - searches like a human)
-        bio_data = self._try_duckduckgo(full_name)
-        if bio_data and (bio_data.get('high_school_name') or bio_data.get('hometown_city')):
-            self._update_player_bio(player, bio_data, 'duckduckgo')
-            return ('duckduckgo', True)
-
-        # Try Wikipedia
-        bio_data = self._try_wikipedia(full_name)
-        if bio_data and (bio_data.get('high_school_name') or bio_data.get('hometown_city')):
-            self._update_player_bio(player, bio_data, 'wikipedia')
-            return ('wikipedia', True)
-
-        # Try ESPN
-        bio_data = self._try_espn(full_name, player.espn_id)
-        if bio_data and (bio_data.get('high_school_name') or bio_data.get('hometown_city')):
-            self._update_player_bio(player, bio_data, 'espn')
-            return ('espn', True)
-
-        # Try Grokepedia
-        bio_data = self._try_grokepedia(full_name)
-        if bio_data and (bio_data.get('high_school_name') or bio_data.get('hometown_city')):
-            self._update_player_bio(player, bio_data, 'grokepedia')
-            return ('grokepedia', True)
-
-        self.logger.debug(f"No bio data found for {full_name}")
-        return (None, False)
-
-    def _ddg_rate_limit(self):
-        """Ensure we don't hit DuckDuckGo too fast."""
-        elapsed = time.time() - self.last_ddg_request
-        if elapsed < self.ddg_request_delay:
-            time.sleep(self.ddg_request_delay - elapsed)
-        self.last_ddg_request = time.time()
-
-    def _try_duckduckgo(self, player_name: str) -> Optional[Dict[str, Any]]:
+        # A player missing neither (e.g. with force=True) looks for both
+        primary = PRIMARY_BIO_FIELDS & (wanted or PRIMARY_BIO_FIELDS) or PRIMARY_BIO_FIELDS
+
+        # Which DuckDuckGo searches ran is part of what its answer means
+        ddg_query = full_name if wanted is None else f"{full_name}|{','.join(sorted(wanted))}"
+
+        lookups = (
+            # DuckDuckGo first (most effective - searches like a human)
+            ('duckduckgo', ddg_query, lambda: self._try_duckduckgo(full_name, wanted)),
+            ('wikipedia', full_name, lambda: self._try_wikipedia(full_name)),
+            ('espn', f"{full_name}|{espn_id or ''}", lambda: self._try_espn(full_name, espn_id)),
+            ('grokepedia', full_name, lambda: self._try_grokepedia(full_name)),
+        )
+
+        found: Dict[str, Any] = {}
+        hit_source = None
+
+        for source_name, query, lookup in lookups:
+            bio_data = self._cached_lookup(source_name, query, lookup)
+            if not bio_data:
+                continue
+
+            added = self._merge_bio(found, bio_data)
+
+            if hit_source is None and not added.isdisjoint(primary):
+                hit_source = source_name
+                found['source_url'] = bio_data.get('source_url')
+            if source_name == 'wikipedia' and added:
+                found['wikipedia_url'] = bio_data.get('source_url')
+            if bio_data.get('espn_id'):
+                found['espn_id'] = bio_data['espn_id']
+
+            # Complete - the remaining sources can't add anything we want
+            if primary <= found.keys():
+                break
+
+        if hit_source is None:
+            self.logger.debug(f"No bio data found for {full_name}")
+            return None, None
+
+        return hit_source, found
+
+    @staticmethod
+    def _merge_bio(found: Dict[str, Any], bio_data: Dict[str, Any]) -> AbstractSet[str]:
+        """
+        Copy field groups from one source's bio data that aren't in found yet.
+
+        Returns:
+            The fields that were added
+        """
+        added = set()
+        for group in BIO_FIELD_GROUPS:
+            if group[0] not in found and bio_data.get(group[0]):
+                for field in group:
+                    if bio_data.get(field):
+                        found[field] = bio_data[field]
+                        added.add(field)
+        return added
+
+    def _cached_lookup(
+        self,
+        source_name: str,
+        query: str,
+        lookup: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run one source lookup, or reuse its answer from an earlier run.
+
+        Answers are kept in the HTTP cache's extraction table, keyed by
+        source and query. Bio data is reused for cache_max_age, and "found
+        nothing" (None, or no BIO_FIELDS - answers can carry just a
+        source_url) for the shorter negative_cache_max_age.
+
+        Args:
+            source_name: Which source this is ('wikipedia', ...)
+            query: What identifies the lookup (usually the player's name)
+            lookup: Does the actual lookup on a cache miss
+
+        For Junior Developers:
+        ---------------------
+        Most players missing a bio are still missing it on the next run,
+        and the sources give the same answer. Remembering the answer turns
+        several web requests per player into one local database read.
+        """
+        if not self.use_cache or not self.http_cache or self.cache_max_age is None:
+            return lookup()
+
+        key = f"bio|v{LOOKUP_CACHE_VERSION}|{source_name}|{' '.join(query.lower().split())}"
+
+        value = self.http_cache.get_value(key, self.cache_max_age)
+        if value is not None:
+            bio_data = orjson.loads(value)
+            # Negative answers expire sooner - only trust a recent one
+            found = bio_data and not bio_data.keys().isdisjoint(BIO_FIELDS)
+            if found or self.http_cache.get_value(key, self.negative_cache_max_age) is not None:
+                return bio_data
+
+        bio_data = lookup()
+        self.http_cache.set_value(key, orjson.dumps(bio_data))
+        return bio_data
+
+    def _write_updates(self, updates: List[Dict[str, Any]], results: Dict[str, Any]):
+        """
+        Write a batch of player changes in one transaction.
+
+        Args:
+            updates: Column changes from _update_player_bio()
+            results: Run results (errors are recorded here)
+        """
+        if not updates:
+            return
+
+        try:
+            with self.db.get_session() as session:
+                # ORM bulk UPDATE by primary key: one executemany statement
+                session.execute(update(Player), updates)
+        except Exception as e:
+            self.logger.error(f"Error saving {len(updates)} bio updates: {e}")
+            results['errors'].append(str(e))
+
+    def _try_duckduckgo(
+        self,
+        player_name: str,
+        wanted: Optional[AbstractSet[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Search DuckDuckGo for player bio info.
 
         This mimics what a human would do - search for
         "Scottie Scheffler high school" and find the info.
+
+        Args:
+            player_name: The player's name
+            wanted: Player fields that are still empty. Searches that can't
+                fill any of them are skipped. None runs every search.
         """
+        def needs(*fields: str) -> bool:
+            return wanted is None or not wanted.isdisjoint(fields)
+
         try:
             bio_data = {}
 
             # Search for high school info
-            self._ddg_rate_limit()
-            hs_snippets = self._search_ddg(f"{player_name} high school golf")
-            if hs_snippets:
-                hs_data = self._extract_high_school_from_snippets(hs_snippets)
-                bio_data.update(hs_data)
+            if needs('high_school_name', 'high_school_city', 'high_school_state'):
+                hs_snippets = self._search_ddg(f"{player_name} high school golf")
+                if hs_snippets:
+                    hs_data = self._extract_high_school_from_snippets(hs_snippets)
+                    bio_data.update(hs_data)
 
             # Search for hometown if not found
-            if 'hometown_city' not in bio_data:
-                self._ddg_rate_limit()
+            if 'hometown_city' not in bio_data and needs('hometown_city', 'hometown_state'):
                 hometown_snippets = self._search_ddg(f"{player_name} golfer hometown")
                 if hometown_snippets:
                     hometown_data = self._extract_hometown_from_snippets(hometown_snippets)
                     bio_data.update(hometown_data)
 
             # Search for college if not found
-            if 'college_name' not in bio_data:
-                self._ddg_rate_limit()
+            if 'college_name' not in bio_data and needs('college_name'):
                 college_snippets = self._search_ddg(f"{player_name} college golf")
                 if college_snippets:
                     college_data = self._extract_college_from_snippets(college_snippets)
@@ -225,7 +553,8 @@ class MultiSourceBioEnricher(BaseScraper):
             params = {'q': query, 'kl': 'us-en'}
             url = f"{self.ddg_search_url}?{urllib.parse.urlencode(params)}"
 
-            soup = self.get_page(url)
+            # The ten results are at the top of the page
+            soup = self.get_page_head(url, max_bytes=self.SEARCH_PAGE_BYTES)
             if not soup:
                 return None
 
@@ -242,33 +571,53 @@ class MultiSourceBioEnricher(BaseScraper):
 
             # Fallback selectors
             if not snippets:
-                for elem in soup.find_all(['div', 'span'], class_=re.compile(r'snippet|abstract', re.I)):
+                for elem in soup.find_all(['div', 'span'], class_=DDG_SNIPPET_CLASS_RE):
                     text = elem.get_text(strip=True)
                     if len(text) > 20:
                         snippets.append(text)
 
+            snippets = self._clean_snippets(snippets)
             return snippets if snippets else None
 
         except Exception as e:
             self.logger.debug(f"DDG search error: {e}")
             return None
 
+    @staticmethod
+    def _clean_snippets(snippets: List[str]) -> List[str]:
+        """
+        Normalize search snippets, trim them, and drop duplicates.
+
+        A result's title often repeats its snippet, and the same page can
+        show up more than once, so duplicates (ignoring case and spacing)
+        are scanned only once. Order is kept - earlier results win.
+        """
+        cleaned = []
+        seen = set()
+
+        for snippet in snippets:
+            # NFKC turns non-breaking spaces etc. into plain ones; curly
+            # apostrophes (O’Connell) have no compatibility form, so map them
+            snippet = unicodedata.normalize('NFKC', snippet).translate(_QUOTE_MAP)
+            snippet = snippet[:SNIPPET_MAX_CHARS]
+
+            key = ' '.join(snippet.lower().split())
+            if key and key not in seen:
+                seen.add(key)
+                cleaned.append(snippet)
+
+        return cleaned
+
     def _extract_high_school_from_snippets(self, snippets: list) -> Dict[str, Any]:
         """Extract high school info from search snippets."""
         data = {}
-        patterns = [
-            r'attended\s+([A-Z][A-Za-z\'\s]+)\s+High\s+School',
-            r'graduated\s+(?:from\s+)?([A-Z][A-Za-z\'\s]+)\s+High\s+School',
-            r'([A-Z][A-Za-z\'\s]+)\s+High\s+School\s+in\s+([A-Z][A-Za-z\s]+)',
-            r'([A-Z][A-Za-z\'\s]+)\s+High\s+School',
-        ]
 
-        for snippet in snippets:
-            for pattern in patterns:
-                match = re.search(pattern, snippet, re.IGNORECASE)
+        for snippet in filter(SNIPPET_HIGH_SCHOOL_HINT.search, snippets):
+            for pattern in SNIPPET_HIGH_SCHOOL_PATTERNS:
+                match = pattern.search(snippet)
                 if match:
                     school = match.group(1).strip()
-                    school = re.sub(r'\s+', ' ', school).rstrip('.,;:')
+                    school = _WS_RE.sub(' ', school).rstrip('.,;:')
                     if school and len(school) > 2:
                         data['high_school_name'] = f"{school} High School"
                         if match.lastindex >= 2:
@@ -279,16 +628,10 @@ class MultiSourceBioEnricher(BaseScraper):
     def _extract_hometown_from_snippets(self, snippets: list) -> Dict[str, Any]:
         """Extract hometown info from search snippets."""
         data = {}
-        patterns = [
-            r'(?:from|hails from|native of)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            r'born\s+(?:and raised\s+)?in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            r'raised\s+in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            r'hometown[:\s]+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-        ]
 
-        for snippet in snippets:
-            for pattern in patterns:
-                match = re.search(pattern, snippet, re.IGNORECASE)
+        for snippet in filter(SNIPPET_HOMETOWN_HINT.search, snippets):
+            for pattern in SNIPPET_HOMETOWN_PATTERNS:
+                match = pattern.search(snippet)
                 if match:
                     city = match.group(1).strip()
                     if city and len(city) > 2:
@@ -301,63 +644,72 @@ class MultiSourceBioEnricher(BaseScraper):
     def _extract_college_from_snippets(self, snippets: list) -> Dict[str, Any]:
         """Extract college info from search snippets."""
         data = {}
-        patterns = [
-            r'played\s+(?:golf\s+)?(?:at|for)\s+([A-Z][A-Za-z\s]+(?:University|College|State))',
-            r'attended\s+(University\s+of\s+[A-Za-z\s]+|[A-Z][A-Za-z\s]+\s+University)',
-            r'(University\s+of\s+[A-Za-z\s]+)',
-        ]
 
-        for snippet in snippets:
-            for pattern in patterns:
-                match = re.search(pattern, snippet, re.IGNORECASE)
+        for snippet in filter(SNIPPET_COLLEGE_HINT.search, snippets):
+            for pattern in SNIPPET_COLLEGE_PATTERNS:
+                match = pattern.search(snippet)
                 if match:
                     college = match.group(1).strip()
-                    college = re.sub(r'\s*\([^)]+\)', '', college)
+                    college = _PAREN_RE.sub('', college)
                     if college and len(college) > 3:
                         data['college_name'] = college
                         return data
         return data
 
     def _try_wikipedia(self, player_name: str) -> Optional[Dict[str, Any]]:
-        """Try to get bio data from Wikipedia."""
+        """
+        Try to get bio data from Wikipedia.
+
+        One query API call searches for the article and returns its plain
+        text plus its Wikidata item ID. The text is searched for high school
+        and hometown; if it has no hometown or no college, the structured
+        birthplace (with its state) and education from Wikidata fill the
+        gaps (what the infobox used to).
+
+        For Junior Developers:
+        ---------------------
+        "generator=search" runs the search and feeds the top hit straight
+        into "prop=extracts|pageprops" in the same request, so there's no
+        separate "find the title, then download the page" round trip, and
+        no article HTML to parse.
+        """
         try:
-            # Search Wikipedia
             params = {
-                'action': 'opensearch',
-                'search': f"{player_name} golfer",
-                'limit': 5,
-                'namespace': 0,
+                'action': 'query',
+                'generator': 'search',
+                'gsrsearch': f"{player_name} golfer",
+                'gsrlimit': 1,
+                'gsrnamespace': 0,
+                'prop': 'extracts|pageprops',
+                'explaintext': 1,
+                'exsectionformat': 'plain',
+                'ppprop': 'wikibase_item',
+                'redirects': 1,
                 'format': 'json',
             }
 
             data = self.get_json('https://en.wikipedia.org/w/api.php', params=params)
-            if not data or len(data) < 2 or not data[1]:
+            if not data or not data.get('query', {}).get('pages'):
                 # Try without "golfer"
-                params['search'] = player_name
+                params['gsrsearch'] = player_name
                 data = self.get_json('https://en.wikipedia.org/w/api.php', params=params)
 
-            if not data or len(data) < 2 or not data[1]:
+            pages = (data or {}).get('query', {}).get('pages')
+            if not pages:
                 return None
 
-            title = data[1][0]
+            page = next(iter(pages.values()))
+            title = page.get('title', '')
 
-            # Fetch the page
-            parse_params = {
-                'action': 'parse',
-                'page': title,
-                'format': 'json',
-                'prop': 'text',
-            }
-
-            page_data = self.get_json('https://en.wikipedia.org/w/api.php', params=parse_params)
-            if not page_data or 'parse' not in page_data:
-                return None
+            bio_data = self._extract_bio_from_wikipedia(page.get('extract', ''))
 
-            html = page_data['parse'].get('text', {}).get('*', '')
-            soup = BeautifulSoup(html, 'lxml')
+            item_id = page.get('pageprops', {}).get('wikibase_item')
+            if item_id and ('hometown_city' not in bio_data or 'college_name' not in bio_data):
+                wikidata = self._try_wikidata(item_id, birthplace='hometown_city' not in bio_data)
+                for field, value in wikidata.items():
+                    bio_data.setdefault(field, value)
 
-            bio_data = self._extract_bio_from_wikipedia(soup)
-            bio_data['source_url'] = f"https://en.wikipedia.org/wiki/{urllib.parse.quote(title)}"
+            bio_data['source_url'] = f"https://en.wikipedia.org/wiki/{urllib.parse.quote(title.replace(' ', '_'))}"
 
             return bio_data
 
@@ -365,16 +717,121 @@ class MultiSourceBioEnricher(BaseScraper):
             self.logger.debug(f"Wikipedia search failed for {player_name}: {e}")
             return None
 
+    def _try_wikidata(self, item_id: str, birthplace: bool = True) -> Dict[str, Any]:
+        """
+        Get birthplace and schools from a Wikipedia article's Wikidata item.
+
+        Reads "place of birth" (P19) and "educated at" (P69), finds the
+        birthplace's state (see _wikidata_state), then looks up all their
+        English names in one more call.
+
+        Args:
+            item_id: The item ID from the article's pageprops (e.g. "Q7396457")
+            birthplace: Also look up the hometown (skipped when the article
+                text already had one)
+        """
+        data = {}
+
+        entities = self.get_json(WIKIDATA_API_URL, params={
+            'action': 'wbgetentities',
+            'ids': item_id,
+            'props': 'claims',
+            'format': 'json',
+        })
+        claims = (entities or {}).get('entities', {}).get(item_id, {}).get('claims', {})
+
+        def claim_ids(prop: str) -> List[str]:
+            return [
+                claim['mainsnak']['datavalue']['value']['id']
+                for claim in claims.get(prop, [])
+                if claim.get('mainsnak', {}).get('datavalue')
+            ]
+
+        birthplaces = claim_ids(WIKIDATA_BIRTHPLACE)[:1] if birthplace else []
+        schools = claim_ids(WIKIDATA_EDUCATED_AT)
+        if not birthplaces and not schools:
+            return data
+
+        state_id = self._wikidata_state(birthplaces[0]) if birthplaces else None
+
+        labels = self.get_json(WIKIDATA_API_URL, params={
+            'action': 'wbgetentities',
+            'ids': '|'.join(dict.fromkeys(birthplaces + schools + ([state_id] if state_id else []))),
+            'props': 'labels',
+            'languages': 'en',
+            'format': 'json',
+        })
+        entities = (labels or {}).get('entities', {})
+
+        def label(entity_id: str) -> str:
+            return entities.get(entity_id, {}).get('labels', {}).get('en', {}).get('value', '')
+
+        if birthplaces and label(birthplaces[0]):
+            data['hometown_city'] = label(birthplaces[0])
+            if state_id and label(state_id):
+                data['hometown_state'] = label(state_id)
+
+        # "educated at" lists high schools and colleges alike
+        for school in filter(None, map(label, schools)):
+            if 'high school' in school.lower():
+                data.setdefault('high_school_name', school)
+            elif WIKIDATA_COLLEGE_RE.search(school):
+                data.setdefault('college_name', school)
+
+        return data
+
+    def _wikidata_state(self, place_id: str) -> Optional[str]:
+        """
+        Find the state (or province) a Wikidata place is in.
+
+        Follows "located in" (P131) upwards until it reaches an item that
+        isn't located in anything - the country. The step just below the
+        country is the state: Dallas -> Dallas County -> Texas -> USA.
+        Each step is one small wbgetclaims call.
+
+        Returns:
+            The state's item ID, or None if the place is directly in a
+            country (or the chain couldn't be followed)
+        """
+        chain = [place_id]
+        for _ in range(WIKIDATA_MAX_ADMIN_LEVELS):
+            response = self.get_json(WIKIDATA_API_URL, params={
+                'action': 'wbgetclaims',
+                'entity': chain[-1],
+                'property': WIKIDATA_LOCATED_IN,
+                'format': 'json',
+            })
+            if response is None:
+                return None
+
+            parents = [
+                claim['mainsnak']['datavalue']['value']['id']
+                for claim in response.get('claims', {}).get(WIKIDATA_LOCATED_IN, [])
+                if claim.get('rank') != 'deprecated' and claim.get('mainsnak', {}).get('datavalue')
+            ]
+            if not parents:
+                # chain[-1] is the country; the state is the step below it
+                return chain[-2] if len(chain) > 2 else None
+            if parents[0] in chain:
+                return None
+            chain.append(parents[0])
+
+        return None
+
     def _try_espn(self, player_name: str, espn_id: str = None) -> Optional[Dict[str, Any]]:
         """Try to get bio data from ESPN."""
         try:
-            # If we have an ESPN ID, use it directly
-            if espn_id:
-                url = f"https://www.espn.com/golf/player/_/id/{espn_id}"
-            else:
-                # Search ESPN for the player
-                search_url = f"https://www.espn.com/golf/player/_/name/{player_name.lower().replace(' ', '-')}"
-                url = search_url
+            # Without an ESPN ID, look it up (the name-slug player URL only
+            # redirects to the ID page, costing an extra round trip)
+            if not espn_id:
+                found = self._cached_lookup(
+                    'espn_id', player_name, lambda: self._search_espn_id(player_name)
+                )
+                espn_id = (found or {}).get('espn_id')
+                if not espn_id:
+                    return None
+
+            url = f"https://www.espn.com/golf/player/_/id/{espn_id}"
 
             soup = self.get_page(url)
             if not soup:
@@ -382,6 +839,8 @@ class MultiSourceBioEnricher(BaseScraper):
 
             bio_data = self._extract_bio_from_espn(soup)
             bio_data['source_url'] = url
+            # Saved on the player, so the next run can skip the search
+            bio_data['espn_id'] = espn_id
 
             return bio_data
 
@@ -389,6 +848,30 @@ class MultiSourceBioEnricher(BaseScraper):
             self.logger.debug(f"ESPN search failed for {player_name}: {e}")
             return None
 
+    def _search_espn_id(self, player_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a golfer's ESPN ID with ESPN's search API.
+
+        Returns:
+            {'espn_id': ...} (a dict, so it can be cached like a bio
+            lookup), or None if ESPN has no such golfer
+        """
+        data = self.get_json(ESPN_SEARCH_URL, params={
+            'query': player_name,
+            'limit': 1,
+            'type': 'player',
+            'sport': 'golf',
+        })
+
+        for result in (data or {}).get('results', []):
+            for content in result.get('contents', []):
+                link = content.get('link', {}).get('web', '')
+                match = ESPN_PLAYER_ID_RE.search(link) or ESPN_PLAYER_ID_RE.search(content.get('uid', ''))
+                if match:
+                    return {'espn_id': match.group(1) or match.group(2)}
+
+        return None
+
     def _try_grokepedia(self, player_name: str) -> Optional[Dict[str, Any]]:
         """Try to get bio data from Grokepedia."""
         try:
@@ -396,12 +879,12 @@ class MultiSourceBioEnricher(BaseScraper):
             search_name = player_name.replace(' ', '+')
             url = f"https://www.grokepedia.com/search?q={search_name}+golf"
 
-            soup = self.get_page(url)
+            soup = self.get_page_head(url, max_bytes=self.SEARCH_PAGE_BYTES)
             if not soup:
                 return None
 
             # Look for player page link
-            player_link = soup.find('a', href=re.compile(r'/player/|/golfer/', re.I))
+            player_link = soup.find('a', href=GROKEPEDIA_PLAYER_LINK_RE)
             if not player_link:
                 return None
 
@@ -423,81 +906,34 @@ class MultiSourceBioEnricher(BaseScraper):
             self.logger.debug(f"Grokepedia search failed for {player_name}: {e}")
             return None
 
-    def _extract_bio_from_wikipedia(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract bio data from Wikipedia page."""
+    def _extract_bio_from_wikipedia(self, text: str) -> Dict[str, Any]:
+        """Extract bio data from the plain text of a Wikipedia article."""
         data = {}
 
-        # Parse infobox
-        infobox = soup.find('table', class_='infobox')
-        if infobox:
-            for row in infobox.find_all('tr'):
-                label = row.find('th')
-                value = row.find('td')
-                if not label or not value:
-                    continue
-
-                label_text = label.get_text(strip=True).lower()
-                value_text = value.get_text(strip=True)
-
-                if 'born' in label_text:
-                    # Extract birthplace
-                    links = value.find_all('a')
-                    locations = [l.get_text(strip=True) for l in links
-                                if l.get_text(strip=True) and
-                                not any(x in l.get_text().lower() for x in ['age', 'born', 'year', '('])]
-                    if len(locations) >= 2:
-                        data['hometown_city'] = locations[0]
-                        data['hometown_state'] = locations[1]
-                    elif len(locations) == 1:
-                        data['hometown_city'] = locations[0]
-
-                elif label_text in ['college', 'alma mater', 'education']:
-                    data['college_name'] = re.sub(r'\s*\([^)]+\)', '', value_text).strip()
-
-                elif label_text in ['residence', 'hometown']:
-                    parts = [p.strip() for p in value_text.split(',')]
-                    if parts:
-                        data['hometown_city'] = parts[0]
-                    if len(parts) > 1:
-                        data['hometown_state'] = parts[1]
-
-        # Parse text for high school - check more paragraphs and use multiple patterns
-        all_text = ' '.join([p.get_text() for p in soup.find_all('p')[:20]])
-
-        # High school patterns - try multiple formats
-        hs_patterns = [
-            # "attended Highland Park High School"
-            r'attended\s+([A-Z][A-Za-z\'\s-]+)\s+High\s+School',
-            # "Highland Park High School in Dallas"
-            r'([A-Z][A-Za-z\'\s-]+)\s+High\s+School\s+in\s+([A-Z][A-Za-z\s]+)',
-            # "at Highland Park High School"
-            r'at\s+([A-Z][A-Za-z\'\s-]+)\s+High\s+School',
-            # "played ... at Highland Park High School" or "Highland Park High School"
-            r'([A-Z][A-Za-z\'\s-]+)\s+High\s+School',
-        ]
+        # Search the first 20 paragraphs (joined, so each pattern runs once),
+        # like a reader skimming the article
+        all_text = ' '.join(islice(filter(str.strip, text.split('\n')), 20))
 
-        if 'high_school_name' not in data:
-            for pattern in hs_patterns:
-                hs_match = re.search(pattern, all_text, re.IGNORECASE)
+        # High school patterns - try multiple formats (WIKI_HIGH_SCHOOL_PATTERNS).
+        # They all need the words "high school", so articles without them
+        # (most pro golfers' leads) skip the patterns' slow scans entirely.
+        if SNIPPET_HIGH_SCHOOL_HINT.search(all_text):
+            for pattern in WIKI_HIGH_SCHOOL_PATTERNS:
+                hs_match = pattern.search(all_text)
                 if hs_match:
                     school_name = hs_match.group(1).strip()
                     # Clean up common false positives
-                    if school_name.lower() not in ['the', 'a', 'an', 'his', 'her', 'their', 'junior']:
+                    if school_name.lower() not in WIKI_SCHOOL_FALSE_POSITIVES:
                         data['high_school_name'] = f"{school_name} High School"
                         # Try to find location if pattern has it
                         if hs_match.lastindex and hs_match.lastindex >= 2:
                             data['high_school_city'] = hs_match.group(2).strip()
                         break
 
-        # Hometown patterns - expanded
-        if 'hometown_city' not in data:
-            hometown_patterns = [
-                r'(?:from|raised in|grew up in|native of|hails from)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-                r'moved\s+to\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-                r'lives?\s+in\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)',
-            ]
-            for pattern in hometown_patterns:
-                hometown_match = re.search(pattern, all_text)
+        # Hometown patterns - expanded (each needs a "City, State" comma)
+        if ',' in all_text:
+            for pattern in WIKI_HOMETOWN_PATTERNS:
+                hometown_match = pattern.search(all_text)
                 if hometown_match:
                     data['hometown_city'] = hometown_match.group(1).strip()
                     data['hometown_state'] = hometown_match.group(2).strip()
@@ -510,7 +946,7 @@ class MultiSourceBioEnricher(BaseScraper):
         data = {}
 
         # ESPN bio section
-        bio_section = soup.find('section', class_=re.compile(r'PlayerHeader|Bio', re.I))
+        bio_section = soup.find('section', class_=ESPN_BIO_SECTION_CLASS_RE)
         if not bio_section:
             bio_section = soup
 
@@ -520,18 +956,18 @@ class MultiSourceBioEnricher(BaseScraper):
 
             if 'Birthplace' in text or 'Hometown' in text:
                 # Extract city, state after label
-                match = re.search(r'(?:Birthplace|Hometown)[:\s]+([^,]+),\s*(\w+)', text)
+                match = ESPN_HOMETOWN_RE.search(text)
                 if match:
                     data['hometown_city'] = match.group(1).strip()
                     data['hometown_state'] = match.group(2).strip()
 
             if 'College' in text:
-                match = re.search(r'College[:\s]+(.+?)(?:\s*\(|$)', text)
+                match = ESPN_COLLEGE_RE.search(text)
                 if match:
                     data['college_name'] = match.group(1).strip()
 
         # Look in player info table
-        info_table = soup.find('table', class_=re.compile(r'PlayerBio|info', re.I))
+        info_table = soup.find('table', class_=ESPN_INFO_TABLE_CLASS_RE)
         if info_table:
             for row in info_table.find_all('tr'):
                 cells = row.find_all(['td', 'th'])
@@ -552,66 +988,96 @@ class MultiSourceBioEnricher(BaseScraper):
         """Extract bio data from Grokepedia player page."""
         data = {}
 
-        # Look for bio info in various places
-        for elem in soup.find_all(['p', 'div', 'li', 'td']):
+        # Read just the bio section when the page has one - a sidebar of
+        # other players otherwise feeds the patterns false hits - and only
+        # its text blocks: wrapper divs repeat all the text nested in them.
+        container = next(
+            filter(None, map(soup.select_one, GROKEPEDIA_BIO_SELECTORS)),
+            soup.body or soup
+        )
+        blocks = container.select(GROKEPEDIA_TEXT_BLOCKS) or [container]
+
+        # The first match for each field wins, so each pattern only runs
+        # until its field is found, and the loop stops once all three are.
+        for elem in blocks:
             text = elem.get_text()
+            if len(text) < GROKEPEDIA_MIN_MATCH_LENGTH:
+                continue
 
             # High school
-            hs_match = re.search(r'([A-Z][A-Za-z\'\s]+)\s+High\s+School', text)
-            if hs_match and 'high_school_name' not in data:
-                data['high_school_name'] = f"{hs_match.group(1).strip()} High School"
+            if 'high_school_name' not in data:
+                hs_match = GROKEPEDIA_HIGH_SCHOOL_RE.search(text)
+                if hs_match:
+                    data['high_school_name'] = f"{hs_match.group(1).strip()} High School"
 
             # Hometown
-            hometown_match = re.search(r'(?:from|hometown|born in)\s+([A-Z][A-Za-z\s]+),\s+([A-Z][A-Za-z\s]+)', text, re.I)
-            if hometown_match and 'hometown_city' not in data:
-                data['hometown_city'] = hometown_match.group(1).strip()
-                data['hometown_state'] = hometown_match.group(2).strip()
+            if 'hometown_city' not in data:
+                hometown_match = GROKEPEDIA_HOMETOWN_RE.search(text)
+                if hometown_match:
+                    data['hometown_city'] = hometown_match.group(1).strip()
+                    data['hometown_state'] = hometown_match.group(2).strip()
 
             # College
-            college_match = re.search(r'(?:attended|played for|college)\s+([A-Z][A-Za-z\s]+(?:University|College))', text, re.I)
-            if college_match and 'college_name' not in data:
-                data['college_name'] = college_match.group(1).strip()
-
-        return data
-
-    def _update_player_bio(self, player: Player, bio_data: Dict[str, Any], source_name: str):
-        """Update player with bio data and source attribution."""
-        updated = False
+            if 'college_name' not in data:
+                college_match = GROKEPEDIA_COLLEGE_RE.search(text)
+                if college_match:
+                    data['college_name'] = college_match.group(1).strip()
 
-        if bio_data.get('high_school_name') and not player.high_school_name:
-            player.high_school_name = bio_data['high_school_name']
-            updated = True
+            if 'high_school_name' in data and 'hometown_city' in data and 'college_name' in data:
+                break
 
-        if bio_data.get('high_school_city') and not player.high_school_city:
-            player.high_school_city = bio_data['high_school_city']
+        return data
 
-        if bio_data.get('high_school_state') and not player.high_school_state:
-            player.high_school_state = bio_data['high_school_state']
+    def _update_player_bio(
+        self,
+        player: Player,
+        bio_data: Dict[str, Any],
+        source_name: str,
+        run_ts: datetime
+    ) -> Dict[str, Any]:
+        """
+        Work out the column changes for a player's new bio data.
 
-        if bio_data.get('hometown_city') and not player.hometown_city:
-            player.hometown_city = bio_data['hometown_city']
-            updated = True
+        Only empty fields are filled in. The player itself isn't modified;
+        the changes are returned for _write_updates() to save in bulk.
 
-        if bio_data.get('hometown_state') and not player.hometown_state:
-            player.hometown_state = bio_data['hometown_state']
+        Args:
+            run_ts: The run's timestamp, saved as bio_last_updated
 
-        if bio_data.get('college_name') and not player.college_name:
-            player.college_name = bio_data['college_name']
+        Returns:
+            Dictionary of column values, keyed by column name (including
+            player_id)
+        """
+        changes = {
+            field: bio_data[field]
+            for field in BIO_FIELDS
+            if bio_data.get(field) and not getattr(player, field)
+        }
 
         # Track the source
+        updated = 'high_school_name' in changes or 'hometown_city' in changes
         if updated and bio_data.get('source_url'):
-            player.bio_source_url = bio_data['source_url']
-            player.bio_source_name = source_name
+            changes['bio_source_url'] = bio_data['source_url']
+            changes['bio_source_name'] = source_name
+
+        if bio_data.get('wikipedia_url'):
+            changes['wikipedia_url'] = bio_data['wikipedia_url']
 
-        if source_name == 'wikipedia' and bio_data.get('source_url'):
-            player.wikipedia_url = bio_data['source_url']
+        if bio_data.get('espn_id') and not player.espn_id:
+            changes['espn_id'] = bio_data['espn_id']
 
-        player.bio_last_updated = datetime.utcnow()
+        changes['player_id'] = player.player_id
+        changes['bio_last_updated'] = run_ts
 
         self.logger.info(f"Updated {player.first_name} {player.last_name} from {source_name}")
+        return changes
 
 
-def enrich_player_bios_multi_source(limit: int = 50, force: bool = False) -> Dict[str, Any]:
+def enrich_player_bios_multi_source(
+    limit: int = 50,
+    force: bool = False,
+    use_cache: bool = True
+) -> Dict[str, Any]:
     """Convenience function to enrich player bios from multiple sources."""
     enricher = MultiSourceBioEnricher()
-    return enricher.run(limit=limit, force=force)
+    return enricher.run(limit=limit, force=force, use_cache=use_cache)
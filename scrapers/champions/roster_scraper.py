@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
+from sqlalchemy import insert
 from scrapers.pga_tour.base_pga_scraper import BasePGAEcosystemScraper
 from database.models import Player, PlayerLeague, League
 
@@ -11,40 +12,93 @@ class ChampionsRosterScraper(BasePGAEcosystemScraper):
         self.logger.info('Starting PGA Tour Champions roster scrape')
         players_data = self.fetch_players()
         if not players_data:
-            return {'status': 'failed', 'records_processed': 0, 'records_created': 0, 'records_updated': 0, 'errors': self._stats['errors']}
-        for p in players_data:
-            try:
-                self._process_player(p)
-                self._stats['records_processed'] += 1
-            except Exception as e:
-                self._stats['errors'].append(str(e))
-        return {'status': 'success' if not self._stats['errors'] else 'partial', 'records_processed': self._stats['records_processed'], 'records_created': self._stats['records_created'], 'records_updated': self._stats['records_updated'], 'errors': self._stats['errors']}
-
-    def _process_player(self, data: Dict):
+            return {'status': 'failed', 'records_processed': 0, 'records_created': 0, 'records_updated': 0, 'errors': list(self._stats['errors'])}
+        # Everything the lookups need is loaded up front, then new players and
+        # league links are written with one multi-row INSERT each
+        try:
+            with self.db.get_session() as session:
+                league = session.query(League).filter_by(league_code=self.league_code).first()
+                members = self._load_members(session, league)
+                by_tid, by_name = self._load_players(session, players_data)
+                roster: Dict[int, Player] = {}
+                new_rows: Dict[Tuple[str, str], Dict] = {}
+                new_tids: Dict[str, Tuple[str, str]] = {}
+                for p in players_data:
+                    player = self._process_player(p, by_tid, by_name, new_rows, new_tids)
+                    if player is not None: roster.setdefault(player.player_id, player)
+                    self._stats['records_processed'] += 1
+                for player in self._insert_players(session, list(new_rows.values()), by_name):
+                    roster.setdefault(player.player_id, player)
+                self._ensure_league(session, roster.values(), league, members)
+        except Exception as e:
+            self.logger.error(f'Error saving Champions roster: {e}')
+            self._stats['errors'].append(str(e))
+            # The whole roster shares one transaction, so nothing was saved
+            for key in ('records_processed', 'records_created', 'records_updated'): self._stats[key] = 0
+            return {'status': 'failed', 'records_processed': 0, 'records_created': 0, 'records_updated': 0, 'errors': list(self._stats['errors'])}
+        return {'status': 'success' if not self._stats['errors'] else 'partial', 'records_processed': self._stats['records_processed'], 'records_created': self._stats['records_created'], 'records_updated': self._stats['records_updated'], 'errors': list(self._stats['errors'])}
+
+    def _load_players(self, session, players_data: List[Dict]) -> Tuple[Dict[str, Player], Dict[Tuple[str, str], Player]]:
+        """Existing players matching the roster, by champions_id and by (first, last) name."""
+        tids = {p.get('tour_player_id') for p in players_data if p.get('tour_player_id')}
+        keys = {Player.make_name_key(p.get('first_name', '').strip(), p.get('last_name', '').strip()) for p in players_data}
+        by_tid = {pl.champions_id: pl for pl in session.query(Player).filter(Player.champions_id.in_(tids))} if tids else {}
+        by_name = {}
+        # name_key narrows the candidates; names still have to match exactly
+        for pl in session.query(Player).filter(Player.name_key.in_(keys)).order_by(Player.player_id):
+            by_name.setdefault((pl.first_name, pl.last_name), pl)
+        return by_tid, by_name
+
+    def _load_members(self, session, league: Optional[League]) -> Set[int]:
+        """IDs of players already linked to this league."""
+        if not league: return set()
+        return {pid for (pid,) in session.query(PlayerLeague.player_id).filter_by(league_id=league.league_id)}
+
+    def _process_player(self, data: Dict, by_tid: Dict[str, Player], by_name: Dict[Tuple[str, str], Player], new_rows: Dict[Tuple[str, str], Dict], new_tids: Dict[str, Tuple[str, str]]) -> Optional[Player]:
+        """Match a roster entry to an existing player, or queue it in new_rows (returns None then)."""
         tid = data.get('tour_player_id', '')
         fn = data.get('first_name', '').strip()
         ln = data.get('last_name', '').strip()
-        if not fn or not ln: return
-        with self.db.get_session() as session:
-            player = session.query(Player).filter_by(champions_id=tid).first() if tid else None
-            if not player:
-                player = session.query(Player).filter_by(first_name=fn, last_name=ln).first()
-            if player:
-                if tid and not player.champions_id: player.champions_id = tid
-                self._stats['records_updated'] += 1
-            else:
-                player = Player(first_name=fn, last_name=ln, champions_id=tid, hometown_country=data.get('country', ''))
-                session.add(player)
-                session.flush()
-                self._stats['records_created'] += 1
-            self._ensure_league(session, player)
-
-    def _ensure_league(self, session, player):
-        league = session.query(League).filter_by(league_code='CHAMPIONS').first()
+        if not fn or not ln: return None
+        player = by_tid.get(tid) if tid else None
+        if not player:
+            player = by_name.get((fn, ln))
+        if player:
+            if tid and not player.champions_id: player.champions_id = tid
+            if player.champions_id: by_tid.setdefault(player.champions_id, player)
+            self._stats['records_updated'] += 1
+            return player
+        # Same player listed twice in the roster: the first entry creates them
+        row = new_rows.get(new_tids[tid]) if tid in new_tids else new_rows.get((fn, ln))
+        if row:
+            if tid and not row['champions_id']:
+                row['champions_id'] = tid
+                new_tids[tid] = (row['first_name'], row['last_name'])
+            self._stats['records_updated'] += 1
+            return None
+        # Bulk inserts skip the ORM validators, so name_key is set here
+        new_rows[(fn, ln)] = {'first_name': fn, 'last_name': ln, 'name_key': Player.make_name_key(fn, ln), 'champions_id': tid, 'hometown_country': data.get('country', '')}
+        if tid: new_tids[tid] = (fn, ln)
+        self._stats['records_created'] += 1
+        return None
+
+    def _insert_players(self, session, rows: List[Dict], by_name: Dict[Tuple[str, str], Player]) -> List[Player]:
+        """Create the queued players with one multi-row INSERT."""
+        if not rows: return []
+        if session.get_bind().dialect.insert_executemany_returning:
+            return session.scalars(insert(Player).returning(Player), rows).all()
+        # MySQL has no RETURNING - executemany, then read the new rows back
+        session.execute(insert(Player), rows)
+        names = {(r['first_name'], r['last_name']) for r in rows}
+        return [pl for pl in session.query(Player).filter(Player.name_key.in_({r['name_key'] for r in rows})) if (pl.first_name, pl.last_name) in names and (pl.first_name, pl.last_name) not in by_name]
+
+    def _ensure_league(self, session, players, league: Optional[League], members: Set[int]):
+        """Link every roster player not yet in the league, with one multi-row INSERT."""
         if not league: return
-        existing = session.query(PlayerLeague).filter_by(player_id=player.player_id, league_id=league.league_id).first()
-        if not existing:
-            session.add(PlayerLeague(player_id=player.player_id, league_id=league.league_id, league_player_id=player.champions_id, is_current_member=True))
+        links = [{'player_id': pl.player_id, 'league_id': league.league_id, 'league_player_id': pl.champions_id, 'is_current_member': True} for pl in players if pl.player_id not in members]
+        if links:
+            session.execute(insert(PlayerLeague), links)
+            members.update(link['player_id'] for link in links)
 
 def scrape_champions_roster():
     return ChampionsRosterScraper().run()
@@ -6,10 +6,53 @@ Scrapes PGA Tour Champions tournament schedules and results using the PGA Tour G
 Supports both completed tournaments and live/in-progress tournaments with round-by-round scores.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
+from sqlalchemy import insert, update
+from config.settings import Config
 from scrapers.pga_tour.base_pga_scraper import BasePGAEcosystemScraper
-from database.models import Player, Tournament, TournamentResult, League
+from database.models import Player, Tournament, TournamentResult
+
+
+# Leaderboard query with round-by-round scores (built once, not per request)
+_LEADERBOARD_QUERY = """
+query Leaderboard($id: ID!) {
+    leaderboardV2(id: $id) {
+        id
+        tournamentStatus
+        players {
+            ... on PlayerRowV2 {
+                id
+                position
+                total
+                totalStrokes
+                score
+                thru
+                currentRound
+                rounds
+                player {
+                    id
+                    firstName
+                    lastName
+                    country
+                }
+            }
+        }
+    }
+}
+"""
+
+# Leaderboard positions for players who didn't make (or finish) the cut
+_CUT_STATUSES = frozenset({'CUT', 'WD', 'DQ', 'MDF'})
+
+# Keys of the round_scores JSON, in round order
+_ROUND_KEYS = ('R1', 'R2', 'R3', 'R4')
+
+# Bump when the leaderboard query changes, so older cached leaderboards are ignored
+LEADERBOARD_CACHE_VERSION = 1
 
 
 class ChampionsTournamentScraper(BasePGAEcosystemScraper):
@@ -19,12 +62,30 @@ class ChampionsTournamentScraper(BasePGAEcosystemScraper):
     tour_code = 'S'
     scrape_type = 'tournament_list'
 
-    def scrape(self, year: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+    # Completed leaderboards don't change, so they are kept in the HTTP
+    # cache's extraction table and reused for this long (a late correction,
+    # like a disqualification, is picked up when the entry expires)
+    leaderboard_cache_max_age = 30 * 86400
+
+    # An event that ended this many days ago is over, whatever its
+    # leaderboard says (or if it couldn't be fetched)
+    final_after_days = 7
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        """Scrape statistics, plus how many leaderboards came from the cache."""
+        stats = BasePGAEcosystemScraper._new_stats()
+        stats['cache_hits'] = 0
+        return stats
+
+    def scrape(self, year: Optional[int] = None, force: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Scrape PGA Tour Champions tournaments for a given year.
 
         Args:
             year: The season year to scrape (defaults to current year)
+            force: Re-fetch results even for tournaments already completed
+                in the database (for backfills and corrections)
 
         Returns:
             Dictionary with scrape results
@@ -39,64 +100,149 @@ class ChampionsTournamentScraper(BasePGAEcosystemScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
-        # Determine in-progress tournaments based on dates
+        # Determine in-progress tournaments based on dates, and (in the same
+        # pass) which ones need results: only those this check found to be
+        # completed or in progress, so a scheduled event never hits the API
+        # (even if the schedule itself reported another status)
         today = date.today()
-        for t in tournaments:
+        # Champions events are typically 3 days (Fri-Sun)
+        event_days = timedelta(days=2)
+        due = []
+        for i, t in enumerate(tournaments):
+            should_fetch = False
             start_date = t.get('start_date')
             if start_date:
-                # Champions events are typically 3 days (Fri-Sun)
-                end_date_estimate = start_date + timedelta(days=2)
+                end_date_estimate = start_date + event_days
                 if start_date <= today <= end_date_estimate:
                     t['status'] = 'in_progress'
+                    should_fetch = True
                 elif today > end_date_estimate:
                     t['status'] = 'completed'
-
-        for t in tournaments:
+                    should_fetch = True
+
+            if should_fetch and t.get('name', '').strip():
+                due.append(i)
+
+        # Tournaments already completed with results saved don't change -
+        # skip their leaderboards entirely unless forced
+        if not force:
+            done = self._completed_with_results(tournaments, year)
+            if done:
+                due = [i for i in due if tournaments[i]['name'].strip() not in done]
+                self.logger.info(f"Skipping {len(done)} tournaments already completed with results")
+
+        # Fetch those leaderboards first, all at once - each request is
+        # mostly waiting on the API
+        leaderboards = dict(zip(due, self._fetch_leaderboards([tournaments[i] for i in due], force)))
+
+        # Dates alone don't prove a recent event is final: if its
+        # leaderboard was requested and isn't COMPLETED (or the fetch
+        # failed), keep it 'in_progress' so the next run looks again.
+        # Events without a PGA ID (no leaderboard can exist) and ones that
+        # ended well before today keep their date-derived 'completed'.
+        final_before = today - timedelta(days=self.final_after_days)
+        for i in due:
+            t = tournaments[i]
+            leaderboard = leaderboards.get(i)
+            if (t['status'] == 'completed' and t.get('tournament_id')
+                    and t['start_date'] + event_days > final_before
+                    and not (leaderboard and leaderboard.get('tournamentStatus') == 'COMPLETED')):
+                t['status'] = 'in_progress'
+
+        # Then save everything in one session: the whole schedule first (one
+        # flush for all new tournaments), then each tournament's results in
+        # its own savepoint, so one bad leaderboard doesn't undo the rest
+        with self.db.get_session() as session:
             try:
-                tournament_id = self._process_tournament(t, year)
-                self._stats['records_processed'] += 1
-
-                # Fetch results for completed OR in-progress tournaments
-                if tournament_id and t.get('status') in ['completed', 'in_progress']:
-                    self._fetch_results(tournament_id, t)
+                with session.begin_nested():
+                    saved = self._process_tournaments(session, tournaments, year)
+                self._stats['records_processed'] += len(tournaments)
             except Exception as e:
-                self.logger.error(f"Error processing tournament: {e}")
-                self._stats['errors'].append(str(e))
+                # One bad row fails the whole batch - retry the tournaments
+                # one at a time, so only that one is lost
+                self.logger.warning(f"Batch tournament save failed, retrying one by one: {e}")
+                saved = []
+                for t in tournaments:
+                    try:
+                        with session.begin_nested():
+                            saved.extend(self._process_tournaments(session, [t], year))
+                        self._stats['records_processed'] += 1
+                    except Exception as e:
+                        self.logger.error(f"Error processing tournament {t.get('name', 'unknown')}: {e}")
+                        self._stats['errors'].append(str(e))
+                        saved.append(None)
+
+            for i, tournament in enumerate(saved):
+                # Popped, so each leaderboard is freed once it's saved rather
+                # than the whole season's staying in memory until the end
+                leaderboard = leaderboards.pop(i, None)
+                if not tournament or not leaderboard:
+                    continue
+                try:
+                    with session.begin_nested():
+                        self._save_results(session, tournament, tournaments[i], leaderboard)
+                except Exception as e:
+                    self.logger.error(f"Error processing tournament: {e}")
+                    self._stats['errors'].append(str(e))
 
         return {
             'status': 'success' if not self._stats['errors'] else 'partial',
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'cache_hits': self._stats['cache_hits'],
+            'errors': list(self._stats['errors'])
         }
 
-    def _process_tournament(self, data: Dict, year: int) -> Optional[int]:
-        """Process and save a tournament to the database. Returns tournament_id."""
-        name = data.get('name', '').strip()
-        if not name:
-            return None
-
-        with self.db.get_session() as session:
-            league = session.query(League).filter_by(league_code='CHAMPIONS').first()
-            if not league:
-                return None
+    def _process_tournaments(self, session, tournaments: List[Dict], year: int) -> List[Optional[Tournament]]:
+        """
+        Save the season's tournaments to the database (in the caller's session).
 
-            tournament = session.query(Tournament).filter_by(
-                league_id=league.league_id,
-                tournament_name=name,
-                tournament_year=year
-            ).first()
+        Existing tournaments are loaded with one query, and new ones are
+        written by a single flush at the end (which batches their INSERTs)
+        rather than a flush per tournament.
 
+        Returns:
+            The Tournament for each schedule entry (None if it has no name),
+            in the same order
+        """
+        # Looked up on the first call only (see BaseScraper._lookup_league_id)
+        league_id = self._lookup_league_id(session)
+        if not league_id:
+            return [None] * len(tournaments)
+
+        names = {t.get('name', '').strip() for t in tournaments} - {''}
+        by_name = {
+            tournament.tournament_name: tournament
+            for tournament in session.query(Tournament).filter(
+                Tournament.league_id == league_id,
+                Tournament.tournament_year == year,
+                Tournament.tournament_name.in_(names)
+            )
+        } if names else {}
+
+        saved = []
+        created = updated = 0
+        for data in tournaments:
+            name = data.get('name', '').strip()
+            if not name:
+                saved.append(None)
+                continue
+
+            tournament = by_name.get(name)
             if tournament:
-                tournament.status = data.get('status', tournament.status)
-                self._stats['records_updated'] += 1
+                # Never undo a 'completed' saved earlier from dates alone
+                # (a leaderboard that says otherwise is applied by _save_results)
+                status = data.get('status', tournament.status)
+                if not (tournament.status == 'completed' and status == 'in_progress'):
+                    tournament.status = status
+                updated += 1
             else:
                 tournament = Tournament(
-                    league_id=league.league_id,
+                    league_id=league_id,
                     tournament_name=name,
                     tournament_year=year,
                     start_date=data.get('start_date'),
@@ -108,119 +254,296 @@ class ChampionsTournamentScraper(BasePGAEcosystemScraper):
                     champions_tournament_id=data.get('tournament_id', '')
                 )
                 session.add(tournament)
-                session.flush()
-                self._stats['records_created'] += 1
+                by_name[name] = tournament
+                created += 1
 
-            # Return ID to avoid session detachment
-            return tournament.tournament_id
+            saved.append(tournament)
 
-    def _fetch_results(self, tournament_id: int, data: Dict):
-        """Fetch and save results for a tournament with round-by-round scores."""
-        pga_tid = data.get('tournament_id', '')
-        if not pga_tid:
-            return
+        # Writes every new tournament at once and gives them their IDs
+        session.flush()
 
-        tournament_name = data.get('name', 'Unknown')
+        # Counted only once the flush succeeded (a failed batch is retried)
+        self._stats['records_created'] += created
+        self._stats['records_updated'] += updated
+        return saved
 
-        # Use the enhanced leaderboard query with rounds
-        query = """
-        query Leaderboard($id: ID!) {
-            leaderboardV2(id: $id) {
-                id
-                tournamentStatus
-                players {
-                    ... on PlayerRowV2 {
-                        id
-                        position
-                        total
-                        totalStrokes
-                        score
-                        thru
-                        currentRound
-                        rounds
-                        player {
-                            id
-                            firstName
-                            lastName
-                            country
-                        }
-                    }
-                }
+    def _completed_with_results(self, tournaments: List[Dict], year: int) -> Set[str]:
+        """
+        Names of this season's tournaments that are already completed in the
+        database and have results saved - one query for the whole schedule.
+        """
+        names = {t.get('name', '').strip() for t in tournaments} - {''}
+        if not names:
+            return set()
+
+        with self.db.get_session() as session:
+            league_id = self._lookup_league_id(session)
+            if not league_id:
+                return set()
+
+            return {
+                name for (name,) in session.query(Tournament.tournament_name).filter(
+                    Tournament.league_id == league_id,
+                    Tournament.tournament_year == year,
+                    Tournament.status == 'completed',
+                    Tournament.tournament_name.in_(names),
+                    Tournament.results.any()
+                )
             }
-        }
+
+    def _fetch_leaderboards(self, tournaments: List[Dict], force: bool = False) -> List[Optional[Dict]]:
+        """
+        Fetch several tournaments' leaderboards concurrently.
+
+        Completed leaderboards cached by an earlier run are reused. The
+        rest are requested on a small thread pool sharing this scraper's
+        HTTP session (and its connection pool), like
+        BaseScraper.get_pages(), and the completed ones are cached. The
+        requests still start one API delay apart (see host_delays), so
+        the pool overlaps waiting on responses rather than bursting.
+
+        Args:
+            tournaments: Tournament dicts from fetch_schedule()
+            force: Ignore cached leaderboards and request every one (the
+                fresh completed ones still replace the cached copies)
+
+        Returns:
+            One leaderboard (or None if that fetch failed) per tournament,
+            in the same order
+        """
+        if force:
+            leaderboards = [None] * len(tournaments)
+        else:
+            leaderboards = [self._cached_leaderboard(t) for t in tournaments]
+        misses = [i for i, leaderboard in enumerate(leaderboards) if leaderboard is None]
+        self._stats['cache_hits'] += len(tournaments) - len(misses)
+
+        workers = min(Config.SCRAPE_MAX_WORKERS, len(misses))
+        if workers <= 1:
+            fetched = [self._fetch_leaderboard(tournaments[i]) for i in misses]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(self._fetch_leaderboard, (tournaments[i] for i in misses)))
+
+        for i, leaderboard in zip(misses, fetched):
+            leaderboards[i] = leaderboard
+            if leaderboard and leaderboard.get('tournamentStatus') == 'COMPLETED' and self.http_cache:
+                self.http_cache.set_value(self._leaderboard_cache_key(tournaments[i]), orjson.dumps(leaderboard))
+
+        return leaderboards
+
+    def _cached_leaderboard(self, data: Dict) -> Optional[Dict]:
+        """Get a completed leaderboard saved by an earlier run, if there is one."""
+        if not self.http_cache or not data.get('tournament_id'):
+            return None
+
+        value = self.http_cache.get_value(self._leaderboard_cache_key(data), self.leaderboard_cache_max_age)
+        if value is None:
+            return None
+
+        self.logger.debug(f"Using cached leaderboard for {data.get('name', 'Unknown')}")
+        return orjson.loads(value)
+
+    @staticmethod
+    def _leaderboard_cache_key(data: Dict) -> str:
+        """Key a tournament's leaderboard is cached under."""
+        return f"leaderboard|v{LEADERBOARD_CACHE_VERSION}|{data.get('tournament_id', '')}"
+
+    def _fetch_leaderboard(self, data: Dict) -> Optional[Dict]:
         """
+        Fetch a tournament's leaderboard with round-by-round scores.
+
+        Only makes the API request - safe to run on a worker thread.
 
-        data_response = self._graphql_request(query, {'id': pga_tid})
+        Returns:
+            The leaderboardV2 data, or None if unavailable
+        """
+        pga_tid = data.get('tournament_id', '')
+        if not pga_tid:
+            return None
+
+        data_response = self._graphql_request(_LEADERBOARD_QUERY, {'id': pga_tid})
         if not data_response or 'leaderboardV2' not in data_response:
-            return
+            return None
+
+        return data_response['leaderboardV2']
+
+    def _save_results(self, session, tournament: Tournament, data: Dict, leaderboard: Dict):
+        """Save a tournament's leaderboard results (in the caller's session)."""
+        tournament_name = data.get('name', 'Unknown')
 
-        leaderboard = data_response['leaderboardV2']
-        players = leaderboard.get('players', [])
         tournament_status = leaderboard.get('tournamentStatus', 'COMPLETED')
 
-        # Filter valid players
-        players = [p for p in players if p and p.get('player')]
+        # Flatten each valid row to a tuple once, so the steps below unpack
+        # fields instead of repeating .get() lookups:
+        # (champions_id, first_name, last_name, position, total, total_strokes, rounds)
+        players = [
+            (pi['id'], pi.get('firstName', ''), pi.get('lastName', ''),
+             p.get('position', ''), p.get('total', ''), p.get('totalStrokes', ''),
+             p.get('rounds') or [])
+            for p in leaderboard.get('players', [])
+            if p and (pi := p.get('player')) and pi.get('id')
+        ]
 
         self.logger.info(f"Found {len(players)} player results for {tournament_name} (status: {tournament_status})")
 
-        with self.db.get_session() as session:
-            tournament = session.query(Tournament).filter_by(
-                tournament_id=tournament_id
-            ).first()
-
-            if not tournament:
-                self.logger.warning(f"Tournament {tournament_id} not found in database")
-                return
-
-            # Update tournament status
-            if tournament_status == 'IN_PROGRESS':
-                tournament.status = 'in_progress'
-            elif tournament_status == 'COMPLETED':
-                tournament.status = 'completed'
-
-            for p in players:
-                self._save_result(session, tournament, p, tournament_status)
-
-    def _save_result(self, session, tournament, result, tournament_status='COMPLETED'):
-        """Save a single player's result with round-by-round scores."""
-        pi = result.get('player', {})
-        if not pi:
-            return
-
-        tid = pi.get('id', '')
-        if not tid:
-            return
-
-        first_name = pi.get('firstName', '')
-        last_name = pi.get('lastName', '')
-
-        # Find player by Champions ID
-        player = session.query(Player).filter_by(champions_id=tid).first()
-        if not player:
-            player = session.query(Player).filter_by(
-                first_name=first_name,
-                last_name=last_name
-            ).first()
-        if not player:
-            if not first_name or not last_name:
-                return
-            player = Player(first_name=first_name, last_name=last_name, champions_id=tid)
-            session.add(player)
-            session.flush()
-
-        existing = session.query(TournamentResult).filter_by(
-            tournament_id=tournament.tournament_id,
-            player_id=player.player_id
-        ).first()
-
-        pos = result.get('position', '')
+        # Update tournament status
+        if tournament_status == 'IN_PROGRESS':
+            tournament.status = 'in_progress'
+        elif tournament_status == 'COMPLETED':
+            tournament.status = 'completed'
+
+        # Every leaderboard player's player_id, resolved in bulk
+        player_ids = self._resolve_players(session, players)
+
+        # Existing results for this tournament, by player - one query
+        # instead of one per leaderboard row
+        existing = dict(
+            session.query(TournamentResult.player_id, TournamentResult.result_id)
+            .filter_by(tournament_id=tournament.tournament_id)
+        )
+
+        # Rows to write, keyed by player_id (a player listed twice keeps
+        # their last row, as when each row was saved in turn)
+        to_insert: Dict[int, Dict[str, Any]] = {}
+        to_update: Dict[int, Dict[str, Any]] = {}
+
+        # Bound once to locals - the loop runs for every leaderboard row
+        result_row = self._result_row
+        tournament_id = tournament.tournament_id
+
+        for p in players:
+            row = result_row(player_ids, p, tournament_status)
+            if row is None:
+                continue
+
+            player_id = row['player_id']
+            result_id = existing.get(player_id)
+            if result_id is not None:
+                row['result_id'] = result_id
+                to_update[player_id] = row
+            else:
+                row['tournament_id'] = tournament_id
+                to_insert[player_id] = row
+
+        # One multi-row INSERT and one executemany UPDATE (by result_id)
+        # for the whole leaderboard
+        if to_insert:
+            session.execute(insert(TournamentResult), list(to_insert.values()))
+        if to_update:
+            session.execute(update(TournamentResult), list(to_update.values()))
+
+    def _resolve_players(self, session, players: List[Tuple]) -> Dict[str, int]:
+        """
+        Find (or create) the Player for every leaderboard row.
+
+        Players are matched by Champions ID first, then by exact name -
+        with one IN query for each instead of two queries per row - and
+        all missing players are created with a single multi-row INSERT.
+
+        Args:
+            session: Database session
+            players: Leaderboard rows, as flattened by _save_results
+
+        Returns:
+            Dictionary mapping Champions player ID to player_id
+        """
+        # Each Champions ID with its name (the first listing wins)
+        names: Dict[str, Tuple[str, str]] = {}
+        for tid, first, last, *_ in players:
+            names.setdefault(tid, (first, last))
+        if not names:
+            return {}
+
+        player_ids: Dict[str, int] = {}
+        for champions_id, player_id in session.query(
+            Player.champions_id, Player.player_id
+        ).filter(Player.champions_id.in_(names)).order_by(Player.player_id):
+            player_ids.setdefault(champions_id, player_id)
+
+        # Players without a known Champions ID fall back to their name
+        # (name_key narrows the candidates; names still have to match exactly)
+        unmatched = {tid: name for tid, name in names.items() if tid not in player_ids}
+        by_name: Dict[Tuple[str, str], int] = {}
+        if unmatched:
+            keys = {Player.make_name_key(first, last) for first, last in unmatched.values()}
+            for player_id, first, last in session.query(
+                Player.player_id, Player.first_name, Player.last_name
+            ).filter(Player.name_key.in_(keys)).order_by(Player.player_id):
+                by_name.setdefault((first, last), player_id)
+
+        # Anyone still unknown is created (the first Champions ID listed
+        # for a name becomes the new player's champions_id)
+        new_rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for tid, (first, last) in unmatched.items():
+            if (first, last) not in by_name and first and last:
+                new_rows.setdefault((first, last), {
+                    'first_name': first,
+                    'last_name': last,
+                    # Bulk inserts skip the ORM validators, so set name_key here
+                    'name_key': Player.make_name_key(first, last),
+                    'champions_id': tid,
+                })
+        if new_rows:
+            by_name.update(self._insert_players(session, list(new_rows.values())))
+
+        for tid, name in unmatched.items():
+            if name in by_name:
+                player_ids[tid] = by_name[name]
+
+        return player_ids
+
+    def _insert_players(self, session, rows: List[Dict[str, Any]]) -> Dict[Tuple[str, str], int]:
+        """
+        Create players with one multi-row INSERT.
+
+        Returns:
+            Dictionary mapping (first_name, last_name) to the new player_id
+        """
+        columns = (Player.player_id, Player.first_name, Player.last_name)
+
+        if session.get_bind().dialect.insert_executemany_returning:
+            # One round-trip: INSERT ... VALUES (...), (...) RETURNING ...
+            created = session.execute(insert(Player).returning(*columns), rows).all()
+        else:
+            # MySQL has no RETURNING - executemany, then read the new rows back
+            # (no existing player has these exact names, or they'd have matched)
+            session.execute(insert(Player), rows)
+            names = {(row['first_name'], row['last_name']) for row in rows}
+            created = [
+                row for row in session.query(*columns).filter(
+                    Player.name_key.in_({row['name_key'] for row in rows})
+                )
+                if (row.first_name, row.last_name) in names
+            ]
+
+        self.logger.debug(f'Created {len(rows)} new players')
+        return {(first, last): player_id for player_id, first, last in created}
+
+    def _result_row(self, player_ids: Dict[str, int], result: Tuple, tournament_status='COMPLETED') -> Optional[Dict[str, Any]]:
+        """
+        Build a player's result row with round-by-round scores.
+
+        Args:
+            player_ids: Champions player ID to player_id (see _resolve_players)
+            result: A leaderboard row, as flattened by _save_results
+
+        Returns:
+            TournamentResult column values (including player_id), or None
+            if the row has no usable player
+        """
+        tid, _, _, pos, total, total_strokes_str, rounds = result
+
+        player_id = player_ids.get(tid)
+        if not player_id:
+            return None
+
         pos_val = self._parse_position(pos)
-        to_par = self._parse_to_par(result.get('total', ''))
-        made_cut = pos not in ['CUT', 'WD', 'DQ', 'MDF']
+        to_par = self._parse_to_par(total)
+        made_cut = pos not in _CUT_STATUSES
 
         # Parse total strokes
         total_strokes = None
-        total_strokes_str = result.get('totalStrokes', '')
         if total_strokes_str:
             try:
                 total_strokes = int(total_strokes_str)
@@ -228,22 +551,16 @@ class ChampionsTournamentScraper(BasePGAEcosystemScraper):
                 pass
 
         # Parse round-by-round scores (Champions typically has 3 rounds)
-        rounds = result.get('rounds', [])
         r1 = self._parse_round_score(rounds[0] if len(rounds) > 0 else None)
         r2 = self._parse_round_score(rounds[1] if len(rounds) > 1 else None)
         r3 = self._parse_round_score(rounds[2] if len(rounds) > 2 else None)
         r4 = self._parse_round_score(rounds[3] if len(rounds) > 3 else None)
 
-        # Build round_scores dict
-        round_scores_dict = {}
-        if r1 is not None:
-            round_scores_dict['R1'] = r1
-        if r2 is not None:
-            round_scores_dict['R2'] = r2
-        if r3 is not None:
-            round_scores_dict['R3'] = r3
-        if r4 is not None:
-            round_scores_dict['R4'] = r4
+        # Build round_scores dict (only the rounds that were played)
+        round_scores_dict = {
+            key: score for key, score in zip(_ROUND_KEYS, (r1, r2, r3, r4))
+            if score is not None
+        }
 
         # Determine status
         if not made_cut:
@@ -253,36 +570,25 @@ class ChampionsTournamentScraper(BasePGAEcosystemScraper):
         else:
             player_status = 'active'
 
-        if existing:
-            existing.final_position = pos_val
-            existing.final_position_display = pos
-            existing.total_to_par = to_par
-            existing.total_score = total_strokes
-            existing.made_cut = made_cut
-            existing.status = player_status
-            existing.round_1_score = r1
-            existing.round_2_score = r2
-            existing.round_3_score = r3
-            existing.round_4_score = r4
-            existing.round_scores = round_scores_dict if round_scores_dict else None
-        else:
-            session.add(TournamentResult(
-                tournament_id=tournament.tournament_id,
-                player_id=player.player_id,
-                final_position=pos_val,
-                final_position_display=pos,
-                total_to_par=to_par,
-                total_score=total_strokes,
-                made_cut=made_cut,
-                status=player_status,
-                round_1_score=r1,
-                round_2_score=r2,
-                round_3_score=r3,
-                round_4_score=r4,
-                round_scores=round_scores_dict if round_scores_dict else None
-            ))
-
-    def _parse_round_score(self, score_str) -> Optional[int]:
+        return {
+            'player_id': player_id,
+            'final_position': pos_val,
+            'final_position_display': pos,
+            'total_to_par': to_par,
+            'total_score': total_strokes,
+            'made_cut': made_cut,
+            'status': player_status,
+            'round_1_score': r1,
+            'round_2_score': r2,
+            'round_3_score': r3,
+            'round_4_score': r4,
+            'round_scores': round_scores_dict if round_scores_dict else None,
+        }
+
+    # Round scores cluster in the 60s and 70s, so parse each string once
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_round_score(score_str) -> Optional[int]:
         """Parse a round score string to integer."""
         if not score_str or score_str == '-':
             return None
@@ -292,6 +598,6 @@ class ChampionsTournamentScraper(BasePGAEcosystemScraper):
             return None
 
 
-def scrape_champions_tournaments(year=None):
+def scrape_champions_tournaments(year=None, force=False):
     """Convenience function to scrape Champions tournaments."""
-    return ChampionsTournamentScraper().run(year=year)
+    return ChampionsTournamentScraper().run(year=year, force=force)
@@ -19,17 +19,62 @@ College golf differs from pro golf in several ways:
 - Different divisions: D1, D2, D3, NAIA, NJCAA
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, date
 from decimal import Decimal
+import calendar
 import re
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
-from bs4 import BeautifulSoup
+from lxml import etree
+from sqlalchemy import insert, update
 
-from scrapers.base_scraper import BaseScraper
+from config.settings import Config
+from scrapers.base_scraper import BaseScraper, REQUEST_ERRORS
 from database.models import Player, Tournament, TournamentResult, League
 
 
+# Patterns used while scanning Golfstat pages (compiled once, at import)
+TOURNAMENT_SECTION_CLASS_RE = re.compile(r'tournament|event|score', re.IGNORECASE)
+TOURNAMENT_LINK_HREF_RE = re.compile(r'tournament|leaderboard|results')
+NAME_CLASS_RE = re.compile(r'name|title', re.IGNORECASE)
+DATE_CLASS_RE = re.compile(r'date', re.IGNORECASE)
+LOCATION_CLASS_RE = re.compile(r'course|location', re.IGNORECASE)
+RESULTS_TABLE_CLASS_RE = re.compile(r'leaderboard|results|scores', re.IGNORECASE)
+
+# Result row cells: a possible round score (two digits - the 55-95 range is
+# checked after), and a to-par value like +3, -2 or E
+ROUND_SCORE_RE = re.compile(r'\d{2}')
+TO_PAR_RE = re.compile(r'[+-]\d+|E')
+
+# Results table header cells, by the result field their column holds
+# (matched against the whole header text, case-insensitively, after
+# HEADER_NOISE_RE strips whitespace and punctuation: "Rd. 1" -> "Rd1")
+HEADER_NOISE_RE = re.compile(r'[^\w#+/-]')
+RESULTS_HEADER_COLUMNS = (
+    ('position', re.compile(r'pos(ition)?|place|#', re.IGNORECASE)),
+    ('player_name', re.compile(r'player(name)?|name', re.IGNORECASE)),
+    ('school', re.compile(r'school|team|college', re.IGNORECASE)),
+    ('round_1', re.compile(r'r(ound|nd|d)?1', re.IGNORECASE)),
+    ('round_2', re.compile(r'r(ound|nd|d)?2', re.IGNORECASE)),
+    ('round_3', re.compile(r'r(ound|nd|d)?3', re.IGNORECASE)),
+    ('total', re.compile(r'tot(al)?|strokes', re.IGNORECASE)),
+    ('to_par', re.compile(r'topar|par|\+/-', re.IGNORECASE)),
+)
+ROUND_COLUMNS = ('round_1', 'round_2', 'round_3')
+
+# Dates seen on Golfstat pages, matched directly instead of trying
+# strptime() formats one by one: "January 15, 2026" / "Jan 15, 2026",
+# "01/15/2026" and "2026-01-15"
+DATE_MONTH_NAME_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})')
+DATE_US_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+DATE_ISO_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+MONTH_NUMBERS = {
+    **{name.lower(): number for number, name in enumerate(calendar.month_name) if name},
+    **{name.lower(): number for number, name in enumerate(calendar.month_abbr) if name},
+}
+
+
 class CollegeGolfTournamentScraper(BaseScraper):
     """
     Scrapes college golf tournaments from Golfstat.
@@ -105,18 +150,31 @@ class CollegeGolfTournamentScraper(BaseScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
+        # Save the tournaments first, noting which have a results URL
+        with_results = []
         for t in tournaments:
             try:
                 tournament = self._process_tournament(t, year)
                 self._stats['records_processed'] += 1
 
-                # Fetch results if tournament has a results URL
                 if tournament and t.get('results_url'):
-                    self._fetch_and_save_results(tournament, t)
+                    with_results.append((tournament, t))
+
+            except Exception as e:
+                self.logger.error(f"Error processing tournament {t.get('name', 'unknown')}: {e}")
+                self._stats['errors'].append(str(e))
+
+        # Then fetch all their results at once, and save each one here, on
+        # the main thread
+        self.logger.info(f'Fetching results pages for {len(with_results)} tournaments')
+        results_by_url = self._fetch_all_results([t['results_url'] for _, t in with_results])
 
+        for tournament, t in with_results:
+            try:
+                self._save_tournament_results(tournament, t, results_by_url.get(t['results_url']))
             except Exception as e:
                 self.logger.error(f"Error processing tournament {t.get('name', 'unknown')}: {e}")
                 self._stats['errors'].append(str(e))
@@ -126,7 +184,7 @@ class CollegeGolfTournamentScraper(BaseScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _fetch_scoreboard(self) -> Optional[List[Dict]]:
@@ -148,7 +206,7 @@ class CollegeGolfTournamentScraper(BaseScraper):
         # Look for tournament entries on the scoreboard
         # Golfstat typically shows live/recent tournaments in sections
         tournament_sections = soup.find_all(['div', 'tr', 'a'],
-            class_=re.compile(r'tournament|event|score', re.I))
+            class_=TOURNAMENT_SECTION_CLASS_RE)
 
         for section in tournament_sections:
             try:
@@ -158,21 +216,23 @@ class CollegeGolfTournamentScraper(BaseScraper):
             except Exception as e:
                 self.logger.debug(f"Error parsing tournament section: {e}")
 
+        # Names found so far, so duplicate links are skipped in O(1)
+        seen_names = {t['name'] for t in tournaments}
+
         # Also check for links to tournament pages
-        links = soup.find_all('a', href=re.compile(r'tournament|leaderboard|results'))
+        links = soup.find_all('a', href=TOURNAMENT_LINK_HREF_RE)
         for link in links:
             try:
                 href = link.get('href', '')
                 name = link.get_text(strip=True)
-                if name and len(name) > 3:  # Filter out short text
-                    tournament = {
+                # Filter out short text, and avoid duplicates
+                if name and len(name) > 3 and name not in seen_names:
+                    seen_names.add(name)
+                    tournaments.append({
                         'name': name,
                         'results_url': self._normalize_url(href),
                         'status': 'in_progress' if 'live' in href.lower() else 'completed',
-                    }
-                    # Avoid duplicates
-                    if not any(t.get('name') == name for t in tournaments):
-                        tournaments.append(tournament)
+                    })
             except Exception as e:
                 self.logger.debug(f"Error parsing tournament link: {e}")
 
@@ -183,7 +243,7 @@ class CollegeGolfTournamentScraper(BaseScraper):
         """Parse a tournament from an HTML section."""
         # Try to find tournament name
         name_elem = section.find(['h3', 'h4', 'a', 'span'],
-            class_=re.compile(r'name|title', re.I))
+            class_=NAME_CLASS_RE)
         if not name_elem:
             name_elem = section.find('a')
 
@@ -195,7 +255,7 @@ class CollegeGolfTournamentScraper(BaseScraper):
             return None
 
         # Try to find dates
-        date_elem = section.find(['span', 'div'], class_=re.compile(r'date', re.I))
+        date_elem = section.find(['span', 'div'], class_=DATE_CLASS_RE)
         start_date = None
         if date_elem:
             start_date = self._parse_date_text(date_elem.get_text(strip=True))
@@ -207,7 +267,7 @@ class CollegeGolfTournamentScraper(BaseScraper):
             results_url = self._normalize_url(link.get('href', ''))
 
         # Try to find course/location
-        location_elem = section.find(['span', 'div'], class_=re.compile(r'course|location', re.I))
+        location_elem = section.find(['span', 'div'], class_=LOCATION_CLASS_RE)
         course = location_elem.get_text(strip=True) if location_elem else None
 
         return {
@@ -233,19 +293,26 @@ class CollegeGolfTournamentScraper(BaseScraper):
         if not text:
             return None
 
+        text = text.strip()
+
         # Try common formats
-        formats = [
-            '%B %d, %Y',  # January 15, 2026
-            '%b %d, %Y',  # Jan 15, 2026
-            '%m/%d/%Y',   # 01/15/2026
-            '%Y-%m-%d',   # 2026-01-15
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(text.strip(), fmt).date()
-            except ValueError:
-                continue
+        try:
+            match = DATE_MONTH_NAME_RE.fullmatch(text)
+            if match:
+                month = MONTH_NUMBERS.get(match.group(1).lower())
+                if month:
+                    return date(int(match.group(3)), month, int(match.group(2)))
+
+            match = DATE_US_RE.fullmatch(text)
+            if match:
+                return date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+
+            match = DATE_ISO_RE.fullmatch(text)
+            if match:
+                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            # Matched the shape but isn't a real date (e.g. 02/30/2026)
+            return None
 
         return None
 
@@ -260,9 +327,10 @@ class CollegeGolfTournamentScraper(BaseScraper):
             return None
 
         with self.db.get_session() as session:
-            # Get or create NCAA league
-            league = session.query(League).filter_by(league_code=self.league_code).first()
-            if not league:
+            # Get or create NCAA league (once found, the ID is remembered -
+            # see BaseScraper._lookup_league_id)
+            league_id = self._lookup_league_id(session)
+            if not league_id:
                 # Create NCAA league if it doesn't exist
                 league = League(
                     league_code=self.league_code,
@@ -272,11 +340,12 @@ class CollegeGolfTournamentScraper(BaseScraper):
                 )
                 session.add(league)
                 session.flush()
+                league_id = league.league_id
                 self.logger.info(f'Created league: {league.league_name}')
 
             # Check if tournament exists
             tournament = session.query(Tournament).filter_by(
-                league_id=league.league_id,
+                league_id=league_id,
                 tournament_name=name,
                 tournament_year=year
             ).first()
@@ -293,7 +362,7 @@ class CollegeGolfTournamentScraper(BaseScraper):
             else:
                 # Create new
                 tournament = Tournament(
-                    league_id=league.league_id,
+                    league_id=league_id,
                     tournament_name=name,
                     tournament_year=year,
                     start_date=data.get('start_date'),
@@ -308,28 +377,61 @@ class CollegeGolfTournamentScraper(BaseScraper):
 
             return tournament.tournament_id
 
-    def _fetch_and_save_results(self, tournament_id: int, data: Dict):
+    def _fetch_all_results(self, urls: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Fetch and parse several results pages concurrently.
+
+        Each distinct URL is fetched once, on a small thread pool sharing
+        this scraper's HTTP session (requests to golfstat.com are still
+        spaced out by the per-host delay), like BaseScraper.get_pages().
+
+        Returns:
+            Dictionary mapping each URL to its results (None if the fetch failed)
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        workers = min(Config.SCRAPE_MAX_WORKERS, len(urls))
+        if workers <= 1:
+            fetched = [self._fetch_results(url) for url in urls]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(self._fetch_results, urls))
+
+        return dict(zip(urls, fetched))
+
+    def _fetch_results(self, results_url: str) -> Optional[List[Dict]]:
         """
-        Fetch and save results for a tournament.
+        Stream a results page and parse its rows as they arrive.
+
+        Only one <tr> at a time is held as a parsed element (see
+        BaseScraper.iter_page), rather than a tree of the whole page.
+
+        Returns:
+            The player results, or None if the page couldn't be fetched
+        """
+        try:
+            return self._parse_results_rows(self.iter_page(results_url, 'tr', raise_errors=True))
+        except (*REQUEST_ERRORS, etree.LxmlError):
+            # Already logged and recorded by iter_page() - what was parsed
+            # may be a partial leaderboard, so none of it is used
+            return None
+
+    def _save_tournament_results(self, tournament_id: int, data: Dict, results: Optional[List[Dict]]):
+        """
+        Save the parsed results for a tournament.
 
         College golf results include:
         - Team standings
         - Individual player results with round scores
         """
-        results_url = data.get('results_url', '')
-        if not results_url:
-            return
-
         tournament_name = data.get('name', 'Unknown')
-        self.logger.info(f'Fetching results for {tournament_name} from {results_url}')
 
-        soup = self.get_page(results_url)
-        if not soup:
+        if results is None:
             self.logger.warning(f'Could not fetch results page for {tournament_name}')
             return
 
-        # Parse individual results
-        results = self._parse_results_page(soup)
         if not results:
             self.logger.warning(f'No results found for {tournament_name}')
             return
@@ -343,15 +445,14 @@ class CollegeGolfTournamentScraper(BaseScraper):
             if not tournament:
                 return
 
-            for result in results:
-                try:
-                    self._save_player_result(session, tournament, result)
-                except Exception as e:
-                    self.logger.error(f"Error saving result: {e}")
+            self._save_results(session, tournament, results)
 
-    def _parse_results_page(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_results_rows(self, rows: Iterable[etree._Element]) -> List[Dict]:
         """
-        Parse player results from a Golfstat results page.
+        Parse player results from the <tr> elements of a Golfstat results page.
+
+        Rows from leaderboard/results tables are used if the page has any;
+        otherwise rows from every table are.
 
         Returns list of result dictionaries with:
         - player_name
@@ -362,47 +463,91 @@ class CollegeGolfTournamentScraper(BaseScraper):
         - to_par
         """
         results = []
+        # Rows from other tables, in case there is no results table
+        fallback = []
+        found_results_table = False
+
+        # Column positions per table, read from its header row - rows are
+        # then looked up by index (None: fall back to guessing by layout)
+        columns: Dict[etree._Element, Optional[Dict[str, int]]] = {}
+
+        for row in rows:
+            table = next(row.iterancestors('table'), None)
+            if table is None:
+                continue
 
-        # Look for leaderboard/results table
-        tables = soup.find_all('table', class_=re.compile(r'leaderboard|results|scores', re.I))
-        if not tables:
-            tables = soup.find_all('table')
+            is_results_table = self.class_matches(table, RESULTS_TABLE_CLASS_RE)
+            if is_results_table:
+                found_results_table = True
+            elif found_results_table:
+                continue
+
+            cells = list(row.iter('td', 'th'))
+            if len(cells) < 3:
+                continue
 
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 3:
+            text_values = [''.join(cell.itertext()).strip() for cell in cells]
+
+            # Header rows use <th> cells (or are the table's first row)
+            first_row = table not in columns
+            if first_row or any(cell.tag == 'th' for cell in cells):
+                header = self._column_map(text_values)
+                if header or first_row:
+                    columns[table] = header
+                if header:
                     continue
 
-                try:
-                    result = self._parse_result_row(cells)
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    self.logger.debug(f"Error parsing result row: {e}")
+            try:
+                result = self._parse_result_row(text_values, columns[table])
+                if result:
+                    (results if is_results_table else fallback).append(result)
+            except Exception as e:
+                self.logger.debug(f"Error parsing result row: {e}")
 
-        return results
+        return results if found_results_table else fallback
 
-    def _parse_result_row(self, cells) -> Optional[Dict]:
-        """Parse a single result row from a table."""
-        if len(cells) < 3:
+    @staticmethod
+    def _column_map(text_values: List[str]) -> Optional[Dict[str, int]]:
+        """
+        Map result fields to column indexes from a header row's cell text.
+
+        Returns:
+            e.g. {'position': 0, 'player_name': 1, ...}, or None if the row
+            isn't a header (it has no player name column)
+        """
+        columns: Dict[str, int] = {}
+        for i, text in enumerate(text_values):
+            text = HEADER_NOISE_RE.sub('', text)
+            for key, pattern in RESULTS_HEADER_COLUMNS:
+                if key not in columns and pattern.fullmatch(text):
+                    columns[key] = i
+                    break
+
+        return columns if 'player_name' in columns else None
+
+    def _parse_result_row(self, text_values: List[str], columns: Optional[Dict[str, int]] = None) -> Optional[Dict]:
+        """
+        Parse a single result row from a table.
+
+        Args:
+            text_values: The row's cell text
+            columns: Column indexes from the table header (see _column_map);
+                without one, columns are guessed from the usual layout
+        """
+        if len(text_values) < 3:
             return None
 
+        if columns:
+            return self._parse_mapped_row(text_values, columns)
+
         # Try to identify columns
         # Common layouts: Pos | Name | School | R1 | R2 | R3 | Total | To Par
-        text_values = [c.get_text(strip=True) for c in cells]
 
         # Skip header rows
         if any(h in text_values[0].lower() for h in ['pos', 'position', 'place', '#']):
             return None
 
-        result = {}
-
-        # Position is usually first column
-        pos_text = text_values[0]
-        result['position'] = self._parse_position(pos_text)
-        result['position_display'] = pos_text
+        result = self._positional_fields(text_values)
 
         # Name is usually second column
         result['player_name'] = text_values[1] if len(text_values) > 1 else ''
@@ -410,15 +555,27 @@ class CollegeGolfTournamentScraper(BaseScraper):
         # School is usually third column
         result['school'] = text_values[2] if len(text_values) > 2 else ''
 
+        # Validate - need at least a name
+        if not result.get('player_name') or len(result['player_name']) < 2:
+            return None
+
+        return result
+
+    def _positional_fields(self, text_values: List[str]) -> Dict:
+        """Position, round scores, total and to-par, guessed from the usual column layout."""
+        result = {}
+
+        # Position is usually first column
+        pos_text = text_values[0]
+        result['position'] = self._parse_position(pos_text)
+        result['position_display'] = pos_text
+
         # Look for round scores (usually numeric values 60-90)
         scores = []
         for val in text_values[3:]:
-            try:
-                score = int(val)
-                if 55 <= score <= 95:  # Reasonable golf scores
-                    scores.append(score)
-            except ValueError:
-                pass
+            score = self._parse_round_score(val)
+            if score is not None:
+                scores.append(score)
 
         # Assign round scores
         result['round_1'] = scores[0] if len(scores) > 0 else None
@@ -431,16 +588,73 @@ class CollegeGolfTournamentScraper(BaseScraper):
 
         # Try to find to-par value
         for val in text_values:
-            if val.startswith('+') or val.startswith('-') or val == 'E':
+            if TO_PAR_RE.fullmatch(val):
                 result['to_par'] = self._parse_to_par(val)
                 break
 
+        return result
+
+    def _parse_mapped_row(self, text_values: List[str], columns: Dict[str, int]) -> Optional[Dict]:
+        """
+        Parse a result row whose column positions are known from the header.
+
+        Position, rounds and to-par that the header didn't name are taken
+        from the usual column layout instead (see _positional_fields).
+        """
+        def cell(key: str) -> str:
+            i = columns.get(key)
+            return text_values[i] if i is not None and i < len(text_values) else ''
+
+        player_name = cell('player_name')
         # Validate - need at least a name
-        if not result.get('player_name') or len(result['player_name']) < 2:
+        if len(player_name) < 2:
             return None
 
+        result = {'player_name': player_name, 'school': cell('school')}
+
+        has_rounds = not columns.keys().isdisjoint(ROUND_COLUMNS)
+        guess = {}
+        if 'position' not in columns or not has_rounds or 'to_par' not in columns:
+            guess = self._positional_fields(text_values)
+
+        if 'position' in columns:
+            pos_text = cell('position')
+            result['position'] = self._parse_position(pos_text)
+            result['position_display'] = pos_text
+        else:
+            result['position'] = guess['position']
+            result['position_display'] = guess['position_display']
+
+        for key in ROUND_COLUMNS:
+            result[key] = self._parse_round_score(cell(key)) if has_rounds else guess[key]
+
+        # Total from its own column, or the rounds played
+        total = cell('total')
+        scores = [result[key] for key in ROUND_COLUMNS if result[key] is not None]
+        if total.isdigit():
+            result['total'] = int(total)
+        elif scores:
+            result['total'] = sum(scores)
+
+        if 'to_par' in columns:
+            to_par = cell('to_par')
+            if TO_PAR_RE.fullmatch(to_par):
+                result['to_par'] = self._parse_to_par(to_par)
+        elif 'to_par' in guess:
+            result['to_par'] = guess['to_par']
+
         return result
 
+    @staticmethod
+    def _parse_round_score(val: str) -> Optional[int]:
+        """Parse a round score, if the text is a plausible one (55-95)."""
+        # (a regex test instead of int() raising on every non-number)
+        if ROUND_SCORE_RE.fullmatch(val):
+            score = int(val)
+            if 55 <= score <= 95:  # Reasonable golf scores
+                return score
+        return None
+
     def _parse_position(self, pos_text: str) -> Optional[int]:
         """Parse position string to integer."""
         if not pos_text:
@@ -463,73 +677,108 @@ class CollegeGolfTournamentScraper(BaseScraper):
         except ValueError:
             return None
 
-    def _save_player_result(self, session, tournament: Tournament, result: Dict):
-        """Save a single player's result."""
-        player_name = result.get('player_name', '').strip()
-        if not player_name:
+    def _save_results(self, session, tournament: Tournament, results: List[Dict]):
+        """
+        Save a tournament's player results (in the caller's session).
+
+        Existing players and results are loaded with one query each, instead
+        of two queries per result row. New players are written by a single
+        flush, and results by one multi-row INSERT plus one executemany
+        UPDATE.
+        """
+        # Split each name once: (first_name, last_name, school, result)
+        rows = []
+        for result in results:
+            player_name = result.get('player_name', '').strip()
+            if not player_name:
+                continue
+            name_parts = player_name.split(' ', 1)
+            first_name = name_parts[0]
+            last_name = name_parts[1] if len(name_parts) > 1 else ''
+            rows.append((first_name, last_name, result.get('school', ''), result))
+
+        if not rows:
             return
 
-        # Parse name
-        name_parts = player_name.split(' ', 1)
-        first_name = name_parts[0] if name_parts else ''
-        last_name = name_parts[1] if len(name_parts) > 1 else ''
+        # Existing players by exact name
+        # (name_key narrows the candidates; names still have to match exactly)
+        keys = {Player.make_name_key(first, last) for first, last, _, _ in rows}
+        players: Dict[Tuple[str, str], Player] = {}
+        for player in session.query(Player).filter(
+            Player.name_key.in_(keys)
+        ).order_by(Player.player_id):
+            players.setdefault((player.first_name, player.last_name), player)
+
+        # Create missing players, and fill in colleges we didn't have
+        new_players = []
+        for first_name, last_name, school, _ in rows:
+            player = players.get((first_name, last_name))
+            if not player:
+                if not first_name or not last_name:
+                    continue
+                player = Player(
+                    first_name=first_name,
+                    last_name=last_name,
+                    college_name=school if school else None,
+                )
+                players[(first_name, last_name)] = player
+                new_players.append(player)
+            elif school and not player.college_name:
+                # Update college if we have it
+                player.college_name = school
+
+        if new_players:
+            session.add_all(new_players)
+            # One flush writes every new player and gives them their IDs
+            session.flush()
 
-        # Get school
-        school = result.get('school', '')
+        # Existing results for this tournament, by player - one query
+        existing = dict(
+            session.query(TournamentResult.player_id, TournamentResult.result_id)
+            .filter_by(tournament_id=tournament.tournament_id)
+        )
 
-        # Find or create player
-        player = session.query(Player).filter_by(
-            first_name=first_name,
-            last_name=last_name
-        ).first()
+        # Rows to write, keyed by player_id (a player listed twice keeps
+        # their last row, as when each row was saved in turn)
+        to_insert: Dict[int, Dict[str, Any]] = {}
+        to_update: Dict[int, Dict[str, Any]] = {}
 
-        if not player:
-            if not first_name or not last_name:
-                return
-            player = Player(
-                first_name=first_name,
-                last_name=last_name,
-                college_name=school if school else None,
-            )
-            session.add(player)
-            session.flush()
-        elif school and not player.college_name:
-            # Update college if we have it
-            player.college_name = school
-
-        # Check for existing result
-        existing = session.query(TournamentResult).filter_by(
-            tournament_id=tournament.tournament_id,
-            player_id=player.player_id
-        ).first()
-
-        pos = result.get('position')
-        pos_display = result.get('position_display', str(pos) if pos else '')
-
-        if existing:
-            # Update
-            existing.final_position = pos
-            existing.final_position_display = pos_display
-            existing.total_to_par = result.get('to_par')
-            existing.total_score = result.get('total')
-            existing.round_1_score = result.get('round_1')
-            existing.round_2_score = result.get('round_2')
-            existing.round_3_score = result.get('round_3')
-        else:
-            # Create new
-            session.add(TournamentResult(
-                tournament_id=tournament.tournament_id,
-                player_id=player.player_id,
-                final_position=pos,
-                final_position_display=pos_display,
-                total_to_par=result.get('to_par'),
-                total_score=result.get('total'),
-                round_1_score=result.get('round_1'),
-                round_2_score=result.get('round_2'),
-                round_3_score=result.get('round_3'),
-                made_cut=True,  # College golf typically doesn't have cuts
-                status='active',
-            ))
+        for first_name, last_name, _, result in rows:
+            player = players.get((first_name, last_name))
+            if not player:
+                continue
+
+            pos = result.get('position')
+            row = {
+                'final_position': pos,
+                'final_position_display': result.get('position_display', str(pos) if pos else ''),
+                'total_to_par': result.get('to_par'),
+                'total_score': result.get('total'),
+                'round_1_score': result.get('round_1'),
+                'round_2_score': result.get('round_2'),
+                'round_3_score': result.get('round_3'),
+            }
+
+            player_id = player.player_id
+            result_id = existing.get(player_id)
+            if result_id is not None:
+                row['result_id'] = result_id
+                to_update[player_id] = row
+            else:
+                row.update(
+                    tournament_id=tournament.tournament_id,
+                    player_id=player_id,
+                    made_cut=True,  # College golf typically doesn't have cuts
+                    status='active',
+                )
+                to_insert[player_id] = row
+
+        # One multi-row INSERT and one executemany UPDATE (by result_id)
+        # for the whole leaderboard
+        if to_insert:
+            session.execute(insert(TournamentResult), list(to_insert.values()))
+        if to_update:
+            session.execute(update(TournamentResult), list(to_update.values()))
 
 
 def scrape_college_tournaments(year=None, division='NCAA_D1_MENS'):
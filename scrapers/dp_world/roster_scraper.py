@@ -70,7 +70,7 @@ class DPWorldRosterScraper(BaseScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _fetch_players_espn(self) -> Optional[List[Dict]]:
@@ -89,7 +89,7 @@ class DPWorldRosterScraper(BaseScraper):
             for item in data['items']:
                 ref = item.get('$ref', '')
                 if ref:
-                    player_data = self.get_json(ref)
+                    player_data = self.get_json_fast(ref)
                     if player_data:
                         # Get detailed bio data
                         bio_data = self._extract_espn_bio(player_data)
@@ -93,7 +93,7 @@ class EpsonRosterScraper(BaseScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
         for p in players_data:
@@ -109,7 +109,7 @@ class EpsonRosterScraper(BaseScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _fetch_players_selenium(self) -> Optional[List[Dict]]:
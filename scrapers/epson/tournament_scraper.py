@@ -89,7 +89,7 @@ class EpsonTournamentScraper(BaseScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
         for t in tournaments_data:
@@ -105,7 +105,7 @@ class EpsonTournamentScraper(BaseScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _fetch_tournaments_selenium(self, year: int) -> Optional[List[Dict]]:
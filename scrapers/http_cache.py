@@ -0,0 +1,322 @@
+"""
+HTTP Conditional-GET Cache
+==========================
+
+This module stores response bodies together with their ETag / Last-Modified
+validators so scrapers can make "conditional" requests on re-runs.
+
+How it works:
+1. The first time a URL is fetched, the body and validators are saved.
+2. On the next fetch, we send If-None-Match / If-Modified-Since headers.
+3. If the page hasn't changed, the server answers 304 Not Modified with an
+   empty body, and we reuse the stored body instead of downloading it again.
+
+For Junior Developers:
+---------------------
+By default this is NOT a "serve stale data" cache. Every request still
+goes to the server - the server just gets to say "nothing changed" cheaply.
+That keeps daily scrapes fresh while saving most of the bandwidth for pages
+that rarely change (rosters, player bios, Wikipedia articles).
+
+Scrapers whose pages change very slowly (see BaseScraper.cache_max_age)
+can also use stored pages younger than a maximum age without asking the
+server at all, and store pages that have no validators. They can also
+store what they extracted from a page (get_value / set_value), so a
+re-run skips parsing too.
+
+The store is a single SQLite file (Python's built-in sqlite3 module), so
+there is nothing extra to install or run.
+
+Usage:
+    cache = ConditionalCache(Config.HTTP_CACHE_PATH)
+
+    entry = cache.get(url)
+    headers = entry.validators() if entry else {}
+    response = session.get(url, headers=headers)
+    if response.status_code == 304 and entry:
+        html = entry.text
+    else:
+        cache.store(url, response)
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import requests
+from loguru import logger
+
+
+class CachedPage:
+    """
+    A response body previously stored by ConditionalCache.
+
+    Exposes `content` and `text` like a requests.Response, so callers can
+    use either interchangeably when reading the body.
+    """
+
+    __slots__ = ('url', 'content', 'encoding', 'etag', 'last_modified', 'stored_at')
+
+    def __init__(
+        self,
+        url: str,
+        content: bytes,
+        encoding: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: Optional[float] = None
+    ):
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    @property
+    def text(self) -> str:
+        """Decode the stored body with its declared charset (UTF-8 if none)."""
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether this entry was stored less than max_age seconds ago."""
+        return self.stored_at is not None and time.time() - self.stored_at < max_age
+
+    def validators(self) -> Dict[str, str]:
+        """Get the conditional request headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """
+    SQLite-backed store of response bodies keyed by URL.
+
+    By default only responses that carry an ETag or Last-Modified header
+    are stored, since anything else can't be revalidated with a 304.
+
+    The connection is shared between threads and guarded by a lock.
+    """
+
+    def __init__(self, path: Union[str, Path], prune_after: Optional[float] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Location of the SQLite file
+            prune_after: If set, entries older than this many seconds are
+                deleted on open (nothing reads them any more)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                encoding TEXT,
+                content BLOB NOT NULL,
+                stored_at REAL
+            )
+            """
+        )
+
+        # Serialized extraction results (see get_value / set_value)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extracted (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+
+        # Cache files created before stored_at existed: add the column
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(http_cache)')}
+        if 'stored_at' not in columns:
+            self._conn.execute('ALTER TABLE http_cache ADD COLUMN stored_at REAL')
+
+        self._conn.commit()
+
+        if prune_after:
+            self.prune(prune_after)
+
+    def prune(self, max_age: float) -> int:
+        """
+        Delete pages and extraction results stored more than max_age ago.
+
+        Without this the file only ever grows - every player searched or
+        leaderboard fetched stays in it forever.
+
+        Args:
+            max_age: Age in seconds
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = time.time() - max_age
+        try:
+            with self._lock:
+                deleted = self._conn.execute(
+                    'DELETE FROM http_cache WHERE stored_at < ?', (cutoff,)
+                ).rowcount
+                deleted += self._conn.execute(
+                    'DELETE FROM extracted WHERE stored_at < ?', (cutoff,)
+                ).rowcount
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not prune HTTP cache: {e}")
+            return 0
+
+        if deleted:
+            logger.debug(f"Pruned {deleted} old HTTP cache entries")
+        return deleted
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Look up the stored response for a URL.
+
+        Args:
+            url: The full request URL (including query string)
+
+        Returns:
+            CachedPage if we have one, None otherwise
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT etag, last_modified, encoding, content, stored_at '
+                    'FROM http_cache WHERE url = ?',
+                    (url,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            # A broken cache shouldn't break the scrape - just fetch it again
+            logger.warning(f"Could not read cached response for {url}: {e}")
+            return None
+
+        if not row:
+            return None
+
+        etag, last_modified, encoding, content, stored_at = row
+        return CachedPage(url, content, encoding, etag, last_modified, stored_at)
+
+    def store(
+        self,
+        url: str,
+        response: requests.Response,
+        require_validators: bool = True,
+        content: Optional[bytes] = None
+    ) -> bool:
+        """
+        Save a successful response if it can be revalidated later.
+
+        Args:
+            url: The full request URL (including query string)
+            response: The 200 response to store
+            require_validators: If False, also store responses without an
+                ETag / Last-Modified (only useful with a max age)
+            content: The body, if it was streamed (response.content is
+                unavailable once a streamed body has been read)
+
+        Returns:
+            True if the response was stored
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if require_validators and not etag and not last_modified:
+            return False
+
+        # Only keep a charset the server actually declared (not requests' guess)
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset=' in content_type else None
+
+        body = response.content if content is None else content
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO http_cache '
+                    '(url, etag, last_modified, encoding, content, stored_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (url, etag, last_modified, encoding, body, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache response for {url}: {e}")
+            return False
+
+        return True
+
+    def delete(self, url: str) -> None:
+        """
+        Forget the stored response for a URL (e.g. a page that turned out
+        to be an error or CAPTCHA page, which shouldn't be reused).
+
+        Args:
+            url: The full request URL (including query string)
+        """
+        try:
+            with self._lock:
+                self._conn.execute('DELETE FROM http_cache WHERE url = ?', (url,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not remove cached response for {url}: {e}")
+
+    def get_value(self, key: str, max_age: float) -> Optional[bytes]:
+        """
+        Look up a stored extraction result, if it is younger than max_age.
+
+        Args:
+            key: The key it was stored under
+            max_age: Maximum age in seconds
+
+        Returns:
+            The stored bytes, or None if missing or too old
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT value FROM extracted WHERE key = ? AND stored_at > ?',
+                    (key, time.time() - max_age)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read cached value for {key}: {e}")
+            return None
+
+        return row[0] if row else None
+
+    def set_value(self, key: str, value: bytes) -> bool:
+        """
+        Store an extraction result (already serialized to bytes).
+
+        Args:
+            key: Key to store it under - include a version, so entries
+                written by older parsing code aren't read back
+            value: The serialized result
+
+        Returns:
+            True if the value was stored
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO extracted (key, value, stored_at) VALUES (?, ?, ?)',
+                    (key, value, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache value for {key}: {e}")
+            return False
+
+        return True
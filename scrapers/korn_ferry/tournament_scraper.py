@@ -39,7 +39,7 @@ class KornFerryTournamentScraper(BasePGAEcosystemScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
         # Determine in-progress tournaments based on dates
@@ -70,7 +70,7 @@ class KornFerryTournamentScraper(BasePGAEcosystemScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _process_tournament(self, data: Dict, year: int) -> Optional[int]:
@@ -49,7 +49,7 @@ class LPGARosterScraper(BaseScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
         for p in players_data:
@@ -65,7 +65,7 @@ class LPGARosterScraper(BaseScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _fetch_players(self) -> Optional[List[Dict]]:
@@ -84,7 +84,7 @@ class LPGARosterScraper(BaseScraper):
             for item in data['items']:
                 ref = item.get('$ref', '')
                 if ref:
-                    player_data = self.get_json(ref)
+                    player_data = self.get_json_fast(ref)
                     if player_data:
                         # Check if active
                         status = player_data.get('status', {})
@@ -43,7 +43,7 @@ class PGAAmericasRosterScraper(BasePGAEcosystemScraper):
                 'records_processed': 0,
                 'records_created': 0,
                 'records_updated': 0,
-                'errors': self._stats['errors']
+                'errors': list(self._stats['errors'])
             }
 
         for player_data in players_data:
@@ -61,7 +61,7 @@ class PGAAmericasRosterScraper(BasePGAEcosystemScraper):
             'records_processed': self._stats['records_processed'],
             'records_created': self._stats['records_created'],
             'records_updated': self._stats['records_updated'],
-            'errors': self._stats['errors']
+            'errors': list(self._stats['errors'])
         }
 
     def _process_player(self, player_data: Dict[str, Any]):
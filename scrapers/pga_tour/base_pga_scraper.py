@@ -17,7 +17,9 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from abc import abstractmethod
+from functools import lru_cache
 
+import orjson
 from loguru import logger
 
 from scrapers.base_scraper import BaseScraper
@@ -40,6 +42,10 @@ class BasePGAEcosystemScraper(BaseScraper):
     tour_code: str = None
     scrape_type: str = 'roster'
 
+    # The GraphQL API answers small JSON requests, so it is spaced out less
+    # than web pages are (see BaseScraper._rate_limit)
+    host_delays = {'orchestrator.pgatour.com': 0.5}
+
     def __init__(self):
         """Initialize the scraper."""
         config = get_league_config(self.league_code)
@@ -76,12 +82,17 @@ class BasePGAEcosystemScraper(BaseScraper):
 
         Returns:
             Response data dict or None if failed
+
+        Safe to call from worker threads: every request waits its turn for
+        the API host, so concurrent callers don't burst the API.
         """
+        response = None
         try:
             payload = {'query': query}
             if variables:
                 payload['variables'] = variables
 
+            self._rate_limit(self.api_base)
             response = self.session.post(
                 self.api_base,
                 json=payload,
@@ -94,7 +105,8 @@ class BasePGAEcosystemScraper(BaseScraper):
                 return None
 
             response.raise_for_status()
-            data = response.json()
+            # orjson parses the raw bytes directly (much faster than .json())
+            data = orjson.loads(response.content)
 
             if 'errors' in data:
                 self.logger.error(f"GraphQL errors: {data['errors']}")
@@ -106,6 +118,9 @@ class BasePGAEcosystemScraper(BaseScraper):
             self.logger.error(f"GraphQL request failed: {e}")
             return None
 
+        finally:
+            self._mark_request(self.api_base, response)
+
     def fetch_players(self) -> Optional[List[Dict[str, Any]]]:
         """
         Fetch player directory for this tour.
@@ -295,7 +310,11 @@ class BasePGAEcosystemScraper(BaseScraper):
         # Filter out empty entries
         return [p for p in players if p and p.get('player')]
 
-    def _parse_position(self, position_str: str) -> Optional[int]:
+    # Leaderboards repeat the same few position / to-par strings (every
+    # tie, every "E"), so each distinct string is only parsed once
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_position(position_str: str) -> Optional[int]:
         """Parse position string to integer (e.g., 'T4' -> 4)."""
         if not position_str:
             return None
@@ -305,7 +324,9 @@ class BasePGAEcosystemScraper(BaseScraper):
         except (ValueError, TypeError):
             return None
 
-    def _parse_to_par(self, par_str: str) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_to_par(par_str: str) -> Optional[int]:
         """Parse to-par string (e.g., '-16' -> -16, 'E' -> 0)."""
         if not par_str:
             return None